@@ -48,6 +48,190 @@ class ModuleDocFragment(object):
               - Port number for the PowerStore array.
               - If not passed, it will take 443 as default.
           type: int
+      cache_ttl:
+          description:
+              - Time in seconds for which static facts of the array, such as
+                the cluster details and the software version, are cached on
+                the host which runs the module.
+              - The cache is shared by all the tasks, and forks, running
+                against the same array, so that these facts are fetched
+                once per I(cache_ttl) instead of once per task.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_CACHE_TTL) is used.
+              - C(0) disables the cache.
+          type: int
+          default: 0
+          version_added: '3.10.0'
+      cache_dir:
+          description:
+              - Directory of the cache files.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_CACHE_DIR) is used, otherwise
+                C(~/.ansible/cache/dellemc_powerstore).
+          type: path
+          version_added: '3.10.0'
+      broker_socket:
+          description:
+              - Path of the Unix socket of a local connection broker, through
+                which the REST requests of the module are sent.
+              - The broker is a background process, started by the first
+                module which needs it, that keeps one authenticated session
+                per array and user, and keeps its HTTPS connections alive.
+                The modules which follow reuse the session instead of
+                logging in again.
+              - The broker exits after five minutes without any module
+                attached to it.
+              - If the broker cannot be used, the module connects to the
+                array directly.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_BROKER_SOCKET) is used. Otherwise, the
+                broker is not used.
+          type: path
+          version_added: '3.10.0'
+      cache_session:
+          description:
+              - Whether to keep the token and the cookie of the session of the
+                array in the cache of the host which runs the module, in
+                I(cache_dir).
+              - The modules which run against the same array with the same
+                credentials reuse the cached session while it is valid,
+                instead of logging in on every task. Concurrent modules wait
+                for a single login.
+              - If the array rejects the cached session with a C(401)
+                response, or a C(403) response for its token, the module logs
+                in again and replaces it in the cache.
+              - The cache file is only readable by the user which runs the
+                module. Its name is derived from the credentials with a random
+                secret kept in I(cache_dir).
+              - It is not used with a connection broker or a persistent
+                connection, which already reuse their session.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_CACHE_SESSION) is used.
+          type: bool
+          default: false
+          version_added: '3.10.0'
+      max_retries:
+          description:
+              - Maximum number of retries of a REST request which fails with
+                a transient error, such as a C(429), C(502) or C(503)
+                response, a timeout or a reset connection.
+              - The requests which only read are retried on any transient
+                error. The requests which modify the array are only retried
+                if the array rejected them with a C(429) or C(503) response,
+                or if they could not connect to it, so that they are never
+                applied twice.
+              - The retries wait for an exponential backoff with jitter, or
+                for the delay asked by the array.
+              - If any request is retried, the retry counts are returned as
+                C(retries) in the result of the module.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_MAX_RETRIES) is used.
+              - C(0) disables the retries.
+          type: int
+          default: 3
+          version_added: '3.10.0'
+      retry_budget:
+          description:
+              - Maximum number of retries of all the REST requests of the
+                task, after which the requests fail on their first error.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_RETRY_BUDGET) is used.
+          type: int
+          default: 10
+          version_added: '3.10.0'
+      retry_backoff:
+          description:
+              - Base in seconds of the exponential backoff between the
+                attempts of a request. The wait before the retry I(n) is a
+                random time up to I(retry_backoff) * 2^I(n) seconds, and at
+                most 30 seconds.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_RETRY_BACKOFF) is used.
+          type: float
+          default: 1.0
+          version_added: '3.10.0'
+      rate_limit:
+          description:
+              - Maximum number of REST requests per second sent to the array
+                by all the modules running on the host which runs the module.
+              - The limit is shared per I(array_ip) by all the tasks and
+                forks through a token bucket kept in I(cache_dir), so that
+                wide parallelism does not overload the management plane of
+                the array.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_RATE_LIMIT) is used.
+              - C(0) disables the limit.
+          type: float
+          default: 0
+          version_added: '3.10.0'
+      max_in_flight:
+          description:
+              - Maximum number of REST requests in flight to the array from
+                all the modules running on the host which runs the module.
+              - The limit is shared per I(array_ip) by all the tasks and
+                forks through lock files in I(cache_dir).
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_MAX_IN_FLIGHT) is used.
+              - C(0) disables the limit.
+          type: int
+          default: 0
+          version_added: '3.10.0'
+      perf_stats:
+          description:
+              - Whether to return the timing of the task as C(_perf) in the
+                result of the module.
+              - C(_perf) has the total time of the task, the count, time and
+                size of the REST requests, the count and time of the logins,
+                the count, time and size of the requests of every SDK call of
+                the module, such as
+                C(provisioning.get_volume_group_id_by_name), and the count,
+                time, size and status codes of the requests per method and
+                endpoint, such as C(GET /api/rest/volume/{id}).
+              - The responses are requested compressed with gzip or deflate,
+                and the sizes are given both decoded, as C(bytes), and as
+                transferred, as C(wire_bytes).
+              - The time of a request includes its retries, and the login
+                which it triggered, if any.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_PERF_STATS) is used.
+          type: bool
+          default: false
+          version_added: '3.10.0'
+      perf_trace_file:
+          description:
+              - File to which every REST request of the task is appended as
+                a JSON line when the module exits, with its start time,
+                time, method, endpoint, status code, size, SDK call and the
+                process ID of the module.
+              - The file is on the host which runs the module, and may be
+                shared by concurrent tasks.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_PERF_TRACE_FILE) is used.
+          type: path
+          version_added: '3.10.0'
+      http_cache_size:
+          description:
+              - Maximum size in megabytes of the cache of the REST responses
+                of the array, kept in the C(http) subdirectory of
+                I(cache_dir).
+              - The responses of the GET requests which the array sends with
+                an C(ETag) or C(Last-Modified) header are cached. The
+                following requests of the same resources are sent as
+                conditional requests, and the array answers them with an
+                empty C(304) response if the resource did not change, in
+                which case the cached response is used.
+              - The array still authenticates and authorizes every request.
+                The responses are cached per array and user.
+              - The least recently used responses are evicted when the cache
+                is full.
+              - It is not used with a connection broker or a persistent
+                connection.
+              - If not passed, the environment variable
+                C(ANSIBLE_POWERSTORE_HTTP_CACHE_SIZE) is used.
+              - C(0) disables the cache.
+          type: int
+          default: 0
+          version_added: '3.10.0'
     requirements:
       - A Dell PowerStore storage system version 3.6.0.0 or later.
       - PyPowerStore.
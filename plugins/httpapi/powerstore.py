@@ -0,0 +1,117 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+author: Dell Technologies
+name: powerstore
+short_description: HttpApi plugin for Dell PowerStore
+description:
+- This HttpApi plugin provides methods to connect to the REST API of Dell
+  PowerStore storage systems over a persistent connection.
+- The plugin logs in once per play and host, and the modules of the
+  collection send their requests over the authenticated session of the
+  connection instead of logging in on every task.
+- Use it with I(ansible_connection=ansible.netcommon.httpapi) and
+  I(ansible_network_os=dellemc.powerstore.powerstore). The host, port,
+  credentials and certificate validation of the connection are given by
+  I(ansible_host), I(ansible_httpapi_port), I(ansible_user),
+  I(ansible_httpapi_password) and I(ansible_httpapi_validate_certs).
+- The modules still require I(array_ip), I(user) and I(password), which
+  must match the ones of the connection. The modules fail when I(array_ip)
+  or I(port) differ from the host or the port of the connection.
+version_added: '3.10.0'
+'''
+
+import base64
+
+from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible.plugins.httpapi import HttpApiBase
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    .utils import APPLICATION_TYPE
+
+LOGIN_PATH = '/api/rest/login_session'
+LOGOUT_PATH = '/api/rest/logout'
+BASE_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US',
+    'Content-Type': 'application/json',
+    'Application-Type': APPLICATION_TYPE
+}
+
+
+class HttpApi(HttpApiBase):
+
+    def login(self, username, password):
+        """Log in to the array, keeping the token and the cookie of the
+           session as the auth of the connection"""
+        credentials = base64.b64encode(
+            '{0}:{1}'.format(username, password).encode('utf-8'))
+        headers = dict(BASE_HEADERS,
+                       Authorization='Basic ' + credentials.decode('ascii'))
+        response, response_data = self.connection.send(
+            LOGIN_PATH + '?select=id,idle_timeout', None, method='GET',
+            headers=headers)
+        token = response.info().get('DELL-EMC-TOKEN')
+        cookie = self.get_auth_cookie(response)
+        if not token or not cookie:
+            raise ValueError('Failed to log in to the PowerStore array')
+        self.connection._auth = {'DELL-EMC-TOKEN': token,
+                                 'Cookie': 'auth_cookie=' + cookie}
+
+    @staticmethod
+    def get_auth_cookie(response):
+        for header in response.info().get_all('Set-Cookie') or []:
+            name, sep, value = header.split(';', 1)[0].partition('=')
+            if name.strip() == 'auth_cookie':
+                return value.strip()
+        return None
+
+    def logout(self):
+        """End the session of the connection on the array"""
+        if self.connection._auth:
+            self.connection.send(LOGOUT_PATH, None, method='POST',
+                                 headers=BASE_HEADERS)
+            self.connection._auth = None
+
+    def update_auth(self, response, response_text):
+        # The token and the cookie of the session are set once by login
+        return None
+
+    def handle_httperror(self, exc):
+        """Log in again if the session has ended, and hand any other error
+           response over to the module"""
+        if exc.code == 401 and self.connection._auth:
+            self.connection._auth = None
+            self.login(self.connection.get_option('remote_user'),
+                       self.connection.get_option('password'))
+            return True
+        return exc
+
+    def send_request(self, data, path, method='GET', query=None,
+                     headers=None):
+        """
+        Send a REST request of a module over the connection.
+        :param data: Serialized JSON payload of the request, if any
+        :param path: Path of the REST resource, such as /api/rest/volume
+        :param method: HTTP method
+        :param query: Query parameters of the request
+        :param headers: Headers of the request, in addition to the ones of
+                        the session
+        :return: Status code, reason, headers and base64 encoded content of
+                 the response
+        """
+        if query:
+            path = '{0}?{1}'.format(path, urlencode(query, doseq=True))
+        response, response_data = self.connection.send(
+            path, data, method=method,
+            headers=dict(BASE_HEADERS, **(headers or {})))
+        return dict(status_code=response.getcode(),
+                    reason=getattr(response, 'reason', None) or '',
+                    headers=dict(response.info().items()),
+                    content=base64.b64encode(
+                        response_data.getvalue()).decode('ascii'))
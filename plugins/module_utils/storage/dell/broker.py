@@ -0,0 +1,389 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Local connection broker keeping authenticated PowerStore sessions
+   across module runs"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import perf
+
+requests = lazy.LazyModule('requests')
+requests_structures = lazy.LazyModule('requests.structures')
+cookiejar = lazy.LazyModule('http.cookiejar')
+sdk_client = lazy.LazyModule('PyPowerStore.client')
+HAS_REQUESTS = lazy.is_available('requests')
+HAS_Py4PS = lazy.is_available('PyPowerStore')
+
+# Seconds after which a broker without any attached module exits
+IDLE_TIMEOUT = 300
+FRAME_HEADER = struct.Struct('!I')
+
+
+def send_frame(sock, message):
+    """Send a JSON message, prefixed by its length"""
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(FRAME_HEADER.pack(len(data)) + data)
+
+
+def recv_exactly(sock, size):
+    """Receive size bytes, raising EOFError if the peer closes first"""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise EOFError('The connection was closed by the peer')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_frame(sock):
+    """Receive a JSON message sent by send_frame"""
+    size = FRAME_HEADER.unpack(recv_exactly(sock, FRAME_HEADER.size))[0]
+    return json.loads(recv_exactly(sock, size).decode('utf-8'))
+
+
+@contextmanager
+def lock_file(path):
+    """Hold an exclusive lock on path"""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class PooledRequests(object):
+
+    """
+    Stands in for the requests module in the SDK client of the broker, so
+    that the HTTPS connections to the arrays are kept alive between
+    requests.
+    """
+
+    def __init__(self):
+        self.session = requests.Session()
+        # The SDK passes the auth cookie of each session explicitly, so the
+        # cookies must not leak from one session to another.
+        self.session.cookies.set_policy(cookiejar.DefaultCookiePolicy(
+            allowed_domains=[]))
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+class Broker(object):
+
+    """
+    Serves the REST requests of the modules over a Unix socket, through one
+    authenticated SDK client per array and user.
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, client_class=None):
+        """
+        Initialize the broker
+        :param idle_timeout: Seconds without any attached module after which
+                             the broker exits
+        :param client_class: Class of the SDK clients
+        """
+        self.idle_timeout = idle_timeout
+        self.client_class = client_class or sdk_client.Client
+        self.clients = {}
+        self.lock = threading.Lock()
+        self.attached = 0
+        self.last_activity = time.time()
+
+    def get_client(self, details, host):
+        """Get the client of an array and user, creating it if needed"""
+        key = hashlib.sha256(json.dumps(
+            [host, details], sort_keys=True).encode('utf-8')).hexdigest()
+        with self.lock:
+            if key not in self.clients:
+                client = self.client_class(
+                    details['username'], details['password'],
+                    details['verify'], details['application_type'],
+                    timeout=details['timeout'])
+                # Requests of several modules may need to log in at once
+                auth_lock = threading.Lock()
+                get_token_and_cookie = client.auth_manager.get_token_and_cookie
+
+                def locked_get_token_and_cookie():
+                    with auth_lock:
+                        return get_token_and_cookie()
+
+                client.auth_manager.get_token_and_cookie = \
+                    locked_get_token_and_cookie
+                self.clients[key] = client
+            return self.clients[key]
+
+    def serve_request(self, message):
+        """Serve a REST request, returning the reply to be sent"""
+        client = self.get_client(message['details'],
+                                 message['url'].split('/')[2])
+        try:
+            for attempt in range(2):
+                response = client.fetch_response(
+                    message['method'], message['url'],
+                    payload=message['payload'],
+                    querystring=message['querystring'],
+                    myrange=message['myrange'])
+                if response.status_code != 401 or attempt:
+                    break
+                # The session was ended on the array, log in again
+                client.auth_manager.dell_emc_token = None
+        except Exception as e:
+            return dict(error=type(e).__name__, msg=str(e))
+        return dict(status_code=response.status_code,
+                    reason=response.reason,
+                    headers=dict(response.headers),
+                    content=base64.b64encode(response.content).decode(
+                        'ascii'),
+                    wire_size=perf.get_sizes(response)[1])
+
+    def handle(self, sock):
+        """Serve the requests of an attached module until it detaches"""
+        with self.lock:
+            self.attached += 1
+        try:
+            while True:
+                try:
+                    message = recv_frame(sock)
+                except EOFError:
+                    break
+                send_frame(sock, self.serve_request(message))
+        except (OSError, ValueError):
+            pass
+        finally:
+            sock.close()
+            with self.lock:
+                self.attached -= 1
+                self.last_activity = time.time()
+
+    def is_idle(self):
+        """Whether no module has been attached for idle_timeout seconds"""
+        with self.lock:
+            return self.attached == 0 and \
+                time.time() - self.last_activity > self.idle_timeout
+
+    def serve(self, listener):
+        """Accept the modules on listener until the broker is idle"""
+        listener.settimeout(1)
+        while not self.is_idle():
+            try:
+                sock, address = listener.accept()
+            except socket.timeout:
+                continue
+            sock.settimeout(None)
+            with self.lock:
+                self.last_activity = time.time()
+            thread = threading.Thread(target=self.handle, args=(sock,))
+            thread.daemon = True
+            thread.start()
+
+
+def remove_stale_socket(socket_path):
+    """
+    Remove the socket left at socket_path by a broker which has exited.
+    :raises OSError: If the path is not a socket owned by the current user,
+                     which is then left in place
+    """
+    try:
+        path_stat = os.lstat(socket_path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(path_stat.st_mode) or \
+            path_stat.st_uid != os.getuid():
+        raise OSError('{0} is not a socket owned by the current user, so it '
+                      'cannot be replaced by the connection '
+                      'broker'.format(socket_path))
+    os.remove(socket_path)
+
+
+def start_broker(socket_path, idle_timeout=IDLE_TIMEOUT):
+    """
+    Start a broker listening on socket_path, as a daemon detached from the
+    module. The socket is bound before the daemon is forked, so that it
+    accepts connections as soon as this function returns.
+    """
+    remove_stale_socket(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        listener.bind(socket_path)
+    finally:
+        os.umask(umask)
+    listener.listen(16)
+    inode = os.stat(socket_path).st_ino
+
+    pid = os.fork()
+    if pid:
+        listener.close()
+        os.waitpid(pid, 0)
+        return
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        # Ansible reads the output of the module until it is closed
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        sdk_client.requests = PooledRequests()
+        Broker(idle_timeout).serve(listener)
+        listener.close()
+        if os.stat(socket_path).st_ino == inode:
+            os.remove(socket_path)
+    finally:
+        os._exit(0)
+
+
+class RelayedResponse(object):
+
+    """Response of a REST request relayed by the broker or by a persistent
+       connection, with the attributes of requests.Response used by the
+       SDK"""
+
+    def __init__(self, reply):
+        self.status_code = reply['status_code']
+        self.reason = reply['reason']
+        self.headers = requests_structures.CaseInsensitiveDict(
+            reply['headers'])
+        self.content = base64.b64decode(reply['content'])
+        # Size of the body as transferred by the array, if known
+        self.wire_size = reply.get('wire_size')
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class BrokerConnection(object):
+
+    """
+    Sends the REST requests of a PyPowerStore client to the broker, over one
+    Unix socket connection per thread.
+    """
+
+    def __init__(self, socket_path, details):
+        """
+        Initialize the connection
+        :param socket_path: Path of the Unix socket of the broker
+        :param details: Credentials and settings of the client
+        """
+        self.socket_path = socket_path
+        self.details = details
+        self._local = threading.local()
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def get_socket(self):
+        """Get the socket of the current thread, starting the broker if it
+           is not running"""
+        sock = getattr(self._local, 'sock', None)
+        if sock is None:
+            try:
+                sock = self.connect()
+            except OSError:
+                with lock_file(self.socket_path + '.lock'):
+                    try:
+                        sock = self.connect()
+                    except OSError:
+                        start_broker(self.socket_path)
+                        sock = self.connect()
+            self._local.sock = sock
+        return sock
+
+    def close(self):
+        """Close the socket of the current thread"""
+        sock = getattr(self._local, 'sock', None)
+        if sock is not None:
+            self._local.sock = None
+            sock.close()
+
+    def fetch_response(self, http_method, url, payload=None,
+                       querystring=None, myrange=None):
+        """Fetch the response of a request through the broker, in place of
+           Client.fetch_response"""
+        sock = self.get_socket()
+        try:
+            send_frame(sock, dict(details=self.details, method=http_method,
+                                  url=url, payload=payload,
+                                  querystring=querystring, myrange=myrange))
+            reply = recv_frame(sock)
+        except (OSError, EOFError, ValueError) as e:
+            self._local.sock = None
+            sock.close()
+            raise requests.exceptions.ConnectionError(
+                'The connection broker failed with error {0}'.format(str(e)))
+        if 'error' in reply:
+            error = getattr(requests.exceptions, reply['error'], None)
+            if not (isinstance(error, type) and
+                    issubclass(error, requests.exceptions.RequestException)):
+                error = requests.exceptions.RequestException
+            raise error(reply['msg'])
+        return RelayedResponse(reply)
+
+
+def attach(client, socket_path):
+    """
+    Route the REST requests of a PyPowerStore client through the broker
+    listening on socket_path, starting it if needed.
+    :return: Whether the client is attached, the client being left as is if
+             the broker cannot be used
+    """
+    if not (HAS_FCNTL and HAS_REQUESTS and HAS_Py4PS and
+            hasattr(socket, 'AF_UNIX')):
+        return False
+    socket_path = os.path.expanduser(socket_path)
+    socket_dir = os.path.dirname(socket_path)
+    connection = BrokerConnection(socket_path, dict(
+        username=client.username, password=client.password,
+        verify=client.verify, timeout=client.timeout,
+        application_type=client.application_type))
+    try:
+        if socket_dir and not os.path.isdir(socket_dir):
+            os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        connection.get_socket()
+    except OSError:
+        return False
+    client.fetch_response = connection.fetch_response
+    return True
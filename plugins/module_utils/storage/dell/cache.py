@@ -0,0 +1,162 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""File backed cache shared by the PowerStore modules running on a host"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+DEFAULT_CACHE_DIR = '~/.ansible/cache/dellemc_powerstore'
+
+
+class FileCache(object):
+
+    """
+    JSON file backed key value cache whose entries expire after a time to
+    live. Every entry is kept in its own file, and is read and written under
+    an exclusive lock so that it can be shared by concurrent module
+    processes.
+    """
+
+    def __init__(self, cache_dir, ttl):
+        """
+        Initialize the cache
+        :param cache_dir: Directory of the cache files
+        :param ttl: Time to live of the entries in seconds
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+
+    def path(self, key):
+        """Get the path of the file of an entry"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + '.json')
+
+    @contextmanager
+    def lock(self, key):
+        """Hold the exclusive lock of an entry"""
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        fd = os.open(self.path(key) + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def read(self, key):
+        """Read an entry, returning None if it is missing or expired"""
+        try:
+            with open(self.path(key), 'r') as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('expires', 0) < time.time():
+            return None
+        return entry
+
+    def write(self, key, value):
+        """Write an entry, replacing the previous one atomically"""
+        path = self.path(key)
+        tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as entry_file:
+            json.dump({'expires': time.time() + self.ttl, 'value': value},
+                      entry_file)
+        os.replace(tmp_path, path)
+
+    def remove(self, key):
+        """Remove the file of an entry, if any"""
+        if os.path.exists(self.path(key)):
+            os.remove(self.path(key))
+
+    def get(self, key):
+        """Get the value of an entry, or None"""
+        with self.lock(key):
+            entry = self.read(key)
+        return entry['value'] if entry else None
+
+    def set(self, key, value):
+        """Set the value of an entry"""
+        with self.lock(key):
+            self.write(key, value)
+
+    def delete(self, key):
+        """Delete an entry"""
+        with self.lock(key):
+            self.remove(key)
+
+    def get_or_set(self, key, func):
+        """
+        Get the value of an entry, calling func to set it if it is missing
+        or expired. The lock is held while func is called, so that
+        concurrent processes do not call it for the same entry.
+        """
+        with self.lock(key):
+            entry = self.read(key)
+            if entry:
+                return entry['value']
+            value = func()
+            if value is not None:
+                try:
+                    self.write(key, value)
+                except OSError:
+                    pass
+            return value
+
+
+def get_cache(module_params):
+    """Get the cache configured by the module parameters, or None if
+    caching is disabled"""
+    ttl = module_params.get('cache_ttl')
+    if not isinstance(ttl, int) or ttl <= 0:
+        return None
+    return FileCache(module_params.get('cache_dir') or DEFAULT_CACHE_DIR, ttl)
+
+
+def get_cache_key(module_params, name):
+    """Get the key of an entry of the array and the user of the module
+    parameters, as the users of an array may not see the same resources"""
+    return '{0}:{1}:{2}:{3}'.format(module_params['array_ip'],
+                                    module_params.get('port') or 443,
+                                    module_params['user'], name)
+
+
+def cached_call(module_params, name, func):
+    """
+    Call func, caching its result per array for cache_ttl seconds. If the
+    cache cannot be used, func is called directly.
+    """
+    cache = get_cache(module_params)
+    if cache is None:
+        return func()
+
+    called = []
+
+    def call():
+        called.append(True)
+        return func()
+
+    try:
+        return cache.get_or_set(get_cache_key(module_params, name), call)
+    except OSError:
+        if called:
+            raise
+        return func()
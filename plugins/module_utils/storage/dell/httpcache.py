@@ -0,0 +1,234 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Conditional GET cache of the REST responses of PowerStore, validated by
+   their ETag or Last-Modified headers"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import contextvars
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
+
+requests = lazy.LazyModule('requests')
+requests_structures = lazy.LazyModule('requests.structures')
+sdk_client = lazy.LazyModule('PyPowerStore.client')
+HAS_Py4PS = lazy.is_available('PyPowerStore', 'requests')
+
+# Status codes of the responses which may be cached
+CACHED_CODES = (200, 206)
+# Headers of the requests which select the representation of a resource
+VARY_HEADERS = ('Range', 'DELL-VISIBILITY', 'Accept')
+# Headers of the responses which are not kept in the cache
+PRIVATE_HEADERS = ('set-cookie', 'dell-emc-token')
+MEGABYTE = 1024 * 1024
+# User of the SDK client sending the current request, as the users of an
+# array may not be allowed to see the same responses
+CLIENT_USER = contextvars.ContextVar('httpcache_client_user', default=None)
+
+
+@contextmanager
+def as_user(user):
+    """Send the requests of the context as the given user"""
+    token = CLIENT_USER.set(user)
+    try:
+        yield
+    finally:
+        CLIENT_USER.reset(token)
+
+
+class ResponseCache(object):
+
+    """
+    Directory of cached responses, one file per request, whose total size
+    is bounded by evicting the least recently used responses. The files are
+    replaced atomically, so that they can be read without a lock.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        """
+        Initialize the response cache
+        :param cache_dir: Directory of the cached responses
+        :param max_size: Maximum total size of the cached responses in bytes
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.max_size = max_size
+
+    def path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest + '.json')
+
+    def read(self, key):
+        """Read a cached response, marking it as recently used"""
+        path = self.path(key)
+        try:
+            with open(path, 'r') as entry_file:
+                entry = json.load(entry_file)
+            os.utime(path, None)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def write(self, key, entry):
+        """Write a cached response, evicting the least recently used ones if
+           the cache is full"""
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        path = self.path(key)
+        tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as entry_file:
+            json.dump(entry, entry_file)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used responses beyond max_size. If
+           another process is evicting, it is left to do it."""
+        fd = os.open(os.path.join(self.cache_dir, '.lock'),
+                     os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if HAS_FCNTL:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except (IOError, OSError):
+                    return
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.json'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+            total = sum(size for mtime, size, name in entries)
+            for mtime, size, name in sorted(entries):
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+                total -= size
+        finally:
+            os.close(fd)
+
+
+class ConditionalRequests(object):
+
+    """
+    Stands in for the requests module in the SDK client, so that the GET
+    requests of resources which the array has sent with a validator are
+    sent as conditional requests, and their 304 responses are served from
+    the cache. The array still authenticates and authorizes every request.
+    The responses are cached per user, and the requests of the clients which
+    are not attached are not cached.
+    """
+
+    def __init__(self, response_cache, requests_module=None):
+        self.cache = response_cache
+        self.requests = requests_module or requests
+        self.hits = 0
+
+    @staticmethod
+    def get_key(url, params, headers, user):
+        return json.dumps([url, user, sorted((params or {}).items()),
+                           [headers.get(name) for name in VARY_HEADERS]],
+                          default=str)
+
+    def request(self, method, url, **kwargs):
+        headers = requests_structures.CaseInsensitiveDict(
+            kwargs.get('headers') or {})
+        user = CLIENT_USER.get()
+        if method.upper() != 'GET' or 'Authorization' in headers or \
+                user is None:
+            return self.requests.request(method, url, **kwargs)
+
+        key = self.get_key(url, kwargs.get('params'), headers, user)
+        entry = self.cache.read(key)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            kwargs['headers'] = dict(headers)
+        response = self.requests.request(method, url, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.hits += 1
+            return self.get_response(entry, url)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code in CACHED_CODES and (etag or last_modified):
+            try:
+                self.cache.write(key, dict(
+                    etag=etag, last_modified=last_modified,
+                    status_code=response.status_code,
+                    reason=response.reason,
+                    headers=dict((name, value) for name, value in
+                                 response.headers.items()
+                                 if name.lower() not in PRIVATE_HEADERS),
+                    content=base64.b64encode(response.content).decode(
+                        'ascii')))
+            except (OSError, TypeError, ValueError):
+                pass
+        return response
+
+    @staticmethod
+    def get_response(entry, url):
+        """Build the response of a request from its cached response"""
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response.reason = entry['reason']
+        response.headers = requests_structures.CaseInsensitiveDict(
+            entry['headers'])
+        response._content = base64.b64decode(entry['content'])
+        response.url = url
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.requests, name)
+
+
+def attach(client, module_params):
+    """
+    Send the GET requests of the SDK client of the module as conditional
+    requests, if the response cache is enabled by the module parameters.
+    The SDK clients of a process share the requests module, so the cache is
+    installed once per process, and the client is marked with its user.
+    :return: Whether the response cache is used
+    """
+    max_size = module_params.get('http_cache_size') or 0
+    if not HAS_Py4PS or max_size <= 0:
+        return False
+    if not isinstance(sdk_client.requests, ConditionalRequests):
+        cache_dir = os.path.join(
+            module_params.get('cache_dir') or cache.DEFAULT_CACHE_DIR, 'http')
+        sdk_client.requests = ConditionalRequests(
+            ResponseCache(cache_dir, max_size * MEGABYTE),
+            sdk_client.requests)
+    fetch_response = client.fetch_response
+
+    def fetch_response_as_user(*args, **kwargs):
+        with as_user(client.username):
+            return fetch_response(*args, **kwargs)
+    client.fetch_response = fetch_response_as_user
+    return True
@@ -0,0 +1,49 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Deferred imports of the heavy dependencies of the PowerStore modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import importlib
+from importlib.util import find_spec
+
+
+def is_available(*names):
+    """Whether the top level packages can be imported, without importing
+       them"""
+    try:
+        return all(find_spec(name) is not None for name in names)
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule(object):
+
+    """
+    Stands in for a module which is imported on the first access to one of
+    its attributes, so that the modules which do not use it, or exit before
+    using it, do not pay for its import.
+    """
+
+    def __init__(self, name):
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_module', None)
+
+    def _load(self):
+        if self._module is None:
+            object.__setattr__(self, '_module',
+                               importlib.import_module(self._name))
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        return '<lazy module {0!r}>'.format(self._name)
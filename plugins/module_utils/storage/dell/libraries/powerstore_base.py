@@ -56,7 +56,7 @@ class PowerStoreBase:
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
 
         self.configuration = self.conn.config_mgmt
         self.protection = self.conn.protection
@@ -0,0 +1,135 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Page by page access to the listings of the PowerStore REST API"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+
+# Offset of the second page and size of the subsequent pages, as requested
+# by the PyPowerStore client when all_pages is set, are OFFSET and MAX_LIMIT
+sdk_constants = lazy.LazyModule('PyPowerStore.utils.constants')
+
+
+class PageRouter(object):
+
+    """
+    Routes the listing requests made through a PyPowerStore client to a page
+    consumer, so that the listing can be processed page by page instead of
+    being accumulated in memory. The pages after the first one can be
+    fetched concurrently.
+    """
+
+    def __init__(self, client, max_workers=1):
+        """
+        Initialize the page router and attach it to the client
+        :param client: The PyPowerStore client shared by the SDK objects
+        :param max_workers: Maximum number of pages of a listing to be
+                            fetched concurrently
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers or 1)
+        self._request = client.request
+        self._local = threading.local()
+        client.request = self.request
+
+    @contextmanager
+    def pages_to(self, consumer):
+        """
+        Route the listing requests of the current thread to consumer, which
+        is called with every page of the listing as it arrives.
+        :param consumer: Callable taking a list of entities
+        """
+        previous = getattr(self._local, 'consumer', None)
+        self._local.consumer = consumer
+        try:
+            yield
+        finally:
+            self._local.consumer = previous
+
+    def request(self, http_method, url, payload=None, querystring=None,
+                all_pages=None):
+        """
+        Serve a request of the client. The GET requests made by the SDK list
+        functions, which always pass all_pages, are routed to the consumer
+        of the current thread, if any. Without a consumer, they are still
+        served by the router when their pages can be fetched concurrently.
+        Every other request is served by the client.
+        """
+        consumer = getattr(self._local, 'consumer', None)
+        if http_method != 'GET' or all_pages is None or (
+                consumer is None and not (all_pages and
+                                          self.max_workers > 1)):
+            return self._request(http_method, url, payload=payload,
+                                 querystring=querystring, all_pages=all_pages)
+        if consumer is None:
+            entities = []
+            for page in self.iter_pages(url, querystring=querystring,
+                                        all_pages=all_pages):
+                entities.extend(page)
+            return entities
+        for page in self.iter_pages(url, querystring=querystring,
+                                    all_pages=all_pages):
+            consumer(page)
+        return []
+
+    def iter_pages(self, url, querystring=None, all_pages=False):
+        """
+        Fetch the pages of a listing in order. The first page gives the
+        size of the listing, and the following pages are then fetched with
+        up to max_workers concurrent requests.
+        :param url: URL of the listing
+        :param querystring: Query of the listing
+        :param all_pages: Whether to fetch the pages after the first one
+        :return: Generator of the pages, each one a list of entities
+        """
+        response = self.fetch_page(url, querystring)
+        yield response.json() or []
+
+        content_range = response.headers.get('content-range')
+        if not (all_pages and response.status_code == 206 and content_range):
+            return
+        total_size = self.client.get_total_size_from_content_range(
+            content_range)
+        page_limit = sdk_constants.MAX_LIMIT
+        page_ranges = ['{0}-{1}'.format(offset, offset + page_limit)
+                       for offset in range(sdk_constants.OFFSET, total_size,
+                                           page_limit)]
+        if self.max_workers == 1 or len(page_ranges) < 2:
+            for page_range in page_ranges:
+                yield self.fetch_page(url, querystring, page_range).json()
+            return
+
+        # Keep at most max_workers pages in flight, and hand them over in
+        # the order of their ranges.
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(page_ranges)))
+        try:
+            pending = deque()
+            for page_range in page_ranges:
+                if len(pending) == self.max_workers:
+                    yield pending.popleft().result().json()
+                pending.append(executor.submit(
+                    self.fetch_page, url, querystring, page_range))
+            while pending:
+                yield pending.popleft().result().json()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_page(self, url, querystring=None, page_range=None):
+        """Fetch a page of a listing, raising PowerStoreException on error"""
+        response = self.client.fetch_response(
+            'GET', url, querystring=querystring, myrange=page_range)
+        if not self.client.is_valid_response(response):
+            self.client.raise_http_exception(response)
+        return response
@@ -0,0 +1,234 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Timing of the SDK calls and REST requests of the PowerStore modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Digits kept in the reported times, in seconds
+PRECISION = 4
+
+
+def get_endpoint(url):
+    """
+    Get the template of the endpoint of a request, such as
+    /api/rest/volume/{id}/snapshot, from its URL
+    https://<array_ip>:<port>/api/rest/volume/<id>/snapshot?<query>
+    """
+    path = '/' + url.split('/', 3)[3].split('?', 1)[0]
+    parts = path.split('/')
+    # /api/rest/<resource>/<id>/<action>
+    if len(parts) > 4 and parts[4]:
+        parts[4] = '{id}'
+    return '/'.join(parts)
+
+
+def get_sizes(response):
+    """
+    Get the size in bytes of the decoded body of a response, and the size
+    of the body transferred over the network, which is smaller if the
+    array compressed it
+    """
+    content = getattr(response, 'content', None)
+    size = len(content) if isinstance(content, bytes) else 0
+    wire_size = getattr(response, 'wire_size', None)
+    if wire_size is None:
+        try:
+            wire_size = response.raw.tell()
+        except (AttributeError, TypeError, ValueError):
+            pass
+    if not isinstance(wire_size, int):
+        try:
+            encoding = response.headers.get('Content-Encoding') or 'identity'
+            wire_size = int(response.headers['Content-Length']) \
+                if encoding != 'identity' else size
+        except (AttributeError, KeyError, TypeError, ValueError):
+            wire_size = size
+    return size, wire_size
+
+
+class PerfRecorder(object):
+
+    """
+    Records the method, endpoint, status, size and time of the REST requests
+    of a PyPowerStore connection, along with the SDK call of the module
+    which sent them, so that the time of a task can be broken down into
+    its logins, lookups and writes.
+    """
+
+    def __init__(self, trace_file=None):
+        """
+        Initialize the recorder
+        :param trace_file: File to which every request is appended as a
+                           JSON line, if any
+        """
+        self.trace_file = trace_file
+        self.start = time.time()
+        self.requests = []
+        self.calls = {}
+        self.logins = []
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    def get_call(self):
+        """Get the SDK call of the module running on the current thread"""
+        return getattr(self._local, 'call', None)
+
+    def wrap_call(self, name, func):
+        """Wrap an SDK method so that its requests are attributed to it.
+           The SDK methods called by another one are not recorded."""
+        def timed_call(*args, **kwargs):
+            if self.get_call() is not None:
+                return func(*args, **kwargs)
+            self._local.call = name
+            start = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.call = None
+                elapsed = time.time() - start
+                with self.lock:
+                    count, total = self.calls.get(name, (0, 0))
+                    self.calls[name] = (count + 1, total + elapsed)
+        return timed_call
+
+    def wrap_login(self, login):
+        def timed_login():
+            start = time.time()
+            try:
+                return login()
+            finally:
+                with self.lock:
+                    self.logins.append(time.time() - start)
+        return timed_login
+
+    def wrap_fetch_response(self, fetch_response):
+        """Wrap the fetch_response method of a client to record its
+           requests"""
+        def timed_fetch_response(http_method, url, payload=None,
+                                 querystring=None, myrange=None):
+            start = time.time()
+            response = None
+            try:
+                response = fetch_response(
+                    http_method, url, payload=payload,
+                    querystring=querystring, myrange=myrange)
+                return response
+            finally:
+                size, wire_size = get_sizes(response) \
+                    if response is not None else (0, 0)
+                record = dict(
+                    start=start, time=time.time() - start,
+                    method=http_method, endpoint=get_endpoint(url),
+                    status=getattr(response, 'status_code', None),
+                    bytes=size, wire_bytes=wire_size, call=self.get_call())
+                with self.lock:
+                    self.requests.append(record)
+        return timed_fetch_response
+
+    def attach(self, conn):
+        """Record the SDK calls and REST requests of a connection"""
+        client = conn.provisioning.client
+        client.fetch_response = self.wrap_fetch_response(client.fetch_response)
+        client.auth_manager.login = self.wrap_login(client.auth_manager.login)
+        for attr, sdk_object in list(vars(conn).items()):
+            if not hasattr(sdk_object, '__dict__'):
+                continue
+            for name in dir(type(sdk_object)):
+                func = getattr(sdk_object, name, None)
+                if name.startswith('_') or not callable(func):
+                    continue
+                setattr(sdk_object, name, self.wrap_call(
+                    '{0}.{1}'.format(attr, name), func))
+
+    def get_stats(self):
+        """Get the totals reported in the result of the module"""
+        with self.lock:
+            requests = list(self.requests)
+            calls = dict(self.calls)
+            logins = list(self.logins)
+        calls = dict((name, dict(count=count, time=round(total, PRECISION),
+                                 bytes=0, wire_bytes=0))
+                     for name, (count, total) in calls.items())
+        endpoints = {}
+        for record in requests:
+            key = '{0} {1}'.format(record['method'], record['endpoint'])
+            stats = endpoints.setdefault(key, dict(count=0, time=0, bytes=0,
+                                                   wire_bytes=0, statuses={}))
+            stats['count'] += 1
+            stats['time'] += record['time']
+            status = str(record['status'])
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+            for stats in (stats, calls.get(record['call'])):
+                if stats is not None:
+                    stats['bytes'] += record['bytes']
+                    stats['wire_bytes'] += record['wire_bytes']
+        for stats in endpoints.values():
+            stats['time'] = round(stats['time'], PRECISION)
+        return dict(
+            total_time=round(time.time() - self.start, PRECISION),
+            request_count=len(requests),
+            request_time=round(sum(record['time'] for record in requests),
+                               PRECISION),
+            bytes=sum(record['bytes'] for record in requests),
+            wire_bytes=sum(record['wire_bytes'] for record in requests),
+            login_count=len(logins),
+            login_time=round(sum(logins), PRECISION),
+            calls=calls, endpoints=endpoints)
+
+    def write_trace(self):
+        """Append the recorded requests to the trace file, once"""
+        with self.lock:
+            requests, self.requests = self.requests, []
+        if not self.trace_file or not requests:
+            return
+        pid = os.getpid()
+        data = ''.join(json.dumps(dict(record, pid=pid)) + '\n'
+                       for record in requests)
+        try:
+            with open(os.path.expanduser(self.trace_file), 'a') as trace:
+                if HAS_FCNTL:
+                    fcntl.flock(trace, fcntl.LOCK_EX)
+                trace.write(data)
+        except (IOError, OSError):
+            pass
+
+
+def attach(conn, module_params):
+    """
+    Record the SDK calls and REST requests of a connection, if enabled by
+    the module parameters.
+    :return: The recorder, or None
+    """
+    if not (module_params.get('perf_stats') or
+            module_params.get('perf_trace_file')):
+        return None
+    recorder = PerfRecorder(module_params.get('perf_trace_file'))
+    recorder.attach(conn)
+    return recorder
+
+
+def report(module, recorder, module_params):
+    """Add the totals to the result of the module as _perf, and write the
+       trace file, when the module exits"""
+    for name in ('exit_json', 'fail_json'):
+        def exit_with_perf(_exit=getattr(module, name), **kwargs):
+            if module_params.get('perf_stats'):
+                kwargs['_perf'] = recorder.get_stats()
+            recorder.write_trace()
+            return _exit(**kwargs)
+        setattr(module, name, exit_with_perf)
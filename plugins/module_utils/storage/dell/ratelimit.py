@@ -0,0 +1,146 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Limit of the rate and concurrency of the REST requests sent to an array
+   by all the PowerStore modules running on a host"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
+
+# Longest wait in seconds between two checks for a free in-flight slot
+MAX_POLL_INTERVAL = 0.5
+
+
+class RateLimiter(object):
+
+    """
+    Token bucket, shared through a file by the module processes, which
+    limits the rate of the requests sent to an array, along with a set of
+    locked slot files which limits the requests in flight. The locks are
+    released by the system if a module process dies.
+    """
+
+    def __init__(self, lock_dir, name, rate=0, max_in_flight=0):
+        """
+        Initialize the rate limiter
+        :param lock_dir: Directory of the state and lock files
+        :param name: Name of the array whose requests are limited
+        :param rate: Maximum number of requests per second, or 0
+        :param max_in_flight: Maximum number of requests in flight, or 0
+        """
+        self.lock_dir = os.path.expanduser(lock_dir)
+        self.prefix = os.path.join(self.lock_dir, 'ratelimit-' + hashlib.sha256(
+            name.encode('utf-8')).hexdigest())
+        self.rate = rate
+        self.burst = max(rate, 1)
+        self.max_in_flight = max_in_flight
+
+    def open(self, path):
+        if not os.path.isdir(self.lock_dir):
+            os.makedirs(self.lock_dir, mode=0o700, exist_ok=True)
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def reserve(self):
+        """
+        Take a token out of the bucket, returning the seconds to wait before
+        sending the request. The bucket may go below zero, so that the
+        waiting requests are sent in the order of their reservations.
+        """
+        fd = self.open(self.prefix + '.json')
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = time.time()
+            try:
+                state = json.loads(os.pread(fd, 4096, 0).decode('utf-8'))
+                tokens = min(self.burst, state['tokens'] +
+                             (now - state['updated']) * self.rate)
+            except (ValueError, KeyError, TypeError):
+                tokens = self.burst
+            tokens -= 1
+            data = json.dumps(dict(tokens=tokens, updated=now)).encode('utf-8')
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, data, 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        return max(-tokens / self.rate, 0)
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the max_in_flight slots until the request is done"""
+        interval = 0.01
+        while True:
+            for index in range(self.max_in_flight):
+                fd = self.open('{0}.slot{1}'.format(self.prefix, index))
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except (IOError, OSError):
+                    os.close(fd)
+                    continue
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                    os.close(fd)
+                return
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    @contextmanager
+    def limit(self):
+        """Wait until a request may be sent, and hold its in-flight slot"""
+        if self.rate > 0:
+            time.sleep(self.reserve())
+        if self.max_in_flight > 0:
+            with self.slot():
+                yield
+        else:
+            yield
+
+    def wrap(self, fetch_response):
+        """Wrap the fetch_response method of a client with the limits"""
+        def limited_fetch_response(http_method, url, payload=None,
+                                   querystring=None, myrange=None):
+            with self.limit():
+                return fetch_response(
+                    http_method, url, payload=payload,
+                    querystring=querystring, myrange=myrange)
+        return limited_fetch_response
+
+
+def attach(client, module_params):
+    """
+    Limit the requests of a PyPowerStore client to the array of the module
+    parameters as configured by them.
+    :return: Whether the requests are limited
+    """
+    rate = module_params.get('rate_limit') or 0
+    max_in_flight = module_params.get('max_in_flight') or 0
+    if not HAS_FCNTL or (rate <= 0 and max_in_flight <= 0):
+        return False
+    limiter = RateLimiter(
+        module_params.get('cache_dir') or cache.DEFAULT_CACHE_DIR,
+        module_params['array_ip'], max(rate, 0), max(max_in_flight, 0))
+    try:
+        os.close(limiter.open(limiter.prefix + '.json'))
+    except OSError:
+        return False
+    client.fetch_response = limiter.wrap(client.fetch_response)
+    return True
@@ -0,0 +1,250 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Resolution of the names of PowerStore resources to their IDs, shared by
+   the PowerStore modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import threading
+import weakref
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import utils
+
+# REST resource and fixed filters of the listing of every resource type
+RESOURCES = {
+    'appliance': ('appliance', {}),
+    'filesystem': ('file_system', {}),
+    'host': ('host', {}),
+    'host_group': ('host_group', {}),
+    'nas_server': ('nas_server', {}),
+    'protection_policy': ('policy', {'type': 'eq.Protection'}),
+    'qos_policy': ('policy', {'type': 'eq.QoS'}),
+    'remote_system': ('remote_system', {}),
+    'replication_rule': ('replication_rule', {}),
+    'snapshot_rule': ('snapshot_rule', {}),
+    'volume': ('volume', {}),
+    'volume_group': ('volume_group', {}),
+}
+
+# Lookups of a single name through the SDK, which return the same details
+# as the modules got before the resolver was shared
+SDK_LOOKUPS = {
+    'appliance': lambda conn, name, scope:
+        conn.config_mgmt.get_appliance_by_name(name),
+    'filesystem': lambda conn, name, scope:
+        conn.provisioning.get_filesystem_by_name(
+            filesystem_name=name, nas_server_id=scope['nas_server_id']),
+    'host': lambda conn, name, scope:
+        conn.provisioning.get_host_by_name(name),
+    'host_group': lambda conn, name, scope:
+        conn.provisioning.get_host_group_by_name(name),
+    'nas_server': lambda conn, name, scope:
+        conn.provisioning.get_nas_server_by_name(nas_server_name=name),
+    'protection_policy': lambda conn, name, scope:
+        conn.protection.get_protection_policy_by_name(name),
+    'qos_policy': lambda conn, name, scope:
+        conn.protection.get_policy_by_name(name, policy_type='QoS'),
+    'remote_system': lambda conn, name, scope:
+        conn.protection.get_remote_system_by_name(name=name),
+    'volume': lambda conn, name, scope:
+        conn.provisioning.get_volume_by_name(name),
+    'volume_group': lambda conn, name, scope:
+        conn.provisioning.get_volume_group_by_name(name),
+}
+
+# Resource types which the modules do not create or delete while resolving
+# them, so that their IDs can be cached across tasks for cache_ttl seconds
+SHARED_TYPES = ('appliance', 'nas_server', 'protection_policy', 'qos_policy',
+                'remote_system', 'replication_rule', 'snapshot_rule')
+
+# Maximum number of values in one in.() filter, which keeps the URL short
+MAX_BATCH = 50
+
+_RESOLVERS = weakref.WeakKeyDictionary()
+_RESOLVERS_LOCK = threading.Lock()
+
+
+def format_in(values):
+    """Format the values of an in.() filter, quoting those with reserved
+       characters"""
+    quoted = []
+    for value in values:
+        value = str(value)
+        if any(char in value for char in ',()"\\ '):
+            value = '"{0}"'.format(
+                value.replace('\\', '\\\\').replace('"', '\\"'))
+        quoted.append(value)
+    return 'in.({0})'.format(','.join(quoted))
+
+
+class NameResolver(object):
+
+    """
+    Resolves the names of PowerStore resources of any type to their IDs.
+    The lookups are memoized for the lifetime of the resolver, and the names
+    which are not known yet are looked up together with in.() filters, a
+    single name being looked up through the SDK. The IDs of the shared
+    resource types are also cached across tasks if the cache is enabled.
+    """
+
+    def __init__(self, conn, module_params=None):
+        """
+        Initialize the resolver
+        :param conn: The PyPowerStore connection to the array
+        :param module_params: The module parameters configuring the cache
+        """
+        self.conn = conn
+        self.module_params = module_params or {}
+        self.entities = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_scope_key(scope):
+        return json.dumps(sorted(scope.items()), default=str)
+
+    def get_cache(self, resource_type):
+        if resource_type not in SHARED_TYPES or \
+                not self.module_params.get('array_ip'):
+            return None
+        return cache.get_cache(self.module_params)
+
+    def get_cache_key(self, resource_type, scope_key, name):
+        return cache.get_cache_key(self.module_params, 'name:{0}:{1}:{2}'.format(
+            resource_type, scope_key, name))
+
+    def list_entities(self, resource_type, field, values, scope):
+        """List the entities whose field is one of values with in.()
+           filters"""
+        resource, filters = RESOURCES[resource_type]
+        provisioning = self.conn.provisioning
+        url = 'https://{0}/api/rest/{1}'.format(provisioning.server_ip,
+                                                resource)
+        entities = []
+        for index in range(0, len(values), MAX_BATCH):
+            querystring = dict(filters, select='id,name')
+            querystring.update((key, 'eq.{0}'.format(value))
+                               for key, value in scope.items())
+            querystring[field] = format_in(values[index:index + MAX_BATCH])
+            entities.extend(provisioning.client.request(
+                'GET', url, querystring=querystring, all_pages=True) or [])
+        return entities
+
+    def find(self, resource_type, names, **scope):
+        """
+        Find the resources of a type by name.
+        :param resource_type: One of RESOURCES
+        :param names: The names of the resources
+        :param scope: Filters of the resources which are only unique within
+                      a parent, such as nas_server_id for filesystems
+        :return: Dict of the entities of every name, which have at least an
+                 id and a name, and which are empty for unknown names
+        """
+        if resource_type not in RESOURCES:
+            raise ValueError('Unknown resource type {0}'.format(resource_type))
+        scope_key = self.get_scope_key(scope)
+        names = list(dict.fromkeys(names))
+        with self.lock:
+            missing = [name for name in names if
+                       (resource_type, scope_key, name) not in self.entities]
+            file_cache = self.get_cache(resource_type)
+            if missing and file_cache is not None:
+                missing = self.read_cache(file_cache, resource_type,
+                                          scope_key, missing)
+            if len(missing) == 1 and resource_type in SDK_LOOKUPS:
+                found = {missing[0]: SDK_LOOKUPS[resource_type](
+                    self.conn, missing[0], scope) or []}
+            elif missing:
+                found = dict((name, []) for name in missing)
+                for entity in self.list_entities(resource_type, 'name',
+                                                 missing, scope):
+                    found.setdefault(entity['name'], []).append(entity)
+            else:
+                found = {}
+            for name, entities in found.items():
+                self.entities[(resource_type, scope_key, name)] = entities
+                if file_cache is not None and len(entities) == 1:
+                    self.write_cache(file_cache, resource_type, scope_key,
+                                     name, entities[0])
+            return dict((name, self.entities[(resource_type, scope_key, name)])
+                        for name in names)
+
+    def read_cache(self, file_cache, resource_type, scope_key, names):
+        """Memoize the cached entities of names, returning the missing
+           names"""
+        missing = []
+        for name in names:
+            try:
+                entity = file_cache.get(self.get_cache_key(
+                    resource_type, scope_key, name))
+            except OSError:
+                entity = None
+            if entity:
+                self.entities[(resource_type, scope_key, name)] = [entity]
+            else:
+                missing.append(name)
+        return missing
+
+    def write_cache(self, file_cache, resource_type, scope_key, name, entity):
+        try:
+            file_cache.set(self.get_cache_key(resource_type, scope_key, name),
+                           dict(id=entity['id'], name=entity.get('name')))
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def forget(self, resource_type, names, **scope):
+        """Forget the lookups of names, after resources with these names
+           were created, renamed or deleted"""
+        scope_key = self.get_scope_key(scope)
+        with self.lock:
+            for name in names:
+                self.entities.pop((resource_type, scope_key, name), None)
+
+    def resolve(self, resource_type, values, **scope):
+        """
+        Resolve names or IDs of resources of a type to IDs. The IDs are
+        checked to exist with a single in.() filter.
+        :return: Dict of the ID of every known value
+        :raises ValueError: If several resources have one of the names
+        """
+        values = list(dict.fromkeys(values))
+        names = [value for value in values
+                 if utils.name_or_id(value) == 'NAME']
+        ids = [value for value in values if value not in names]
+        resolved = {}
+        for name, entities in self.find(resource_type, names,
+                                        **scope).items():
+            if len(entities) > 1:
+                raise ValueError('Multiple resources of type {0} named {1} '
+                                 'found'.format(resource_type, name))
+            if entities:
+                resolved[name] = entities[0]['id']
+        if ids:
+            existing = set(entity['id'] for entity in self.list_entities(
+                resource_type, 'id', ids, scope))
+            resolved.update((value, value) for value in ids
+                            if value in existing)
+        return resolved
+
+    def get_id(self, resource_type, value, **scope):
+        """Resolve the name or ID of a resource to its ID, or None if it
+           does not exist"""
+        return self.resolve(resource_type, [value], **scope).get(value)
+
+
+def get_resolver(conn, module_params=None):
+    """Get the name resolver of a connection, which is shared by the users
+       of the connection"""
+    with _RESOLVERS_LOCK:
+        name_resolver = _RESOLVERS.get(conn)
+        if name_resolver is None:
+            name_resolver = _RESOLVERS[conn] = NameResolver(conn,
+                                                            module_params)
+        return name_resolver
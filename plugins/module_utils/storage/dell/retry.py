@@ -0,0 +1,168 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Retries of the REST requests of the PowerStore modules which fail with
+   transient errors"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import random
+import threading
+import time
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+
+requests = lazy.LazyModule('requests')
+urllib3_exceptions = lazy.LazyModule('urllib3.exceptions')
+HAS_REQUESTS = lazy.is_available('requests')
+
+# Status codes of the responses of a busy array
+RETRY_CODES = (429, 502, 503)
+# Status codes with which the array rejects a request without processing it
+REJECTED_CODES = (429, 503)
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# Longest wait in seconds between two attempts of a request
+MAX_BACKOFF = 30
+
+
+def is_connect_error(error):
+    """Whether the request failed before it reached the array"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, urllib3_exceptions.NewConnectionError)
+
+
+def get_retry_after(response):
+    """Get the seconds to wait given by the Retry-After header, if any"""
+    try:
+        return max(float(response.headers.get('Retry-After')), 0)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(object):
+
+    """
+    Retries the REST requests of a PyPowerStore client which fail with a
+    transient error, waiting for an exponential backoff with full jitter
+    between the attempts. The requests which only read are retried on any
+    transient error. The other ones are retried only if the array rejected
+    them without processing them, or if they did not reach the array, so
+    that a write is never applied twice.
+    """
+
+    def __init__(self, max_retries, budget, backoff, max_backoff=MAX_BACKOFF):
+        """
+        Initialize the retry policy
+        :param max_retries: Maximum number of retries of a request
+        :param budget: Maximum number of retries of all the requests
+        :param backoff: Base of the exponential backoff in seconds
+        :param max_backoff: Longest wait between two attempts in seconds
+        """
+        self.max_retries = max_retries
+        self.budget = budget
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retries = {}
+        self.lock = threading.Lock()
+
+    @property
+    def count(self):
+        return sum(self.retries.values())
+
+    def get_failure(self, http_method, response=None, error=None):
+        """Get the reason of a failure which may be retried, or None"""
+        safe = http_method.upper() in SAFE_METHODS
+        if error is not None:
+            if isinstance(error, requests.exceptions.SSLError):
+                return None
+            if is_connect_error(error):
+                return type(error).__name__
+            if safe and isinstance(error, (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError)):
+                return type(error).__name__
+            return None
+        if response.status_code in REJECTED_CODES or \
+                (safe and response.status_code in RETRY_CODES):
+            return str(response.status_code)
+        return None
+
+    def use_retry(self, reason):
+        """Take a retry out of the budget, returning False if it is spent"""
+        with self.lock:
+            if self.count >= self.budget:
+                return False
+            self.retries[reason] = self.retries.get(reason, 0) + 1
+            return True
+
+    def get_delay(self, attempt, response=None):
+        """Get the seconds to wait before the retry of an attempt"""
+        delay = random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = get_retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def wrap(self, fetch_response):
+        """Wrap the fetch_response method of a client with the retries"""
+        def retried_fetch_response(http_method, url, payload=None,
+                                   querystring=None, myrange=None):
+            attempt = 0
+            while True:
+                response = error = None
+                try:
+                    response = fetch_response(
+                        http_method, url, payload=payload,
+                        querystring=querystring, myrange=myrange)
+                except requests.exceptions.RequestException as e:
+                    error = e
+                reason = self.get_failure(http_method, response, error)
+                if reason is None or attempt >= self.max_retries or \
+                        not self.use_retry(reason):
+                    if error is not None:
+                        raise error
+                    return response
+                time.sleep(self.get_delay(attempt, response))
+                attempt += 1
+        return retried_fetch_response
+
+    def get_stats(self):
+        """Get the retry counts reported in the result of the module"""
+        with self.lock:
+            return dict(count=self.count, reasons=dict(self.retries),
+                        budget_exhausted=self.count >= self.budget)
+
+
+def attach(client, module_params):
+    """
+    Retry the requests of a PyPowerStore client as configured by the module
+    parameters.
+    :return: The retry policy, or None if retries are disabled
+    """
+    max_retries = module_params.get('max_retries') or 0
+    budget = module_params.get('retry_budget') or 0
+    if not HAS_REQUESTS or max_retries <= 0 or budget <= 0:
+        return None
+    policy = RetryPolicy(max_retries, budget,
+                         module_params.get('retry_backoff') or 0)
+    client.fetch_response = policy.wrap(client.fetch_response)
+    return policy
+
+
+def report(module, policy):
+    """Add the retry counts to the result of the module, if any request was
+       retried"""
+    for name in ('exit_json', 'fail_json'):
+        def exit_with_retries(_exit=getattr(module, name), **kwargs):
+            if policy.count:
+                kwargs['retries'] = policy.get_stats()
+            return _exit(**kwargs)
+        setattr(module, name, exit_with_retries)
@@ -0,0 +1,181 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Sessions of the PowerStore REST API shared by the module runs of a host
+   through the file cache"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import binascii
+import hashlib
+import hmac
+import os
+import time
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
+
+# Seconds before the idle timeout of a session from which it is no longer
+# reused, so that it does not expire while a module uses it
+EXPIRY_MARGIN = 60
+# Status code with which the array rejects the cookie of an ended session
+UNAUTHORIZED = 401
+# Status code with which the array rejects an expired DELL-EMC-TOKEN, among
+# other forbidden requests
+FORBIDDEN = 403
+# File of the secret of the keys of the sessions in the cache directory
+SECRET_FILE = '.session_secret'
+
+
+def get_secret(cache_dir):
+    """
+    Get the random secret of the sessions of a cache directory, creating it
+    if needed. The secret is published atomically, so that concurrent
+    modules agree on it.
+    """
+    cache_dir = os.path.expanduser(cache_dir)
+    path = os.path.join(cache_dir, SECRET_FILE)
+    if not os.path.exists(path):
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as secret_file:
+            secret_file.write(binascii.hexlify(os.urandom(32)).decode('ascii'))
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_path)
+    with open(path, 'r') as secret_file:
+        return secret_file.read().encode('ascii')
+
+
+def is_token_rejected(response):
+    """Whether the array rejected the session of a request, as opposed to
+       forbidding the request to the user"""
+    if response.status_code == UNAUTHORIZED:
+        return True
+    if response.status_code != FORBIDDEN:
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return False
+    messages = body.get('messages') if isinstance(body, dict) else None
+    for message in messages or []:
+        if isinstance(message, dict) and 'token' in str(
+                message.get('message_l10n') or '').lower():
+            return True
+    return False
+
+
+class SessionCache(object):
+
+    """
+    Keeps the token and the cookie of the session of a PyPowerStore client
+    in the file cache, so that the modules which run against the same array
+    with the same credentials log in once per session instead of once per
+    run. The entry is locked while the client logs in, so that concurrent
+    modules wait for one login instead of all logging in. The entries are
+    keyed on an HMAC of the credentials with the random secret of the cache
+    directory, so that the password cannot be guessed from the file names.
+    """
+
+    def __init__(self, client, module_params):
+        """
+        Initialize the session cache and attach it to the client
+        :param client: The PyPowerStore client shared by the SDK objects
+        :param module_params: The parameters of the module
+        """
+        self.auth_manager = client.auth_manager
+        self.cache_dir = module_params.get('cache_dir') or \
+            cache.DEFAULT_CACHE_DIR
+        credentials = '{0}:{1}'.format(module_params['user'],
+                                       module_params['password'])
+        digest = hmac.new(get_secret(self.cache_dir),
+                          credentials.encode('utf-8'),
+                          hashlib.sha256).hexdigest()
+        self.key = cache.get_cache_key(module_params, 'session:' + digest)
+        self._login = self.auth_manager.login
+        self._fetch_response = client.fetch_response
+        self.auth_manager.login = self.login
+        client.fetch_response = self.fetch_response
+
+    def get_file_cache(self, ttl=0):
+        return cache.FileCache(self.cache_dir, ttl)
+
+    def login(self):
+        """Reuse the cached session if it is valid and is not the one which
+           has just ended, logging in and caching the new session
+           otherwise"""
+        file_cache = self.get_file_cache()
+        ended_token = self.auth_manager.dell_emc_token
+        with file_cache.lock(self.key):
+            entry = file_cache.read(self.key)
+            session = entry['value'] if entry else None
+            if session and session['token'] != ended_token:
+                self.auth_manager.dell_emc_token = session['token']
+                self.auth_manager.cookie = session['cookie']
+                self.auth_manager.idle_timeout = session['idle_timeout']
+                self.auth_manager.creation_time = session['creation_time']
+                return
+
+            self._login()
+            ttl = self.auth_manager.idle_timeout - EXPIRY_MARGIN
+            if not (self.auth_manager.dell_emc_token and
+                    self.auth_manager.cookie and ttl > 0):
+                return
+            session = dict(token=self.auth_manager.dell_emc_token,
+                           cookie=self.auth_manager.cookie,
+                           idle_timeout=self.auth_manager.idle_timeout,
+                           creation_time=self.auth_manager.creation_time or
+                           time.time())
+            try:
+                self.get_file_cache(ttl).write(self.key, session)
+            except OSError:
+                pass
+
+    def invalidate(self, token):
+        """Drop the cached session if it still has the rejected token"""
+        file_cache = self.get_file_cache()
+        with file_cache.lock(self.key):
+            entry = file_cache.read(self.key)
+            if entry and entry['value']['token'] == token:
+                file_cache.remove(self.key)
+
+    def fetch_response(self, http_method, url, payload=None,
+                       querystring=None, myrange=None):
+        """Fetch the response of a request, logging in again once if the
+           array rejects the session with a 401 response, or with a 403
+           response for its DELL-EMC-TOKEN"""
+        response = self._fetch_response(
+            http_method, url, payload=payload, querystring=querystring,
+            myrange=myrange)
+        token = self.auth_manager.dell_emc_token
+        if token and is_token_rejected(response):
+            try:
+                self.invalidate(token)
+            except OSError:
+                pass
+            self.auth_manager.creation_time = None
+            response = self._fetch_response(
+                http_method, url, payload=payload, querystring=querystring,
+                myrange=myrange)
+        return response
+
+
+def attach(client, module_params):
+    """
+    Share the sessions of a PyPowerStore client through the file cache.
+    :return: Whether the client is attached
+    """
+    try:
+        SessionCache(client, module_params)
+    except (AttributeError, KeyError, OSError):
+        return False
+    return True
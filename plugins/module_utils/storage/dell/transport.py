@@ -0,0 +1,98 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Transport of the REST requests of the SDK over the persistent connection
+   of the dellemc.powerstore.powerstore HttpApi plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import broker
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+
+requests = lazy.LazyModule('requests')
+sdk_client = lazy.LazyModule('PyPowerStore.client')
+HAS_Py4PS = lazy.is_available('PyPowerStore', 'requests')
+
+
+class HttpApiTransport(object):
+
+    """
+    Sends the REST requests of a PyPowerStore client over the persistent
+    connection, which holds the authenticated session of the array.
+    """
+
+    def __init__(self, socket_path, application_type):
+        """
+        Initialize the transport
+        :param socket_path: Path of the socket of the persistent connection
+        :param application_type: Application type sent to the array
+        """
+        self.connection = Connection(socket_path)
+        self.application_type = application_type
+
+    def fetch_response(self, http_method, url, payload=None,
+                       querystring=None, myrange=None):
+        """Fetch the response of a request over the persistent connection,
+           in place of Client.fetch_response"""
+        # https://<array_ip>:<port>/api/rest/<resource>...
+        path = '/' + url.split('/', 3)[3]
+        # The persistent connection decodes gzip responses, but does not
+        # ask for them
+        headers = {'Application-Type': self.application_type,
+                   'Accept-Encoding': 'gzip'}
+        # Resources which the SDK requests with the internal visibility
+        # header
+        if url.split('/')[5] in sdk_client.ENGVIS_LIST:
+            headers['DELL-VISIBILITY'] = 'internal'
+        if myrange:
+            headers['Range'] = myrange
+        try:
+            reply = self.connection.send_request(
+                json.dumps(payload) if payload else None, path=path,
+                method=http_method, query=querystring, headers=headers)
+        except ConnectionError as e:
+            raise requests.exceptions.ConnectionError(
+                'The persistent connection failed with error {0}'.format(
+                    str(e)))
+        return broker.RelayedResponse(reply)
+
+    def check_array(self, array_ip, port=None):
+        """
+        Check that the persistent connection is opened to the array of the
+        module, as its requests are sent to the host of the connection
+        whatever array_ip is.
+        :raises ValueError: If the host or the port of the connection differ
+        """
+        host = self.connection.get_option('host')
+        conn_port = self.connection.get_option('port')
+        if str(host).lower() != str(array_ip).lower() or \
+                (port and conn_port and int(port) != int(conn_port)):
+            raise ValueError(
+                'The persistent connection is opened to {0}:{1}, which does '
+                'not match the array_ip {2} and port {3} of the '
+                'module'.format(host, conn_port, array_ip, port))
+
+
+def attach(client, socket_path, array_ip, port=None):
+    """
+    Route the REST requests of a PyPowerStore client over the persistent
+    connection listening on socket_path.
+    :param array_ip: IP or FQDN of the array of the module
+    :param port: Port of the array of the module
+    :return: Whether the client is attached
+    :raises ValueError: If the connection is opened to another array
+    """
+    if not HAS_Py4PS:
+        return False
+    transport = HttpApiTransport(socket_path, client.application_type)
+    transport.check_array(array_ip, port)
+    client.fetch_response = transport.fetch_response
+    return True
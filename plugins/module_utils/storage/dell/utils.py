@@ -4,16 +4,37 @@
 import PyPowerStore library for PowerStore Storage
 """
 from __future__ import (absolute_import, division, print_function)
+from ansible.module_utils.basic import env_fallback
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell.logging_handler \
     import CustomRotatingFileHandler
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import broker
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import transport
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import session
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import retry
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import ratelimit
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import perf
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import httpcache
 
 __metaclass__ = type
 
 try:
     import PyPowerStore
-    from PyPowerStore import powerstore_conn
     from PyPowerStore.utils.exception import PowerStoreException
-    HAS_Py4PS = True
+    # The connection layer of the SDK imports requests and all the SDK
+    # resources, so it is only imported by the modules which connect
+    powerstore_conn = lazy.LazyModule('PyPowerStore.powerstore_conn')
+    HAS_Py4PS = lazy.is_available('requests')
 except ImportError:
     HAS_Py4PS = False
 
@@ -26,9 +47,13 @@ try:
 except ImportError:
     PKG_RSRC_IMPORTED = False
 
+import contextvars
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from decimal import Decimal
+from functools import lru_cache
 from uuid import UUID
 from datetime import datetime
 import os
@@ -41,6 +66,7 @@ Check required libraries
 '''
 
 
+@lru_cache(maxsize=None)
 def has_pyu4ps_sdk():
     error_message = "Ansible modules for Powerstore require the " \
                     "PyPowerStore python library to be installed. " \
@@ -58,6 +84,7 @@ Check if required PyPowerStore version installed
 '''
 
 
+@lru_cache(maxsize=None)
 def py4ps_version_check():
     try:
         supported_version = False
@@ -102,12 +129,53 @@ def get_powerstore_management_host_parameters():
         port=dict(type='int', required=False),
         timeout=dict(type='int', required=False, default=120),
         validate_certs=dict(type='bool', required=False,
-                            aliases=['verifycert'], default=True)
+                            aliases=['verifycert'], default=True),
+        cache_dir=dict(type='path', required=False,
+                       fallback=(env_fallback,
+                                 ['ANSIBLE_POWERSTORE_CACHE_DIR'])),
+        cache_ttl=dict(type='int', required=False, default=0,
+                       fallback=(env_fallback,
+                                 ['ANSIBLE_POWERSTORE_CACHE_TTL'])),
+        broker_socket=dict(type='path', required=False,
+                           fallback=(env_fallback,
+                                     ['ANSIBLE_POWERSTORE_BROKER_SOCKET'])),
+        cache_session=dict(type='bool', required=False, default=False,
+                           fallback=(env_fallback,
+                                     ['ANSIBLE_POWERSTORE_CACHE_SESSION'])),
+        max_retries=dict(type='int', required=False, default=3,
+                         fallback=(env_fallback,
+                                   ['ANSIBLE_POWERSTORE_MAX_RETRIES'])),
+        retry_budget=dict(type='int', required=False, default=10,
+                          fallback=(env_fallback,
+                                    ['ANSIBLE_POWERSTORE_RETRY_BUDGET'])),
+        retry_backoff=dict(type='float', required=False, default=1.0,
+                           fallback=(env_fallback,
+                                     ['ANSIBLE_POWERSTORE_RETRY_BACKOFF'])),
+        rate_limit=dict(type='float', required=False, default=0,
+                        fallback=(env_fallback,
+                                  ['ANSIBLE_POWERSTORE_RATE_LIMIT'])),
+        max_in_flight=dict(type='int', required=False, default=0,
+                           fallback=(env_fallback,
+                                     ['ANSIBLE_POWERSTORE_MAX_IN_FLIGHT'])),
+        perf_stats=dict(type='bool', required=False, default=False,
+                        fallback=(env_fallback,
+                                  ['ANSIBLE_POWERSTORE_PERF_STATS'])),
+        perf_trace_file=dict(type='path', required=False,
+                             fallback=(env_fallback,
+                                       ['ANSIBLE_POWERSTORE_PERF_TRACE_FILE'])),
+        http_cache_size=dict(type='int', required=False, default=0,
+                             fallback=(env_fallback,
+                                       ['ANSIBLE_POWERSTORE_HTTP_CACHE_SIZE']))
     )
 
 
 def get_powerstore_connection(module_params, application_type=APPLICATION_TYPE,
-                              enable_log=False):
+                              enable_log=False, module=None):
+    """
+    Get the PyPowerStore connection to the array of module_params. If the
+    module is given, the requests are sent over its persistent connection,
+    if any, and the retries of the requests are reported in its result.
+    """
     if HAS_Py4PS:
         conn = powerstore_conn.PowerStoreConn(
             server_ip=module_params['array_ip'],
@@ -118,9 +186,154 @@ def get_powerstore_connection(module_params, application_type=APPLICATION_TYPE,
             application_type=application_type,
             port_no=module_params['port'],
             enable_log=enable_log)
+        socket_path = getattr(module, '_socket_path', None)
+        if socket_path:
+            try:
+                transport.attach(conn.provisioning.client, socket_path,
+                                 module_params['array_ip'],
+                                 module_params['port'])
+            except ValueError as e:
+                module.fail_json(msg=str(e))
+        elif not (module_params.get('broker_socket') and
+                  broker.attach(conn.provisioning.client,
+                                module_params['broker_socket'])):
+            # Without a broker, the session and the responses may be shared
+            # through the cache
+            if module_params.get('cache_session'):
+                session.attach(conn.provisioning.client, module_params)
+            httpcache.attach(conn.provisioning.client, module_params)
+        if cache.get_cache(module_params) is not None:
+            # The SDK checks the array version before most of its calls
+            get_array_version = conn.provisioning.get_array_version
+            conn.provisioning.get_array_version = \
+                lambda: cache.cached_call(module_params, 'array_version',
+                                          get_array_version)
+        # Every attempt of a retried request is limited
+        ratelimit.attach(conn.provisioning.client, module_params)
+        retry_policy = retry.attach(conn.provisioning.client, module_params)
+        if retry_policy is not None and module is not None:
+            retry.report(module, retry_policy)
+        recorder = perf.attach(conn, module_params)
+        if recorder is not None and module is not None:
+            perf.report(module, recorder, module_params)
         return conn
 
 
+def run_concurrently(func, items, max_workers=1, timeout=None):
+    """
+    Call func for every item on a bounded thread pool.
+
+    The outcome of each call is returned as a (result, error) tuple, in the
+    same order as items, so that callers can report failures
+    deterministically from the main thread. If timeout seconds elapse
+    before all the calls complete, the pending calls are cancelled and
+    TimeoutError is raised. Every call runs in a copy of the context of the
+    caller, so that the context variables set by the caller are seen by the
+    calls.
+    """
+    items = list(items)
+    outcomes = [(None, None)] * len(items)
+    if not items:
+        return outcomes
+
+    workers = max(1, min(max_workers or 1, len(items)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = dict((executor.submit(contextvars.copy_context().run,
+                                        func, item), index)
+                       for index, item in enumerate(items))
+        for future in as_completed(futures, timeout=timeout):
+            index = futures[future]
+            try:
+                outcomes[index] = (future.result(), None)
+            except Exception as e:
+                outcomes[index] = (None, e)
+    except FuturesTimeoutError:
+        raise TimeoutError('{0} calls did not complete within {1} '
+                           'seconds'.format(len(items), timeout))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return outcomes
+
+
+def reconcile_in_bulk(module, items, plan, apply, key, max_workers, noun,
+                      get_details=None, get_diff=None, prepare=None):
+    """
+    Reconcile the items of a bulk option of a module with the array, and
+    exit or fail the module with the outcome of every item, in order.
+
+    Every item is planned first, and the module fails with the errors of
+    all the items before anything is changed. The plans with an action are
+    then applied concurrently, unless in check mode. A failed plan does not
+    stop the others, and the module fails once all of them are applied.
+    :param module: The Ansible module
+    :param items: The items of the bulk option
+    :param plan: Callable returning the plan of an item, a dict whose
+                 action is None if the item is already reconciled, and
+                 raising ValueError if the item cannot be reconciled
+    :param apply: Callable applying a plan with an action
+    :param key: Callable returning the dict of the fields identifying the
+                item of a plan in its outcome and in the errors
+    :param max_workers: Maximum number of plans applied concurrently
+    :param noun: Plural noun of the items, under which the outcomes are
+                 returned
+    :param get_details: Optional callable taking the plans and whether any
+                        was applied, and returning the dict of the details
+                        to be added to the outcome of every plan, in order
+    :param get_diff: Optional callable returning the diff of the plans
+    :param prepare: Optional callable called with the plans with an action
+                    once before they are applied
+    """
+    plans = []
+    errors = []
+    for item in items:
+        try:
+            plans.append(plan(item))
+        except ValueError as e:
+            errors.append(str(e))
+    if errors:
+        error_msg = '; '.join(errors)
+        logging.getLogger(__name__).error(error_msg)
+        module.fail_json(msg=error_msg)
+
+    pending = [index for index, item_plan in enumerate(plans)
+               if item_plan['action']]
+    errors = {}
+    applied = bool(pending) and not module.check_mode
+    if applied:
+        if prepare:
+            prepare([plans[index] for index in pending])
+        outcomes = run_concurrently(
+            apply, [plans[index] for index in pending],
+            max_workers=max_workers)
+        errors = dict((index, error) for index, (result, error)
+                      in zip(pending, outcomes) if error is not None)
+
+    details = get_details(plans, applied) if get_details else \
+        [{}] * len(plans)
+    results = []
+    for index, item_plan in enumerate(plans):
+        result = dict(key(item_plan), action=item_plan['action'],
+                      changed=bool(item_plan['action']) and
+                      index not in errors)
+        result.update(details[index])
+        if index in errors:
+            result['error'] = str(errors[index])
+        results.append(result)
+    changed = any(result['changed'] for result in results)
+    diff = get_diff(plans) if get_diff and module._diff else {}
+
+    if errors:
+        error_msg = "Failed to reconcile {0} of {1} {2}: {3}".format(
+            len(errors), len(plans), noun, '; '.join(
+                '{0}: {1}'.format(', '.join(
+                    str(value) for value in key(plans[index]).values()),
+                    error) for index, error in sorted(errors.items())))
+        logging.getLogger(__name__).error(error_msg)
+        module.fail_json(msg=error_msg, changed=changed, **{noun: results})
+    module.exit_json(changed=changed, diff=diff, **{noun: results})
+
+
 def name_or_id(val):
     """Determines if the input value is a name or id"""
     try:
@@ -669,7 +669,8 @@ class PowerStoreCluster(object):
         # cluster details
         self.result = {"changed": False, "cluster_details": {}}
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        self.conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         self.configuration = self.conn.config_mgmt
         self.provisioning = self.conn.provisioning
         msg = 'Got Py4Ps instance for configuring cluster on' \
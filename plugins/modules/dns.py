@@ -156,7 +156,8 @@ class PowerstoreDns(object):
         if IS_SUPPORTED_PY4PS_VERSION is False:
             self.module.fail_json(msg=VERSION_ERROR)
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        self.conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         self.configuration = self.conn.config_mgmt
         msg = 'Got Py4ps instance for configuration on' \
               ' PowerStore {0}'.format(self.configuration)
@@ -317,7 +317,8 @@ class PowerStoreFilesystemSnapshot(object):
         if not IS_SUPPORTED_PY4PS_VERSION:
             self.module.fail_json(msg=VERSION_ERROR)
 
-        self.py4ps_conn = utils.get_powerstore_connection(self.module.params)
+        self.py4ps_conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         self.protection = self.py4ps_conn.protection
         self.provisioning = self.py4ps_conn.provisioning
         LOG.info('Got Py4ps instance for PowerStore')
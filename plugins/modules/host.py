@@ -101,6 +101,103 @@ options:
     - Required when creating a host.
     - Use either I(host_id) or I(host_name) for modify and delete tasks.
     type: str
+  hosts:
+    description:
+    - List of hosts to be reconciled in one run, with I(state) and
+      I(initiator_state).
+    - All the hosts and their initiators are fetched with one listing, so
+      that the initiators which are already registered to another host, or
+      which are given for several hosts, are reported before any change is
+      made.
+    - The hosts are then created, modified or deleted concurrently, by up to
+      I(max_workers) parallel requests.
+    - The options of an item which are not given default to the module
+      options of the same name.
+    - Renaming hosts is not supported with I(hosts).
+    - Mutually exclusive with I(host_name), I(host_id), I(new_name),
+      I(initiators) and I(detailed_initiators).
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      host_name:
+        description:
+        - The host name.
+        type: str
+        required: true
+      os_type:
+        description:
+        - Operating system of the host.
+        - Required when creating a host.
+        choices: ['Windows', 'Linux', 'ESXi', 'AIX', 'HP-UX', 'Solaris']
+        type: str
+      host_connectivity:
+        description:
+        - Connectivity type for host.
+        choices: ['Local_Only', 'Metro_Optimize_Both', 'Metro_Optimize_Local',
+                  'Metro_Optimize_Remote']
+        type: str
+      description:
+        description:
+        - An optional description for the host.
+        type: str
+      initiators:
+        description:
+        - List of Initiator WWN or IQN or NQN to be added to or removed from
+          the host.
+        - It is mutually exclusive with I(detailed_initiators).
+        type: list
+        elements: str
+      detailed_initiators:
+        description:
+        - Initiator properties.
+        - It is mutually exclusive with I(initiators).
+        type: list
+        elements: dict
+        suboptions:
+          chap_mutual_password:
+            description:
+            - Password for mutual CHAP authentication.
+            - CHAP password is required when the cluster CHAP mode is mutual
+              authentication.
+            - Minimum length is 12 and maximum length is 64 characters.
+            - 'The CHAP password must be 12 to 64 characters and can only contain English letters, numbers, and some special
+              characters (such as + : ; , / # _ @ * % $ ! ( ) [ ]).'
+            type: str
+          chap_mutual_username:
+            description:
+            - Username for mutual CHAP authentication.
+            - CHAP username is required when the cluster CHAP mode is mutual
+              authentication.
+            - Minimum length is 1 and maximum length is 64 characters.
+            type: str
+          chap_single_password:
+            description:
+            - Password for single CHAP authentication.
+            - CHAP password is required when the cluster CHAP mode is mutual
+              authentication.
+            - Minimum length is 12 and maximum length is 64 characters.
+            - 'The CHAP password must be 12 to 64 characters and can only contain English letters, numbers, and some special
+              characters (such as + : ; , / # _ @ * % $ ! ( ) [ ]).'
+            type: str
+          chap_single_username:
+            description:
+            - Username for single CHAP authentication.
+            - CHAP username is required when the cluster CHAP mode is mutual
+              authentication.
+            - Minimum length is 1 and maximum length is 64 characters.
+            type: str
+          port_name:
+            description:
+            - Name of port type.
+            - The I(port_name) is mandatory key.
+            type: str
+            required: true
+          port_type:
+            description:
+            - Protocol type of the host initiator.
+            type: str
+            choices: ['iSCSI', 'FC', 'NVMe']
   initiators:
       description:
       - List of Initiator WWN or IQN or NQN to be added or removed from the
@@ -122,6 +219,15 @@ options:
       initiators to/from existing host.
     choices: ['present-in-host', 'absent-in-host']
     type: str
+  max_workers:
+    description:
+    - Maximum number of hosts in I(hosts) to be created, modified or deleted
+      concurrently.
+    - If set to C(1), the changes are made one after another.
+    - Used only with I(hosts).
+    type: int
+    default: 4
+    version_added: '3.10.0'
   new_name:
     description:
     - The new name of host for renaming function. This value must contain 128
@@ -262,6 +368,26 @@ EXAMPLES = r'''
     password: "{{password}}"
     host_name: "ansible-test-host-1-new"
     state: 'absent'
+
+- name: Register the hosts of a cluster with their initiators in one run
+  dellemc.powerstore.host:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    os_type: 'ESXi'
+    hosts:
+      - host_name: "esxi-node-1"
+        initiators:
+          - 21:00:00:24:ff:31:e9:01
+          - 21:00:00:24:ff:31:e9:02
+      - host_name: "esxi-node-2"
+        initiators:
+          - 21:00:00:24:ff:31:e9:03
+          - 21:00:00:24:ff:31:e9:04
+    max_workers: 8
+    initiator_state: 'present-in-host'
+    state: 'present'
 '''
 
 RETURN = r'''
@@ -372,9 +498,58 @@ host_details:
         "host_connectivity": "Local_Only",
         "os_type_l10n": "ESXi"
     }
+
+hosts:
+    description: Outcome of every host of I(hosts), in the same order.
+    returned: When I(hosts) is given
+    type: list
+    elements: dict
+    contains:
+        host_name:
+            description: Name of the host.
+            type: str
+        action:
+            description: The action taken on the host, if any.
+            type: str
+            choices: [create, modify, delete]
+        changed:
+            description: Whether the host has changed.
+            type: bool
+        error:
+            description: Error of the action on the host, if it failed.
+            type: str
+        host_details:
+            description: Details of the host, with its ID, name, description,
+                         os type, host group and initiators.
+            type: dict
+    sample: [
+        {
+            "host_name": "esxi-node-1",
+            "action": "create",
+            "changed": true,
+            "host_details": {
+                "description": null,
+                "host_group_id": null,
+                "host_initiators": [
+                    {
+                        "active_sessions": [],
+                        "chap_mutual_username": "",
+                        "chap_single_username": "",
+                        "port_name": "21:00:00:24:ff:31:e9:01",
+                        "port_type": "FC"
+                    }
+                ],
+                "id": "4d56e60-fc10-4f51-a698-84a664562f0d",
+                "name": "esxi-node-1",
+                "os_type": "ESXi"
+            }
+        }
+    ]
 '''
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import resolver
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
     import utils
 import logging
@@ -394,6 +569,11 @@ VERSION_ERROR = py4ps_version['unsupported_version_message']
 # DO NOT CHANGE BELOW PORT_TYPES SEQUENCE AS ITS USED IN SCRIPT USING INDEX
 PORT_TYPES = ["iSCSI", "FC", "NVMe"]
 
+# Fields of the hosts listed to reconcile the items of hosts
+BULK_HOST_SELECT = 'id,name,description,os_type,host_group_id,host_initiators'
+# Options of the items of hosts which default to the module options
+BULK_HOST_OPTIONS = ('os_type', 'host_connectivity', 'description')
+
 
 class PowerStoreHost(object):
     '''Class with host(initiator group) operations'''
@@ -404,7 +584,10 @@ class PowerStoreHost(object):
         self.module_params.update(get_powerstore_host_parameters())
         mutually_exclusive = [['host_name', 'host_id'],
                               ['initiators', 'detailed_initiators']]
-        required_one_of = [['host_name', 'host_id']]
+        mutually_exclusive.extend(['hosts', option] for option in (
+            'host_name', 'host_id', 'new_name', 'initiators',
+            'detailed_initiators'))
+        required_one_of = [['host_name', 'host_id', 'hosts']]
         # Initialize the Ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
@@ -430,7 +613,8 @@ class PowerStoreHost(object):
             "diff": {}
         }
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        self.conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         LOG.info(
             'Got Python library connection instance for provisioning on'
             ' PowerStore %s', self.conn)
@@ -585,10 +769,11 @@ class PowerStoreHost(object):
 
         return add_list_with_type
 
-    def add_host_initiators(self, host, modify_dict):
+    def add_host_initiators(self, host, modify_dict, host_params=None):
         # get params
-        initiators = self.module.params['initiators']
-        detailed_initiators = self.module.params['detailed_initiators']
+        host_params = host_params or self.module.params
+        initiators = host_params['initiators']
+        detailed_initiators = host_params['detailed_initiators']
 
         # determine existing initiators
         existing_initiators = None
@@ -651,9 +836,10 @@ class PowerStoreHost(object):
 
         return modify_dict
 
-    def remove_host_initiators(self, host, modify_dict):
-        initiators = self.module.params['initiators']
-        detailed_initiators = self.module.params['detailed_initiators']
+    def remove_host_initiators(self, host, modify_dict, host_params=None):
+        host_params = host_params or self.module.params
+        initiators = host_params['initiators']
+        detailed_initiators = host_params['detailed_initiators']
         remove_list = None
         try:
 
@@ -864,12 +1050,14 @@ class PowerStoreHost(object):
         if (host_params['initiator_state'] == 'present-in-host'
                 and (host_params['initiators'] or host_params['detailed_initiators'])):
             LOG.info('Adding initiators to host')
-            modify_dict = self.add_host_initiators(host=host, modify_dict=modify_dict)
+            modify_dict = self.add_host_initiators(
+                host=host, modify_dict=modify_dict, host_params=host_params)
 
         if (host_params['initiator_state'] == 'absent-in-host'
                 and (host_params['initiators'] or host_params['detailed_initiators'])):
             LOG.info('Removing initiators from host')
-            modify_dict = self.remove_host_initiators(host, modify_dict)
+            modify_dict = self.remove_host_initiators(host, modify_dict,
+                                                      host_params)
 
         return modify_dict
 
@@ -891,6 +1079,140 @@ class PowerStoreHost(object):
             host=host, host_params=host_params, modify_dict=modify_dict)
         return modify_dict
 
+    def get_hosts(self, select, host_names=None):
+        """Get all the hosts with their initiators in one listing, or the
+           hosts with any of the names, listed with in.() filters"""
+        try:
+            provisioning = self.conn.provisioning
+            if host_names is None:
+                return provisioning.get_hosts(
+                    filter_dict={'select': select}, all_pages=True) or []
+            hosts = []
+            for index in range(0, len(host_names), resolver.MAX_BATCH):
+                hosts.extend(provisioning.get_hosts(
+                    filter_dict={
+                        'select': select,
+                        'name': resolver.format_in(
+                            host_names[index:index + resolver.MAX_BATCH])},
+                    all_pages=True) or [])
+            return hosts
+        except Exception as e:
+            error_msg = "Get hosts failed with error: {0}".format(str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+
+    def get_bulk_host_items(self, host_params):
+        """Get the items of hosts, with the module options as defaults"""
+        items = []
+        for host in host_params['hosts']:
+            item = dict(host)
+            for option in BULK_HOST_OPTIONS:
+                if item.get(option) is None:
+                    item[option] = host_params[option]
+            if len(item['host_name'].strip()) == 0:
+                self.module.fail_json(msg="Please provide valid host name.")
+            if (item['initiators'] or item['detailed_initiators']) and \
+                    host_params['initiator_state'] is None:
+                self.module.fail_json(
+                    msg="initiator_state is mandatory along with the "
+                        "initiators or detailed_initiators of hosts. Please "
+                        "provide a valid value.")
+            if item['detailed_initiators'] and \
+                    host_params['initiator_state'] is not None:
+                self.validate_detailed_initiators(item['detailed_initiators'])
+            items.append(item)
+        names = [item['host_name'] for item in items]
+        duplicates = sorted(set(name for name in names
+                                if names.count(name) > 1))
+        if duplicates:
+            self.module.fail_json(msg="Host names in hosts must be unique: "
+                                      "{0}".format(', '.join(duplicates)))
+        return items
+
+    def plan_bulk_host(self, item, host_details, owners, initiator_state,
+                       state):
+        """
+        Plan the reconciliation of a host with its item of hosts.
+        :param owners: Dict of the hosts of the registered initiators, by
+                       lowercase port name
+        :return: Dict of the action, if any, and of its parameters
+        :raises ValueError: If the host cannot be reconciled
+        """
+        name = item['host_name']
+        if state == 'absent':
+            return dict(host_name=name, host=host_details, params={},
+                        action='delete' if host_details else None)
+
+        ports = item['initiators'] or [
+            initiator['port_name']
+            for initiator in item['detailed_initiators'] or []]
+        host_id = host_details['id'] if host_details else None
+        if initiator_state == 'present-in-host':
+            for port in ports:
+                owner = owners.get(port.lower())
+                if owner and owner['id'] != host_id:
+                    raise ValueError('Initiator {0} of host {1} is already '
+                                     'registered to host {2}'.format(
+                                         port, name, owner['name']))
+
+        if not host_details:
+            if item['os_type'] is None:
+                raise ValueError('Create host {0} failed as os_type is not '
+                                 'specified'.format(name))
+            if initiator_state != 'present-in-host' or not ports:
+                raise ValueError('Create host {0} failed as initiators are '
+                                 'not specified with initiator_state '
+                                 'present-in-host'.format(name))
+            initiators = self._prepare_add_list_with_type(
+                add_list=ports, detailed_initiators=item['detailed_initiators'],
+                is_add_operation=True)
+            if len(set(i['port_type'] for i in initiators)) > 1:
+                raise ValueError('Invalid initiators of host {0}. Cannot add '
+                                 'IQN, WWN and NQN as part of host. Connect '
+                                 'either fiber channel or iSCSI or NVMe. '
+                                 'Initiators: {1}'.format(name, ports))
+            params = dict(name=name, os_type=item['os_type'],
+                          initiators=initiators,
+                          host_connectivity=item['host_connectivity'],
+                          description=item['description'])
+            return dict(host_name=name, host=None, params=params,
+                        action='create')
+
+        if item['os_type'] and item['os_type'] != host_details['os_type']:
+            raise ValueError('os_type cannot be modified for an already '
+                             'existing host {0}.'.format(name))
+        item_params = dict(
+            new_name=None, host_connectivity=item['host_connectivity'],
+            description=item['description'], initiator_state=initiator_state,
+            initiators=item['initiators'],
+            detailed_initiators=item['detailed_initiators'])
+        params = self.is_modify_required(host=host_details,
+                                         host_params=item_params)
+        if params.get('add_initiators'):
+            port_types = set(self._get_port_type(i['port_name']) for i in
+                             host_details.get('host_initiators') or [])
+            port_types.update(i['port_type'] for i in
+                              params['add_initiators'])
+            if len(port_types) > 1:
+                raise ValueError('Invalid initiators of host {0}. Cannot add '
+                                 'IQN, WWN and NQN as part of host. Connect '
+                                 'either fiber channel or iSCSI or NVMe. '
+                                 'Initiators: {1}'.format(name, ports))
+        return dict(host_name=name, host=host_details, params=params,
+                    action='modify' if params else None)
+
+    def apply_bulk_host(self, plan):
+        """Apply the action planned for a host of hosts"""
+        LOG.info('Applying %s of host %s', plan['action'], plan['host_name'])
+        provisioning = self.conn.provisioning
+        if plan['action'] == 'create':
+            provisioning.create_host(**plan['params'])
+        elif plan['action'] == 'modify':
+            provisioning.modify_host(host_id=plan['host']['id'],
+                                     **plan['params'])
+        else:
+            provisioning.delete_host(plan['host']['id'])
+
 
 def get_powerstore_host_parameters():
     """This method provides the parameters required for the ansible host
@@ -901,19 +1223,7 @@ def get_powerstore_host_parameters():
         initiators=dict(required=False, type='list', elements='str'),
         detailed_initiators=dict(
             type='list', required=False, elements='dict',
-            options=dict(port_name=dict(type='str', required=True),
-                         port_type=dict(type='str', required=False,
-                                        choices=PORT_TYPES),
-                         chap_single_username=dict(type='str',
-                                                   required=False),
-                         chap_single_password=dict(type='str',
-                                                   required=False,
-                                                   no_log=True),
-                         chap_mutual_username=dict(type='str',
-                                                   required=False),
-                         chap_mutual_password=dict(type='str',
-                                                   required=False,
-                                                   no_log=True))
+            options=get_detailed_initiator_parameters()
         ),
         state=dict(choices=['present', 'absent'], default='present'),
         initiator_state=dict(required=False, choices=['absent-in-host',
@@ -927,10 +1237,42 @@ def get_powerstore_host_parameters():
             required=False, type='str',
             choices=['Local_Only', 'Metro_Optimize_Both',
                      'Metro_Optimize_Local', 'Metro_Optimize_Remote']),
-        description=dict()
+        description=dict(),
+        hosts=dict(
+            type='list', elements='dict', options=dict(
+                host_name=dict(type='str', required=True),
+                os_type=dict(
+                    type='str',
+                    choices=['Windows', 'Linux', 'ESXi', 'AIX', 'HP-UX',
+                             'Solaris']),
+                host_connectivity=dict(
+                    type='str',
+                    choices=['Local_Only', 'Metro_Optimize_Both',
+                             'Metro_Optimize_Local', 'Metro_Optimize_Remote']),
+                description=dict(type='str'),
+                initiators=dict(type='list', elements='str'),
+                detailed_initiators=dict(
+                    type='list', elements='dict',
+                    options=get_detailed_initiator_parameters())),
+            mutually_exclusive=[['initiators', 'detailed_initiators']]),
+        max_workers=dict(type='int', default=4)
     )
 
 
+def get_detailed_initiator_parameters():
+    """This method provides the parameters of the detailed initiators of a
+       host"""
+    return dict(port_name=dict(type='str', required=True),
+                port_type=dict(type='str', required=False,
+                               choices=PORT_TYPES),
+                chap_single_username=dict(type='str', required=False),
+                chap_single_password=dict(type='str', required=False,
+                                          no_log=True),
+                chap_mutual_username=dict(type='str', required=False),
+                chap_mutual_password=dict(type='str', required=False,
+                                          no_log=True))
+
+
 class HostExitHandler:
     def handle(self, host_obj, host_id, changed):
         host_obj._create_result_dict(
@@ -1017,11 +1359,103 @@ class HostHandler:
         HostCreateHandler().handle(host_obj, host_params, host_details, host_id, changed)
 
 
+class HostBulkHandler:
+    def handle(self, host_obj, host_params):
+        if host_params['max_workers'] < 1:
+            host_obj.module.fail_json(msg="max_workers should be a positive "
+                                          "integer")
+        state = host_params['state']
+        items = host_obj.get_bulk_host_items(host_params)
+        host_names = [item['host_name'] for item in items]
+        select = BULK_HOST_SELECT
+        if any(item['host_connectivity'] for item in items):
+            select += ',host_connectivity'
+        if state == 'present':
+            hosts = host_obj.get_hosts(select)
+        else:
+            hosts = host_obj.get_hosts(select, host_names)
+        existing = dict((host['name'], host) for host in hosts)
+        owners = {}
+        for host in hosts:
+            for initiator in host.get('host_initiators') or []:
+                owners[initiator['port_name'].lower()] = host
+
+        claim_initiators = state == 'present' and \
+            host_params['initiator_state'] == 'present-in-host'
+        claimed = {}
+
+        def plan_item(item):
+            if claim_initiators:
+                for port in item['initiators'] or [
+                        initiator['port_name'] for initiator in
+                        item['detailed_initiators'] or []]:
+                    claimer = claimed.setdefault(port.lower(),
+                                                 item['host_name'])
+                    if claimer != item['host_name']:
+                        raise ValueError(
+                            'Initiator {0} is given for both hosts {1} and '
+                            '{2}'.format(port, claimer, item['host_name']))
+            return host_obj.plan_bulk_host(
+                item, existing.get(item['host_name']), owners,
+                host_params['initiator_state'], state)
+
+        def get_details(plans, applied):
+            if state != 'present':
+                return [{}] * len(plans)
+            if applied:
+                existing.update((host['name'], host) for host in
+                                host_obj.get_hosts(select, host_names))
+            return [dict(host_details=existing.get(plan['host_name']))
+                    for plan in plans]
+
+        utils.reconcile_in_bulk(
+            host_obj.module, items, plan_item, host_obj.apply_bulk_host,
+            lambda plan: dict(host_name=plan['host_name']),
+            host_params['max_workers'], 'hosts', get_details=get_details,
+            get_diff=self.get_diff)
+
+    @staticmethod
+    def get_diff(plans):
+        before = {}
+        after = {}
+        for plan in plans:
+            name = plan['host_name']
+            params = plan['params']
+            host = dict(plan['host'] or {})
+            if host:
+                host['host_initiators'] = [
+                    initiator['port_name']
+                    for initiator in host.get('host_initiators') or []]
+            before[name] = host
+            if plan['action'] == 'delete':
+                after[name] = {}
+            elif plan['action'] == 'create':
+                after[name] = dict(
+                    params, host_initiators=[initiator['port_name'] for
+                                             initiator in params['initiators']])
+                del after[name]['initiators']
+            else:
+                removed = params.get('remove_initiators') or []
+                host_after = dict(host, **dict(
+                    (key, value) for key, value in params.items()
+                    if key in ('description', 'host_connectivity')))
+                host_after['host_initiators'] = [
+                    port for port in host.get('host_initiators', [])
+                    if port not in removed] + [
+                    initiator['port_name']
+                    for initiator in params.get('add_initiators') or []]
+                after[name] = host_after
+        return dict(before=before, after=after)
+
+
 def main():
     """ Create PowerStore host object and perform action on it
         based on user input from playbook"""
     obj = PowerStoreHost()
-    HostHandler().handle(obj, obj.module.params)
+    if obj.module.params['hosts'] is not None:
+        HostBulkHandler().handle(obj, obj.module.params)
+    else:
+        HostHandler().handle(obj, obj.module.params)
 
 
 if __name__ == '__main__':
@@ -258,7 +258,8 @@ class PowerStoreHostgroup(object):
         # details
         self.result = {"changed": False, "hostgroup_details": {}}
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        self.conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         LOG.info('Got Python library connection instance for provisioning on'
                  ' PowerStore %s', self.conn)
 
@@ -135,11 +135,239 @@ options:
       any type will be returned.
     type: bool
     default: false
+  max_workers:
+    description:
+    - Maximum number of subsets in I(gather_subset) to be gathered
+      concurrently.
+    - If set to C(1), the subsets are gathered one after another.
+    - The order of the returned entities does not depend on this value.
+    type: int
+    default: 1
+    version_added: '3.10.0'
+  array_ip:
+    description:
+    - IP or FQDN of the PowerStore management system.
+    - Required unless I(arrays) is passed, and mutually exclusive with
+      I(arrays), whose arrays have their own I(array_ip).
+    type: str
+    required: false
+  user:
+    description:
+    - The username of the PowerStore host.
+    - Required if I(array_ip) is passed. With I(arrays), it is used for the
+      arrays which do not have their own I(user), and ignored for
+      the arrays which have it.
+    type: str
+    required: false
+  password:
+    description:
+    - The password of the PowerStore host.
+    - Required if I(array_ip) is passed. With I(arrays), it is used for the
+      arrays which do not have their own I(password), and ignored for
+      the arrays which have it.
+    type: str
+    required: false
+  arrays:
+    description:
+    - A list of PowerStore arrays whose subsets are gathered in one run of
+      the module, instead of the one of I(array_ip).
+    - The same I(gather_subset), I(filters), I(fields) and I(aggregate) are
+      applied to every array.
+    - The connection parameters which are not passed for an array are taken
+      from the module parameters.
+    - The results are returned in C(Arrays), keyed by I(array_ip). The
+      failure of an array is reported in its result, and does not fail the
+      module.
+    - With I(output_path), the files of each array are written to a
+      subdirectory named after its I(array_ip).
+    - Mutually exclusive with I(array_ip).
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      array_ip:
+        description:
+        - IP or FQDN of the PowerStore management system.
+        type: str
+        required: true
+      user:
+        description:
+        - The username of the PowerStore host.
+        type: str
+      password:
+        description:
+        - The password of the PowerStore host.
+        type: str
+      port:
+        description:
+        - Port number for the PowerStore array.
+        type: int
+      validate_certs:
+        description:
+        - Boolean variable to specify whether to validate SSL certificate.
+        type: bool
+        aliases:
+        - verifycert
+      timeout:
+        description:
+        - Time after which the connection will get terminated, in seconds.
+        type: int
+  array_workers:
+    description:
+    - Maximum number of arrays in I(arrays) to be gathered concurrently.
+    type: int
+    default: 4
+    version_added: '3.10.0'
+  page_workers:
+    description:
+    - Maximum number of pages of a subset to be fetched concurrently when
+      I(all_pages) is C(true).
+    - The first page gives the number of entities, and the remaining pages
+      are then fetched in parallel and returned in order.
+    - If set to C(1), the pages are fetched one after another.
+    - The pool is per subset, so up to I(max_workers) times I(page_workers)
+      requests can be sent to the array at once.
+    type: int
+    default: 1
+    version_added: '3.10.0'
+  include_acl:
+    description:
+    - Indicates whether to fetch the access control list (ACL) of each SMB
+      share when C(smb_share) is in I(gather_subset).
+    - The ACLs are fetched concurrently, using up to I(acl_workers) parallel
+      requests.
+    type: bool
+    default: true
+    version_added: '3.10.0'
+  acl_workers:
+    description:
+    - Maximum number of ACLs of SMB shares to be fetched concurrently.
+    - Applicable only if I(include_acl) is C(true).
+    type: int
+    default: 4
+    version_added: '3.10.0'
+  acl_timeout:
+    description:
+    - Time in seconds within which the ACLs of all the SMB shares must be
+      fetched.
+    - When it elapses, the module fails and the ACL requests which were not
+      sent yet are cancelled. The requests already sent to the array are not
+      interrupted, and their responses are discarded.
+    - If not passed, the ACL retrieval is not time bound.
+    - Applicable only if I(include_acl) is C(true).
+    type: int
+    version_added: '3.10.0'
+  fields:
+    description:
+    - A dictionary which maps a subset in I(gather_subset) to the list of
+      fields to be returned for its entities.
+    - The fields are passed to the array as the C(select) query, so only
+      the requested fields are transferred.
+    - A field can be a plain attribute such as C(size), an embedded
+      relationship such as C(host_mappings(host_id,logical_unit_number)), or
+      C(*) for all the attributes.
+    - The C(id) field is always returned.
+    - Field selection is not supported for role, local user, security
+      configs, service configs, LDAP accounts, LDAP domain, discovered
+      appliances, remote support contacts and vCenters.
+    - If not passed, the default fields of each subset are returned.
+    type: dict
+    version_added: '3.10.0'
+  expand:
+    description:
+    - A list of subsets in I(gather_subset) whose entities are returned
+      with the names of their related entities.
+    - The names are looked up in indexes of the related entities by ID,
+      which are fetched once per run, so the cost is linear in the number
+      of entities.
+    - For C(vol), C(host_name) and C(host_group_name) are attached to each
+      of the I(mapped_volumes), and C(name) to each of the
+      I(volume_groups).
+    - For C(host), C(host_group_name) is attached to the host.
+    - For C(hg), C(name) is attached to each of the I(hosts).
+    - For C(vg), C(name) is attached to each of the I(volumes).
+    - For C(file_system), C(nas_server_name) is attached to the file system.
+    - For C(nfs_export) and C(smb_share), C(file_system_name) is attached to
+      the export or share.
+    - The fields which refer to the related entities are added to the
+      fields returned for the subset, which are the ones of I(fields) or
+      else the ones returned without I(expand).
+    type: list
+    elements: str
+    choices: [vol, host, hg, vg, file_system, nfs_export, smb_share]
+    version_added: '3.10.0'
+  output_path:
+    description:
+    - Path of a directory, on the host which runs the module, to which the
+      entities of each subset are streamed as they are fetched.
+    - The entities of a subset are written to a JSON Lines file named after
+      the subset, for example C(Volumes.jsonl), with one entity per line.
+    - If passed, the entities are not returned in the result. Only the path
+      of each file and the number of entities written to it are returned
+      in I(OutputFiles).
+    - The directory is created if it does not exist. Existing files are
+      overwritten.
+    type: path
+    version_added: '3.10.0'
+  compress_output:
+    description:
+    - Indicates whether to compress the files written to I(output_path)
+      with gzip. A C(.gz) suffix is added to the file names.
+    type: bool
+    default: false
+    version_added: '3.10.0'
+  aggregate:
+    description:
+    - A list of aggregations to be computed over the entities of subsets in
+      I(gather_subset), instead of returning the entities.
+    - The aggregations are computed page by page as the entities are
+      fetched, and only their results are returned in I(Aggregates).
+    - The fields used by the aggregations are added to the C(select) query
+      of the subset.
+    - Mutually exclusive with I(output_path).
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      subset:
+        description:
+        - The subset in I(gather_subset) to be aggregated.
+        type: str
+        required: true
+      function:
+        description:
+        - The aggregate function.
+        - C(count) - Number of entities, or of entities having I(field) if
+          passed.
+        - C(sum), C(min), C(max) - Sum, minimum and maximum of I(field) over
+          the entities having it.
+        type: str
+        choices: [count, sum, min, max]
+        required: true
+      field:
+        description:
+        - The field of the entities to be aggregated.
+        - Required for C(sum), C(min) and C(max).
+        type: str
+      group_by:
+        description:
+        - The fields by which the entities are grouped, such as C(type) or
+          C(appliance_id).
+        - If passed, the result of each group is returned in addition to
+          the overall result.
+        type: list
+        elements: str
 notes:
 - Pagination is not supported for role, local user, security configs, LDAP
   accounts, discovered appliances and LDAP domain. If I(all_pages) is passed,
   it will be ignored.
 - The I(check_mode) is supported.
+- If any subset fails while I(max_workers) is greater than C(1), the failure
+  of the first such subset in I(gather_subset) order is reported.
+- With I(output_path), only one page of entities per subset is held in
+  memory at a time, except for role, local user, security configs, service
+  configs, LDAP accounts, LDAP domain, discovered appliances, remote support
+  contacts and vCenters, which are fetched as a whole.
 '''
 
 EXAMPLES = r'''
@@ -431,6 +659,120 @@ EXAMPLES = r'''
     password: "{{password}}"
     gather_subset:
       - recycle_bin
+
+- name: Get list of block entities concurrently
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - vol
+      - vg
+      - host
+      - hg
+    all_pages: true
+    max_workers: 4
+
+- name: Get list of virtual volumes fetching their pages concurrently
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - virtual_volume
+    all_pages: true
+    page_workers: 8
+
+- name: Get list of volumes with the names of their hosts and volume groups
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - vol
+    expand:
+      - vol
+    all_pages: true
+
+- name: Get list of volumes and hosts of several arrays
+  dellemc.powerstore.info:
+    user: "{{user}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    arrays:
+      - array_ip: "{{array_ip_1}}"
+      - array_ip: "{{array_ip_2}}"
+        user: "{{user_2}}"
+        password: "{{password_2}}"
+    gather_subset:
+      - vol
+      - host
+    all_pages: true
+
+- name: Get list of SMB shares without their ACLs
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - smb_share
+    include_acl: false
+
+- name: Get list of volumes with selected fields
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - vol
+    fields:
+      vol:
+        - name
+        - size
+        - logical_used
+        - volume_groups(name)
+    all_pages: true
+
+- name: Stream all volumes and virtual volumes to compressed files
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - vol
+      - virtual_volume
+    all_pages: true
+    output_path: /tmp/powerstore_inventory
+    compress_output: true
+
+- name: Get the capacity of the volumes by appliance
+  dellemc.powerstore.info:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    gather_subset:
+      - vol
+    all_pages: true
+    aggregate:
+      - subset: vol
+        function: count
+        group_by:
+          - type
+      - subset: vol
+        function: sum
+        field: size
+        group_by:
+          - appliance_id
+      - subset: vol
+        function: max
+        field: logical_used
 '''
 
 RETURN = r'''
@@ -439,6 +781,44 @@ changed:
     returned: always
     type: bool
     sample: 'false'
+Aggregates:
+    description: Provides the results of the aggregations of each subset,
+                 in the order of I(aggregate).
+    type: dict
+    returned: When I(aggregate) is passed
+    contains:
+        function:
+            description: The aggregate function.
+            type: str
+        field:
+            description: The aggregated field.
+            type: str
+        group_by:
+            description: The fields by which the entities are grouped.
+            type: list
+        value:
+            description: The result over all the entities. It is C(null) for
+                         C(min) and C(max) if no entity has the field.
+            type: raw
+        groups:
+            description: The result of each group, along with the values of
+                         the I(group_by) fields of the group.
+            type: list
+            returned: When I(group_by) is passed
+    sample: {
+        "Volumes": [
+            {
+                "function": "sum",
+                "field": "size",
+                "group_by": ["appliance_id"],
+                "value": 5368709120,
+                "groups": [
+                    {"appliance_id": "A1", "value": 4294967296},
+                    {"appliance_id": "A2", "value": 1073741824}
+                ]
+            }
+        ]
+    }
 ActiveDirectory:
     description: Provides details of all active directories.
     type: list
@@ -544,6 +924,37 @@ Appliance:
             "volumes": []
         }
     ]
+Arrays:
+    description: Provides the result of each array in I(arrays), keyed by
+                 its I(array_ip). The result of an array has the same keys
+                 as the result of the module for a single array. If the
+                 subsets of an array could not be gathered, its result only
+                 has C(failed), C(msg) and, if returned by the array,
+                 C(error_code) and C(status_code).
+    type: dict
+    returned: When I(arrays) is passed
+    sample: {
+        "10.0.0.1": {
+            "Array_Software_Version": "3.0.0.0",
+            "Cluster": [
+                {
+                    "id": "0",
+                    "name": "WN-D8977",
+                    "state": "Configured"
+                }
+            ],
+            "Volumes": [
+                {
+                    "id": "0a4b2e6c-2ba5-4f0b-9b8a-ca6bfc06e3de",
+                    "name": "sample_vol"
+                }
+            ]
+        },
+        "10.0.0.2": {
+            "failed": true,
+            "msg": "Failed to get the clusters with error HTTPSConnectionPool(host='10.0.0.2', port=443): Max retries exceeded"
+        }
+    }
 Array_Software_Version:
     description: API version of PowerStore array.
     returned: always
@@ -1162,6 +1573,23 @@ NTP:
             "id": "NTP1"
           }
     ]
+OutputFiles:
+    description: Provides the file to which each subset is streamed.
+    type: dict
+    returned: When I(output_path) is passed
+    contains:
+        path:
+            description: Path of the JSON Lines file of the subset.
+            type: str
+        count:
+            description: Number of entities written to the file.
+            type: int
+    sample: {
+        "Volumes": {
+            "path": "/tmp/powerstore_inventory/Volumes.jsonl.gz",
+            "count": 61234
+        }
+    }
 ProtectionPolicies:
     description: Provides details of all protection policies.
     type: list
@@ -1420,7 +1848,9 @@ SMBShares:
     returned: When C(smb_share) is in a given I(gather_subset)
     contains:
         aces:
-          description: access control list (ACL) of the smb share.
+          description:
+            - access control list (ACL) of the smb share.
+            - Not returned if I(include_acl) is C(false).
           type: list
           contains:
             access_level:
@@ -1959,12 +2389,31 @@ Volumes:
         ]
 '''
 
+import contextvars
+import copy
+import gzip
+import json
+import os
+import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import cache
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import pagination
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import lazy
 
 LOG = utils.get_logger('info')
 
+sdk_helpers = lazy.LazyModule('PyPowerStore.utils.helpers')
+sdk_constants = lazy.LazyModule('PyPowerStore.utils.constants')
+# Provisioning of the array whose subsets the current thread gathers, when
+# the subsets of several arrays are gathered
+ARRAY_PROVISIONING = contextvars.ContextVar('array_provisioning',
+                                            default=None)
+
 py4ps_sdk = utils.has_pyu4ps_sdk()
 HAS_PY4PS = py4ps_sdk['HAS_Py4PS']
 IMPORT_ERROR = py4ps_sdk['Error_message']
@@ -1975,6 +2424,133 @@ VERSION_ERROR = py4ps_version['unsupported_version_message']
 
 
 ILIKE_PREFIX = 'ilike.'
+FIELD_PATTERN = re.compile(r'^(\*|[A-Za-z_][A-Za-z0-9_]*(\(.+\))?)$')
+FIELD_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+# Subsets whose SDK functions filter or complete the listing on the client
+# side, so that neither a select query nor page by page access applies.
+CLIENT_SIDE_SUBSETS = ['role', 'user', 'security_config', 'service_config',
+                       'ldap_account', 'ldap_domain', 'discovered_appliance',
+                       'remote_support_contact', 'vcenter']
+
+# Relationships resolved by expand for each subset. Each one is given by
+# the field of the entities which refers to the related entities (None if
+# the entities refer to them directly), the key of the ID of the related
+# entity, and its subset. The name of the related entity is attached next
+# to its ID, as name for id and as <prefix>_name for <prefix>_id.
+RELATIONSHIPS = {
+    'vol': [('mapped_volumes', 'host_id', 'host'),
+            ('mapped_volumes', 'host_group_id', 'hg'),
+            ('volume_groups', 'id', 'vg')],
+    'host': [(None, 'host_group_id', 'hg')],
+    'hg': [('hosts', 'id', 'host')],
+    'vg': [('volumes', 'id', 'vol')],
+    'file_system': [(None, 'nas_server_id', 'nas_server')],
+    'nfs_export': [(None, 'file_system_id', 'file_system')],
+    'smb_share': [(None, 'file_system_id', 'file_system')]
+}
+# Constants of the SDK with the fields which the SDK functions of the subsets
+# to be expanded select by default, SELECT_ID_AND_NAME for the other ones
+EXPAND_DEFAULT_SELECTS = {
+    'smb_share': 'SELECT_ALL_SMB_SHARE'
+}
+
+
+class Aggregation(object):
+    """Aggregation of a field over the entities of a subset, computed
+       incrementally page by page"""
+
+    def __init__(self, function, field=None, group_by=None):
+        self.function = function
+        self.field = field
+        self.group_by = group_by or []
+        self.value = self.initial_value()
+        self.groups = {}
+
+    def initial_value(self):
+        return 0 if self.function in ('count', 'sum') else None
+
+    def accumulate(self, value, entity):
+        if self.field is None:
+            return value + 1
+        field_value = entity.get(self.field)
+        if field_value is None:
+            return value
+        if self.function == 'count':
+            return value + 1
+        if self.function == 'sum':
+            return value + field_value
+        if value is None:
+            return field_value
+        if self.function == 'min':
+            return min(value, field_value)
+        return max(value, field_value)
+
+    def group_key(self, entity):
+        key = []
+        for field in self.group_by:
+            field_value = entity.get(field)
+            if isinstance(field_value, (dict, list)):
+                field_value = json.dumps(field_value, sort_keys=True)
+            key.append(field_value)
+        return tuple(key)
+
+    def add_page(self, page):
+        for entity in page:
+            self.value = self.accumulate(self.value, entity)
+            if self.group_by:
+                key = self.group_key(entity)
+                self.groups[key] = self.accumulate(
+                    self.groups.get(key, self.initial_value()), entity)
+
+    def to_dict(self):
+        result = dict(function=self.function, field=self.field,
+                      group_by=self.group_by, value=self.value)
+        if self.group_by:
+            result['groups'] = [
+                dict(zip(self.group_by, key), value=value)
+                for key, value in self.groups.items()]
+        return result
+
+
+class ArrayError(Exception):
+    """Failure of the module operation for one of the arrays"""
+
+    def __init__(self, msg, **kwargs):
+        super(ArrayError, self).__init__(msg)
+        self.msg = msg
+        self.details = kwargs
+
+
+class ArrayModule(object):
+    """Stands in for the Ansible module while the subsets of one of the
+       arrays are gathered, so that the outcome is kept per array"""
+
+    def __init__(self, params):
+        self.params = params
+        self.result = None
+        # The arrays are reached directly, not over a persistent connection
+        self._socket_path = None
+
+    def fail_json(self, msg, **kwargs):
+        raise ArrayError(msg, **kwargs)
+
+    def exit_json(self, **kwargs):
+        self.result = kwargs
+
+
+class ArrayVersionRouter(object):
+    """Stands in for the process global provisioning object of the SDK,
+       whose array version decides the fields which the SDK functions
+       select, while the subsets of several arrays are gathered. Every
+       access is routed to the provisioning of the array which the calling
+       thread gathers."""
+
+    def __init__(self, default):
+        self.default = default
+
+    def __getattr__(self, name):
+        provisioning = ARRAY_PROVISIONING.get() or self.default
+        return getattr(provisioning, name)
 
 
 class PowerstoreInfo(object):
@@ -1986,6 +2562,11 @@ class PowerstoreInfo(object):
 
     def __init__(self):
         self.result = {}
+        self.select_mapping = {}
+        self.aggregate_mapping = {}
+        self.expand_subsets = []
+        self.name_index = {}
+        self.page_router = None
         """Define all the parameters required by this module"""
         self.module_params = utils.get_powerstore_management_host_parameters()
         self.module_params.update(get_powerstore_info_parameters())
@@ -1994,10 +2575,18 @@ class PowerstoreInfo(object):
             [k for k in self.module_params['filters']['options'].keys()
              if 'filter' in k])
         LOG.info("Self.filter_keys: %s", self.filter_keys)
+        # The arrays option replaces the connection parameters of a single
+        # array
+        for option in ('array_ip', 'user', 'password'):
+            self.module_params[option]['required'] = False
         # initialize the Ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
-            supports_check_mode=True
+            supports_check_mode=True,
+            mutually_exclusive=[['output_path', 'aggregate'],
+                                ['array_ip', 'arrays']],
+            required_one_of=[['array_ip', 'arrays']],
+            required_by={'array_ip': ('user', 'password')}
         )
 
         LOG.info('HAS_PY4PS = %s, IMPORT_ERROR = %s', HAS_PY4PS, IMPORT_ERROR)
@@ -2009,7 +2598,15 @@ class PowerstoreInfo(object):
         if IS_SUPPORTED_PY4PS_VERSION is False:
             self.module.fail_json(msg=VERSION_ERROR)
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        if self.module.params['array_ip']:
+            self.connect(self.module.params)
+
+    def connect(self, module_params):
+        """Connect to the array of module_params, and map the subsets to
+           the SDK functions of the connection"""
+
+        self.conn = utils.get_powerstore_connection(
+            module_params, module=self.module)
         self.provisioning = self.conn.provisioning
         self.protection = self.conn.protection
         self.configuration = self.conn.config_mgmt
@@ -2213,37 +2810,19 @@ class PowerstoreInfo(object):
         LOG.info('Got Py4ps connection object %s', self.conn)
 
     def _get_recycle_bin_items(self, filter_dict=None, all_pages=False):
-        """Get all items in the recycle bin via direct REST call."""
+        """Get the items in the recycle bin via direct REST call. The filters
+        are applied and the items are paginated by the array."""
         url = 'https://{0}/api/rest/recycle_bin'.format(
             self.provisioning.server_ip)
+        querystring = {'select': '*'}
+        if filter_dict:
+            querystring.update(filter_dict)
         resp = self.provisioning.client.request(
-            'GET', url, querystring={'select': '*'})
+            'GET', url, querystring=querystring, all_pages=all_pages)
         if resp is None:
             resp = []
-        if filter_dict:
-            resp = [item for item in resp
-                    if self._matches_filter(item, filter_dict)]
         return resp
 
-    @staticmethod
-    def _matches_filter(item, filter_dict):
-        """Check if a recycle bin item matches filter criteria."""
-        for key, val in filter_dict.items():
-            item_val = str(item.get(key, ''))
-            if not isinstance(val, str):
-                continue
-            if val.startswith('eq.') and \
-                    item_val != val.removeprefix('eq.'):
-                return False
-            if val.startswith('neq.') and \
-                    item_val == val.removeprefix('neq.'):
-                return False
-            if val.startswith(ILIKE_PREFIX):
-                pattern = val.removeprefix(ILIKE_PREFIX).replace('*', '')
-                if pattern.lower() not in item_val.lower():
-                    return False
-        return True
-
     def get_acl(self, smb_share_id):
         """
         Retrieves the access control list (ACL) for a given SMB share ID.
@@ -2259,37 +2838,234 @@ class PowerstoreInfo(object):
             acl_response = []
         return acl_response
 
+    def update_smb_shares_with_acl(self, smb_shares):
+        """
+        Updates the SMB shares with their access control lists (ACL),
+        fetching them concurrently.
+        Parameters:
+            smb_shares (list): The SMB shares to be updated.
+        """
+        acl_timeout = self.module.params['acl_timeout']
+        try:
+            outcomes = utils.run_concurrently(
+                lambda share: self.get_acl(share["id"]), smb_shares,
+                max_workers=self.module.params['acl_workers'],
+                timeout=acl_timeout)
+        except TimeoutError:
+            raise TimeoutError(
+                'ACLs of {0} SMB shares could not be fetched within {1} '
+                'seconds'.format(len(smb_shares), acl_timeout))
+        for share, (acl, error) in zip(smb_shares, outcomes):
+            share["aces"] = acl if error is None else []
+
+    def fetch_item_list(self, item, filter_dict=None, all_pages=False):
+        """Fetch the list of item using the SDK function of the item"""
+
+        if self.select_mapping.get(item):
+            filter_dict = dict(filter_dict or {},
+                               select=self.select_mapping[item])
+        if item not in ['role', 'user']:
+            return self.subset_mapping[item]['func'](
+                filter_dict=filter_dict, all_pages=all_pages)
+        return self.subset_mapping[item]['func'](filter_dict=filter_dict)
+
+    def get_item_list(self, item, filter_dict=None, all_pages=False):
+        """Get the list of item of a given PowerStore storage system"""
+
+        LOG.info('Getting %s list', item)
+        item_list = self.fetch_item_list(item, filter_dict=filter_dict,
+                                         all_pages=all_pages)
+        if item == "smb_share" and self.module.params['include_acl']:
+            self.update_smb_shares_with_acl(item_list)
+        if item in self.expand_subsets:
+            self.expand_entities(item, item_list)
+        LOG.info('Successfully listed %s %s from powerstore array name: '
+                 '%s , global id : %s', len(item_list), self.
+                 subset_mapping[item]['display_as'], self.cluster_name,
+                 self.cluster_global_id)
+        return item_list
+
+    def consume_item_list(self, item, consumer, filter_dict=None,
+                          all_pages=False):
+        """Pass the list of item of a given PowerStore storage system to
+           consumer, page by page as the pages arrive"""
+
+        if item in CLIENT_SIDE_SUBSETS:
+            consumer(self.get_item_list(item, filter_dict=filter_dict,
+                                        all_pages=all_pages))
+            return
+
+        def consume_page(page):
+            if item == "smb_share" and self.module.params['include_acl'] \
+                    and item not in self.aggregate_mapping:
+                self.update_smb_shares_with_acl(page)
+            if item in self.expand_subsets:
+                self.expand_entities(item, page)
+            consumer(page)
+
+        LOG.info('Getting %s list page by page', item)
+        with self.page_router.pages_to(consume_page):
+            self.fetch_item_list(item, filter_dict=filter_dict,
+                                 all_pages=bool(all_pages))
+
+    def get_name_index(self, item):
+        """Get the names of all the entities of item, indexed by ID"""
+
+        LOG.info('Indexing %s names', item)
+        item_list = self.subset_mapping[item]['func'](
+            filter_dict={'select': 'id,name'}, all_pages=True)
+        return dict((entity['id'], entity.get('name'))
+                    for entity in item_list)
+
+    def update_name_index(self, max_workers=1):
+        """Index the names of the entities related to the subsets to be
+           expanded"""
+
+        related_items = []
+        for item in self.expand_subsets:
+            for field, key, related_item in RELATIONSHIPS[item]:
+                if related_item not in related_items:
+                    related_items.append(related_item)
+        outcomes = utils.run_concurrently(self.get_name_index, related_items,
+                                          max_workers=max_workers)
+        for item, (name_index, error) in zip(related_items, outcomes):
+            if error is not None:
+                self.fail_item_list(item, error)
+                return
+            self.name_index[item] = name_index
+
+    def expand_entities(self, item, entities):
+        """Attach the names of the related entities to entities of item"""
+
+        for field, key, related_item in RELATIONSHIPS[item]:
+            names = self.name_index[related_item]
+            name_key = key[:-len('id')] + 'name'
+            for entity in entities:
+                if field is None:
+                    references = [entity]
+                else:
+                    references = entity.get(field) or []
+                    if isinstance(references, dict):
+                        references = [references]
+                for reference in references:
+                    if reference.get(key) is not None:
+                        reference[name_key] = names.get(reference[key])
+
+    def stream_item_list(self, item, filter_dict=None, all_pages=False):
+        """Stream the list of item of a given PowerStore storage system to
+           a JSON Lines file in output_path"""
+
+        output_path = self.module.params['output_path']
+        file_name = self.subset_mapping[item]['display_as'] + '.jsonl'
+        if self.module.params['compress_output']:
+            file_name += '.gz'
+        path = os.path.join(output_path, file_name)
+        tmp_path = path + '.part'
+        details = {'path': path, 'count': 0}
+
+        def write_page(page):
+            for entity in page:
+                output.write(json.dumps(entity) + '\n')
+            details['count'] += len(page)
+
+        try:
+            if self.module.params['compress_output']:
+                output = gzip.open(tmp_path, 'wt', encoding='utf-8')
+            else:
+                output = open(tmp_path, 'w', encoding='utf-8')
+            with output:
+                self.consume_item_list(item, write_page,
+                                       filter_dict=filter_dict,
+                                       all_pages=all_pages)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        LOG.info('Successfully streamed %s %s to %s', details['count'],
+                 self.subset_mapping[item]['display_as'], path)
+        return details
+
+    def aggregate_item_list(self, item, filter_dict=None, all_pages=False):
+        """Aggregate the list of item of a given PowerStore storage system
+           page by page, without holding the list"""
+
+        aggregations = [Aggregation(spec['function'], field=spec['field'],
+                                    group_by=spec['group_by'])
+                        for spec in self.aggregate_mapping[item]]
+
+        def aggregate_page(page):
+            for aggregation in aggregations:
+                aggregation.add_page(page)
+
+        self.consume_item_list(item, aggregate_page, filter_dict=filter_dict,
+                               all_pages=all_pages)
+        LOG.info('Successfully aggregated %s',
+                 self.subset_mapping[item]['display_as'])
+        return [aggregation.to_dict() for aggregation in aggregations]
+
+    def get_item_result(self, item, filter_dict=None, all_pages=False):
+        """Get the result of item, which is either its list, its
+           aggregations or the details of the file it is streamed to"""
+
+        if item in self.aggregate_mapping:
+            return self.aggregate_item_list(item, filter_dict=filter_dict,
+                                            all_pages=all_pages)
+        if self.module.params['output_path']:
+            return self.stream_item_list(item, filter_dict=filter_dict,
+                                         all_pages=all_pages)
+        return self.get_item_list(item, filter_dict=filter_dict,
+                                  all_pages=all_pages)
+
+    def set_item_result(self, item, item_result):
+        """Set the result of item in the result json"""
+
+        display_as = self.subset_mapping[item]['display_as']
+        if item in self.aggregate_mapping:
+            self.result.setdefault('Aggregates', {})[display_as] = \
+                item_result
+        elif self.module.params['output_path']:
+            self.result.setdefault('OutputFiles', {})[display_as] = \
+                item_result
+        else:
+            self.result[display_as] = item_result
+
     def update_result_with_item_list(self, item, filter_dict=None,
                                      all_pages=False):
         """Update the result json with list of item of a given PowerStore
            storage system"""
 
         try:
-            LOG.info('Getting %s list', item)
-            if item not in ['role', 'user']:
-                item_list = self.subset_mapping[item]['func'](
-                    filter_dict=filter_dict, all_pages=all_pages)
-            else:
-                item_list = self.subset_mapping[item]['func'](
-                    filter_dict=filter_dict)
-            if item == "smb_share":
-                for each in item_list:
-                    each["aces"] = self.get_acl(each["id"])
-            LOG.info('Successfully listed %s %s from powerstore array name: '
-                     '%s , global id : %s', len(item_list), self.
-                     subset_mapping[item]['display_as'], self.cluster_name,
-                     self.cluster_global_id)
-            d = {
-                self.subset_mapping[item]['display_as']: item_list,
-            }
-            self.result.update(d)
+            item_result = self.get_item_result(
+                item, filter_dict=filter_dict, all_pages=all_pages)
+            self.set_item_result(item, item_result)
         except Exception as e:
-            msg = 'Get {0} for powerstore array name : {1} , global id : {2}'\
-                  ' failed with error {3} '\
-                .format(self.subset_mapping[item]['display_as'], self.
-                        cluster_name, self.cluster_global_id, str(e))
-            LOG.error(msg)
-            self.module.fail_json(msg=msg, **utils.failure_codes(e))
+            self.fail_item_list(item, e)
+
+    def update_result_with_item_lists(self, subset, filter_dict=None,
+                                      all_pages=False, max_workers=1):
+        """Update the result json with lists of all the items of a given
+           PowerStore storage system, gathering them concurrently"""
+
+        outcomes = utils.run_concurrently(
+            lambda item: self.get_item_result(
+                item, filter_dict=filter_dict, all_pages=all_pages),
+            subset, max_workers=max_workers)
+        for item, (item_result, error) in zip(subset, outcomes):
+            if error is not None:
+                self.fail_item_list(item, error)
+                return
+            self.set_item_result(item, item_result)
+
+    def fail_item_list(self, item, error):
+        """Fail the module for an item whose list could not be fetched"""
+
+        msg = 'Get {0} for powerstore array name : {1} , global id : {2}'\
+              ' failed with error {3} '\
+            .format(self.subset_mapping[item]['display_as'], self.
+                    cluster_name, self.cluster_global_id, str(error))
+        LOG.error(msg)
+        self.module.fail_json(msg=msg, **utils.failure_codes(error))
 
     def validate_filter(self, filter_dict):
         """ Validate given filter_dict """
@@ -2337,10 +3113,143 @@ class PowerstoreInfo(object):
                 self.module.fail_json(msg=msg)
         return filter_dict
 
+    def get_select_mapping(self, fields, subset):
+        """Get the select query to be applied for each subset"""
+
+        select_mapping = {}
+        for item, item_fields in fields.items():
+            if item not in (subset or []):
+                msg = "Fields are given for '{0}', which is not in " \
+                      "gather_subset".format(item)
+            elif item in CLIENT_SIDE_SUBSETS:
+                msg = "Field selection is not supported for '{0}'".format(
+                    item)
+            elif not isinstance(item_fields, list) or not item_fields:
+                msg = "Fields for '{0}' should be a non-empty list".format(
+                    item)
+            else:
+                invalid_fields = [str(field) for field in item_fields
+                                  if not isinstance(field, str) or
+                                  not FIELD_PATTERN.match(field)]
+                msg = None
+                if invalid_fields:
+                    msg = "Invalid fields '{0}' are given for '{1}'".format(
+                        ", ".join(invalid_fields), item)
+            if msg:
+                LOG.error(msg)
+                self.module.fail_json(msg=msg)
+                continue
+            if 'id' not in item_fields and '*' not in item_fields:
+                item_fields = ['id'] + item_fields
+            select_mapping[item] = ','.join(item_fields)
+        return select_mapping
+
+    def get_aggregate_mapping(self, aggregate, subset):
+        """Get the aggregations to be computed for each subset"""
+
+        aggregate_mapping = {}
+        for spec in aggregate:
+            item = spec['subset']
+            msg = None
+            if item not in (subset or []):
+                msg = "Aggregation is given for '{0}', which is not in " \
+                      "gather_subset".format(item)
+            elif spec['function'] != 'count' and not spec['field']:
+                msg = "field is required for the '{0}' aggregation of " \
+                      "'{1}'".format(spec['function'], item)
+            else:
+                fields = [spec['field']] + (spec['group_by'] or [])
+                invalid_fields = [field for field in fields
+                                  if field is not None and
+                                  not FIELD_NAME_PATTERN.match(field)]
+                if invalid_fields:
+                    msg = "Invalid fields '{0}' are given for the " \
+                          "aggregation of '{1}'".format(
+                              ", ".join(invalid_fields), item)
+            if msg:
+                LOG.error(msg)
+                self.module.fail_json(msg=msg)
+                continue
+            aggregate_mapping.setdefault(item, []).append(spec)
+        return aggregate_mapping
+
+    def add_aggregate_fields_to_select(self):
+        """Select the fields used by the aggregations of each subset"""
+
+        for item, specs in self.aggregate_mapping.items():
+            if item in CLIENT_SIDE_SUBSETS:
+                continue
+            fields = self.select_mapping.get(item, 'id').split(',')
+            if '*' in fields:
+                continue
+            for spec in specs:
+                for field in [spec['field']] + (spec['group_by'] or []):
+                    if field is not None and field not in fields:
+                        fields.append(field)
+            self.select_mapping[item] = ','.join(fields)
+
+    def get_expand_subsets(self, expand, subset):
+        """Get the subsets to be expanded"""
+
+        expand_subsets = []
+        for item in expand:
+            if item not in (subset or []):
+                msg = "Expand is given for '{0}', which is not in " \
+                      "gather_subset".format(item)
+                LOG.error(msg)
+                self.module.fail_json(msg=msg)
+            elif item not in expand_subsets:
+                expand_subsets.append(item)
+        return expand_subsets
+
+    def add_expand_fields_to_select(self):
+        """Select the fields which refer to the related entities of each
+           subset to be expanded"""
+
+        for item in self.expand_subsets:
+            default_select = getattr(sdk_constants, EXPAND_DEFAULT_SELECTS.get(
+                item, 'SELECT_ID_AND_NAME'))['select']
+            fields = self.select_mapping.get(item, default_select).split(',')
+            references = {}
+            for field, key, related_item in RELATIONSHIPS[item]:
+                references.setdefault(field, []).append(key)
+            for field, keys in references.items():
+                if field is None:
+                    fields.extend(key for key in keys
+                                  if key not in fields and '*' not in fields)
+                elif field not in fields and not any(
+                        each.startswith(field + '(') for each in fields):
+                    fields.append('{0}({1})'.format(field, ','.join(keys)))
+            self.select_mapping[item] = ','.join(fields)
+
+    def prepare_output_path(self, output_path):
+        """Create the output directory and route the listings page by
+           page, so that they can be streamed to it"""
+
+        try:
+            os.makedirs(output_path, exist_ok=True)
+        except OSError as e:
+            msg = 'Failed to create the output directory {0} with error ' \
+                  '{1}'.format(output_path, str(e))
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+        self.get_page_router()
+
+    def get_page_router(self):
+        """Get the page router of the client, attaching it if needed"""
+
+        if self.page_router is None:
+            self.page_router = pagination.PageRouter(
+                self.provisioning.client,
+                max_workers=self.module.params['page_workers'])
+        return self.page_router
+
     def get_clusters(self):
         """Get the clusters"""
         try:
-            clusters = self.provisioning.get_cluster_list()
+            clusters = cache.cached_call(
+                self.module.params, 'clusters',
+                self.provisioning.get_cluster_list)
             return clusters
 
         except Exception as e:
@@ -2363,7 +3272,115 @@ class PowerstoreInfo(object):
             LOG.error(msg)
             self.module.fail_json(msg=msg, **utils.failure_codes(e))
 
+    def get_array_params(self, array):
+        """Get the module parameters for one of the arrays, the connection
+           parameters which are not passed for it being taken from the
+           module"""
+
+        params = dict(self.module.params, arrays=None)
+        params.update((key, value) for key, value in array.items()
+                      if value is not None)
+        if params['output_path']:
+            params['output_path'] = os.path.join(params['output_path'],
+                                                 array['array_ip'])
+        return params
+
+    @staticmethod
+    def get_array_failure(array_ip, error):
+        """Get the details of the failure of one of the arrays"""
+
+        if isinstance(error, ArrayError):
+            LOG.error('Gathering the subsets of %s failed with error %s',
+                      array_ip, error.msg)
+            return dict(failed=True, msg=error.msg, **error.details)
+        msg = 'Gathering the subsets of {0} failed with error ' \
+              '{1}'.format(array_ip, str(error))
+        LOG.error(msg)
+        return dict(failed=True, msg=msg, **utils.failure_codes(error))
+
+    def connect_array(self, array):
+        """Connect to one of the arrays, returning the gatherer of its
+           subsets"""
+
+        gatherer = copy.copy(self)
+        gatherer.module = ArrayModule(self.get_array_params(array))
+        gatherer.result = {}
+        gatherer.select_mapping = {}
+        gatherer.aggregate_mapping = {}
+        gatherer.expand_subsets = []
+        gatherer.name_index = {}
+        gatherer.page_router = None
+        gatherer.connect(gatherer.module.params)
+        return gatherer
+
+    def gather_array(self, gatherer):
+        """Gather the subsets of one of the arrays, returning its result"""
+
+        ARRAY_PROVISIONING.set(gatherer.provisioning)
+        gatherer.perform_module_operation()
+        return gatherer.module.result
+
+    def gather_arrays(self, arrays):
+        """Gather the subsets of all the arrays concurrently, keying their
+           results by array"""
+
+        array_ips = [array['array_ip'] for array in arrays]
+        duplicates = sorted(set(array_ip for array_ip in array_ips
+                                if array_ips.count(array_ip) > 1))
+        if duplicates:
+            self.module.fail_json(
+                msg="arrays should not have duplicate array_ip: "
+                    "{0}".format(", ".join(duplicates)))
+        for array in arrays:
+            missing = [option for option in ('user', 'password')
+                       if not (array[option] or self.module.params[option])]
+            if missing:
+                self.module.fail_json(
+                    msg="{0} is required for the array {1}".format(
+                        " and ".join(missing), array['array_ip']))
+
+        array_workers = self.module.params['array_workers']
+        if array_workers < 1:
+            self.module.fail_json(msg="array_workers should be a positive "
+                                      "integer")
+
+        # Every new connection of the SDK replaces the process global
+        # provisioning object which its version checks read. The arrays are
+        # connected one after the other, and the global is then routed to
+        # the array of the calling thread while they are gathered.
+        results = {}
+        gatherers = []
+        for array in arrays:
+            try:
+                gatherers.append(self.connect_array(array))
+            except Exception as e:
+                results[array['array_ip']] = self.get_array_failure(
+                    array['array_ip'], e)
+        sdk_provisioning = sdk_helpers.PROVISIONING_OBJ
+        sdk_helpers.set_provisioning_obj(ArrayVersionRouter(sdk_provisioning))
+        try:
+            outcomes = utils.run_concurrently(self.gather_array, gatherers,
+                                              max_workers=array_workers)
+        finally:
+            sdk_helpers.set_provisioning_obj(sdk_provisioning)
+        for gatherer, (result, error) in zip(gatherers, outcomes):
+            array_ip = gatherer.module.params['array_ip']
+            results[array_ip] = result if error is None else \
+                self.get_array_failure(array_ip, error)
+
+        self.result['Arrays'] = dict((array_ip, results[array_ip])
+                                     for array_ip in array_ips)
+        failed = [array_ip for array_ip, result in self.result['Arrays'].items()
+                  if result.get('failed')]
+        LOG.info('Gathered the subsets of %s arrays, failed for %s',
+                 len(arrays), failed)
+
     def perform_module_operation(self):
+        if self.module.params.get('arrays'):
+            self.gather_arrays(self.module.params['arrays'])
+            self.module.exit_json(**self.result)
+            return
+
         clusters = self.get_clusters()
         cluster_state = ''
         if len(clusters) > 0:
@@ -2384,12 +3401,52 @@ class PowerstoreInfo(object):
         subset = self.module.params['gather_subset']
         filters = self.module.params['filters']
         all_pages = self.module.params['all_pages']
+        max_workers = self.module.params['max_workers']
+        if max_workers < 1:
+            self.module.fail_json(msg="max_workers should be a positive "
+                                      "integer")
+        if self.module.params['page_workers'] < 1:
+            self.module.fail_json(msg="page_workers should be a positive "
+                                      "integer")
+        if self.module.params['acl_workers'] < 1:
+            self.module.fail_json(msg="acl_workers should be a positive "
+                                      "integer")
 
         filter_dict = {}
         if filters:
             filter_dict = self.get_filters(filters)
             LOG.info('filters: %s', filter_dict)
-        if subset is not None:
+        if self.module.params['fields']:
+            self.select_mapping = self.get_select_mapping(
+                self.module.params['fields'], subset)
+            LOG.info('select: %s', self.select_mapping)
+        if self.module.params['aggregate']:
+            self.aggregate_mapping = self.get_aggregate_mapping(
+                self.module.params['aggregate'], subset)
+            self.add_aggregate_fields_to_select()
+            LOG.info('aggregate: %s', self.aggregate_mapping)
+            self.get_page_router()
+        if self.module.params['output_path']:
+            self.prepare_output_path(self.module.params['output_path'])
+        if all_pages and self.module.params['page_workers'] > 1:
+            self.get_page_router()
+        if self.module.params['expand']:
+            self.expand_subsets = self.get_expand_subsets(
+                self.module.params['expand'], subset)
+            self.add_expand_fields_to_select()
+            self.update_name_index(max_workers=max_workers)
+            LOG.info('expand: %s', self.expand_subsets)
+        if subset is not None and max_workers > 1 and len(subset) > 1:
+            for item in subset:
+                if item not in self.subset_mapping:
+                    self.module.fail_json(
+                        msg="subset_mapping do not have details for '{0}'"
+                            .format(item))
+                    return
+            self.update_result_with_item_lists(
+                subset, filter_dict=filter_dict, all_pages=all_pages,
+                max_workers=max_workers)
+        elif subset is not None:
             for item in subset:
                 if item in self.subset_mapping:
                     self.update_result_with_item_list(
@@ -2409,6 +3466,35 @@ def get_powerstore_info_parameters():
        PowerStore"""
     return dict(
         all_pages=dict(type='bool', required=False, default=False),
+        max_workers=dict(type='int', required=False, default=1),
+        page_workers=dict(type='int', required=False, default=1),
+        expand=dict(type='list', required=False, elements='str',
+                    choices=list(RELATIONSHIPS)),
+        arrays=dict(
+            type='list', required=False, elements='dict',
+            options=dict(array_ip=dict(type='str', required=True),
+                         user=dict(type='str'),
+                         password=dict(type='str', no_log=True),
+                         port=dict(type='int'),
+                         validate_certs=dict(type='bool',
+                                             aliases=['verifycert']),
+                         timeout=dict(type='int'))),
+        array_workers=dict(type='int', required=False, default=4),
+        include_acl=dict(type='bool', required=False, default=True),
+        acl_workers=dict(type='int', required=False, default=4),
+        acl_timeout=dict(type='int', required=False),
+        fields=dict(type='dict', required=False),
+        output_path=dict(type='path', required=False),
+        compress_output=dict(type='bool', required=False, default=False),
+        aggregate=dict(
+            type='list', required=False, elements='dict',
+            options=dict(subset=dict(type='str', required=True),
+                         function=dict(type='str', required=True,
+                                       choices=['count', 'sum', 'min',
+                                                'max']),
+                         field=dict(type='str', required=False),
+                         group_by=dict(type='list', required=False,
+                                       elements='str'))),
         gather_subset=dict(
             type='list', required=True, elements='str',
             choices=['vol', 'vg', 'host', 'hg', 'node', 'protection_policy',
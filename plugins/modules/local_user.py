@@ -173,6 +173,8 @@ local_user_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import cache
 
 LOG = utils.get_logger('local_user')
 
@@ -219,7 +221,8 @@ class PowerStoreLocalUser(object):
         if IS_SUPPORTED_PY4PS_VERSION is False:
             self.module.fail_json(msg=VERSION_ERROR)
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        self.conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         msg = 'Got Py4ps instance for provisioning on ' \
               'PowerStore {0}'.format(self.conn)
@@ -340,7 +343,9 @@ class PowerStoreLocalUser(object):
     def get_clusters(self):
         """Get the clusters"""
         try:
-            clusters = self.provisioning.get_cluster_list()
+            clusters = cache.cached_call(
+                self.module.params, 'clusters',
+                self.provisioning.get_cluster_list)
             return clusters
 
         except Exception as e:
@@ -541,7 +541,8 @@ class PowerStoreNetwork(object):
         if IS_SUPPORTED_PY4PS_VERSION is False:
             self.module.fail_json(msg=VERSION_ERROR)
 
-        self.conn = utils.get_powerstore_connection(self.module.params)
+        self.conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         self.configuration = self.conn.config_mgmt
         self.provisioning = self.conn.provisioning
         LOG.info('Got Py4ps instance for configuration on PowerStore %s',
@@ -369,6 +369,8 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.compat.version import LooseVersion
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import resolver
 
 LOG = utils.get_logger('nfs', log_devel=logging.INFO)
 
@@ -425,10 +427,16 @@ class PowerStoreNfsExport(object):
         if not IS_SUPPORTED_PY4PS_VERSION:
             self.module.fail_json(msg=VERSION_ERROR)
 
-        self.py4ps_conn = utils.get_powerstore_connection(self.module.params)
+        self.py4ps_conn = utils.get_powerstore_connection(
+            self.module.params, module=self.module)
         self.provisioning = self.py4ps_conn.provisioning
         LOG.info('Got Py4ps instance for PowerStore')
 
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.py4ps_conn, self.module.params)
+
     def get_nas_server_id(self, nas_server_name=None, nas_server_id=None):
         """Get the id of the NAS server."""
 
@@ -436,8 +444,8 @@ class PowerStoreNfsExport(object):
             nas_server_name
         try:
             if nas_server_name is not None:
-                nas_server_details = self.provisioning.get_nas_server_by_name(
-                    nas_server_name=nas_server_name)
+                nas_server_details = self.name_resolver.find(
+                    'nas_server', [nas_server_name])[nas_server_name]
             else:
                 nas_server_details = self.provisioning.get_nas_server_details(
                     nas_server_id=nas_server_id)
@@ -479,8 +487,9 @@ class PowerStoreNfsExport(object):
                     LOG.error(error_msg)
                     self.module.fail_json(msg=error_msg)
 
-                fs = self.provisioning.get_filesystem_by_name(
-                    filesystem_name=filesystem, nas_server_id=nas_server_id)
+                fs = self.name_resolver.find(
+                    'filesystem', [filesystem],
+                    nas_server_id=nas_server_id)[filesystem]
                 if fs:
                     return fs[0]['id']
             else:
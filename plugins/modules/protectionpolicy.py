@@ -224,6 +224,8 @@ protectionpolicy_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
 import logging
 
 LOG = utils.get_logger(
@@ -270,7 +272,7 @@ class PowerstoreProtectionpolicy(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         LOG.info('Got Py4ps instance for provisioning on PowerStore %s',
                  self.provisioning)
@@ -493,7 +495,9 @@ class PowerstoreProtectionpolicy(object):
     def get_clusters(self):
         """Get the clusters"""
         try:
-            clusters = self.provisioning.get_cluster_list()
+            clusters = cache.cached_call(
+                self.module.params, 'clusters',
+                self.provisioning.get_cluster_list)
             return clusters
 
         except Exception as e:
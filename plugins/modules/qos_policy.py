@@ -192,7 +192,7 @@ class PowerStoreQosPolicy(object):
 
         self.result = {"changed": False}
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         self.protection = self.conn.protection
         self.configuration = self.conn.config_mgmt
@@ -112,6 +112,84 @@ options:
         type: str
         default: 'GB'
         choices: ['GB', 'TB']
+  quotas:
+    description:
+    - List of the quotas of I(quota_type) to be reconciled on I(filesystem) in
+      one run, with I(state).
+    - All the tree quotas, and for user quotas all the user quotas of the
+      filesystem, are fetched once and indexed by path, or by user and tree
+      quota, so that only the quotas whose limits or description differ
+      are created or modified.
+    - The quotas are created, modified or deleted concurrently, by up to
+      I(max_workers) parallel requests.
+    - The options of an item which are not given default to the module
+      options I(path) and I(description), and to the limits of I(quota).
+    - Mutually exclusive with I(quota_id), I(quotas_file) and the user
+      options.
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      uid:
+        description:
+        - The ID of the unix user account of a user quota.
+        type: int
+      unix_name:
+        description:
+        - The name of the unix user account of a user quota.
+        type: str
+      windows_name:
+        description:
+        - The name of the Windows User of a user quota, along with its Domain
+          Name as 'DOMAIN_NAME\user_name'.
+        type: str
+      windows_sid:
+        description:
+        - The SID of the Windows User account of a user quota.
+        type: str
+      path:
+        description:
+        - The path of a tree quota, or of the tree quota of a user quota.
+        type: str
+      description:
+        description:
+        - Additional information of a tree quota.
+        type: str
+      soft_limit:
+        description:
+        - Soft limit of the quota.
+        - No Soft limit when set to C(0).
+        type: int
+      hard_limit:
+        description:
+        - Hard limit of the quota.
+        - No hard limit when set to C(0).
+        type: int
+      cap_unit:
+        description:
+        - Unit of storage for the hard and soft limits.
+        - Defaults to the I(cap_unit) of I(quota), or C(GB).
+        type: str
+        choices: ['GB', 'TB']
+  quotas_file:
+    description:
+    - Path of a CSV file on the managed node giving the quotas to be
+      reconciled as with I(quotas).
+    - Its header row names the columns, which are the options of the items
+      of I(quotas). Empty cells are not given.
+    - The file is read row by row, so that the desired quotas of many users
+      do not have to be passed as module arguments.
+    - Mutually exclusive with I(quota_id), I(quotas) and the user options.
+    type: path
+    version_added: '3.10.0'
+  max_workers:
+    description:
+    - Maximum number of quotas of I(quotas) or I(quotas_file) to be created,
+      modified or deleted concurrently.
+    - If set to C(1), the changes are made one after another.
+    type: int
+    default: 4
+    version_added: '3.10.0'
   state:
     description:
     - Define whether the Quota should exist or not.
@@ -215,6 +293,40 @@ EXAMPLES = r'''
     filesystem: "sample_fs"
     nas_server: "sample_nas_server"
     state: "absent"
+
+- name: Reconcile the User Quotas of a filesystem in one run
+  dellemc.powerstore.quota:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    quota_type: "user"
+    filesystem: "sample_fs"
+    nas_server: "sample_nas_server"
+    quota:
+      soft_limit: 5
+      hard_limit: 10
+      cap_unit: "GB"
+    quotas:
+      - unix_name: "user_1"
+      - uid: 1002
+        hard_limit: 20
+      - windows_name: "DOMAIN\\user_3"
+        path: "/home"
+    max_workers: 8
+    state: "present"
+
+- name: Reconcile the User Quotas of a filesystem from a CSV file
+  dellemc.powerstore.quota:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    quota_type: "user"
+    filesystem: "{{filesystem_id}}"
+    # Columns such as uid,soft_limit,hard_limit,cap_unit
+    quotas_file: "/data/home_quotas.csv"
+    state: "present"
 '''
 
 RETURN = r'''
@@ -345,11 +457,72 @@ quota_details:
         "soft_limit_GB": "50.0",
         "state": "Ok"
     }
+
+quotas:
+    description: Outcome of every quota of I(quotas) or I(quotas_file), in
+                 the same order.
+    returned: When I(quotas) or I(quotas_file) is given
+    type: list
+    elements: dict
+    contains:
+        action:
+            description: The action taken on the quota, if any.
+            type: str
+            choices: [create, modify, delete]
+        changed:
+            description: Whether the quota has changed.
+            type: bool
+        error:
+            description: Error of the action on the quota, if it failed.
+            type: str
+        uid:
+            description: The uid of a user quota given by uid.
+            type: int
+        unix_name:
+            description: The unix name of a user quota given by unix name.
+            type: str
+        windows_name:
+            description: The windows name of a user quota given by windows
+                         name.
+            type: str
+        windows_sid:
+            description: The windows SID of a user quota given by windows
+                         SID.
+            type: str
+        path:
+            description: The path of a tree quota, or of the tree quota of a
+                         user quota.
+            type: str
+        quota_details:
+            description: Details of the quota, with its ID, path or user,
+                         description and limits. Not returned if I(state) is
+                         C(absent).
+            type: dict
+    sample: [
+        {
+            "uid": 1002,
+            "action": "modify",
+            "changed": true,
+            "quota_details": {
+                "id": "00000006-08f2-0000-0200-000000000000",
+                "tree_quota_id": null,
+                "uid": 1002,
+                "unix_name": null,
+                "windows_name": null,
+                "windows_sid": null,
+                "hard_limit": 21474836480,
+                "soft_limit": 5368709120
+            }
+        }
+    ]
 '''
 
+import csv
 import logging
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import resolver
 from ansible.module_utils.basic import AnsibleModule
 
 LOG = utils.get_logger('quota', log_devel=logging.INFO)
@@ -362,6 +535,20 @@ py4ps_version = utils.py4ps_version_check()
 IS_SUPPORTED_PY4PS_VERSION = py4ps_version['supported_version']
 VERSION_ERROR = py4ps_version['unsupported_version_message']
 
+# Fields of the quotas listed to reconcile the items of quotas
+BULK_TREE_QUOTA_SELECT = 'id,path,description,hard_limit,soft_limit,' \
+                         'is_user_quotas_enforced'
+BULK_USER_QUOTA_SELECT = 'id,tree_quota_id,uid,unix_name,windows_name,' \
+                         'windows_sid,hard_limit,soft_limit'
+# Key of the cells of a row of quotas_file beyond its header
+EXTRA_CELLS = '_extra_cells'
+# Fields identifying the user of a user quota
+USER_KEYS = ('uid', 'unix_name', 'windows_name', 'windows_sid')
+# Fields of the items of quotas, which are the columns of quotas_file
+BULK_QUOTA_FIELDS = USER_KEYS + ('path', 'description', 'soft_limit',
+                                 'hard_limit', 'cap_unit')
+BULK_QUOTA_INT_FIELDS = ('uid', 'soft_limit', 'hard_limit')
+
 
 class PowerStoreQuota(object):
     """Class with Quota operations"""
@@ -382,6 +569,12 @@ class PowerStoreQuota(object):
              'quota_id']
         ]
 
+        for option in ('quotas', 'quotas_file'):
+            mut_ex_args.extend([option, other] for other in (
+                'quota_id', 'uid', 'windows_name', 'windows_sid',
+                'unix_name'))
+        mut_ex_args.append(['quotas', 'quotas_file'])
+
         required_one_of = [['quota_id', 'quota_type']]
         self.module = AnsibleModule(
             argument_spec=self.module_params,
@@ -408,12 +601,17 @@ class PowerStoreQuota(object):
         self.result = {"changed": False, "quota_details": {}}
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         msg = 'Got Py4Ps instance for provisioning on' \
               ' PowerStore {0}'.format(self.conn)
         LOG.info(msg)
 
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.conn, self.module.params)
+
     def get_nas_server_id(self, nas_server):
         """
         Get the NAS Server ID
@@ -423,8 +621,8 @@ class PowerStoreQuota(object):
         nas_server_id = nas_server
         if nas_server and utils.name_or_id(nas_server) == "NAME":
             try:
-                nas_server_id = self.provisioning.get_nas_server_by_name(
-                    nas_server)[0]['id']
+                nas_server_id = self.name_resolver.find(
+                    'nas_server', [nas_server])[nas_server][0]['id']
                 return nas_server_id
             except Exception as e:
                 error_msg = "Failed to get details of NAS server {0} with" \
@@ -459,8 +657,9 @@ class PowerStoreQuota(object):
                         " Please enter NAS Server Name/ID")
             nas_server_id = self.get_nas_server_id(nas_server)
             try:
-                fs_details = self.provisioning.get_filesystem_by_name(
-                    filesystem, nas_server_id)
+                fs_details = self.name_resolver.find(
+                    'filesystem', [filesystem],
+                    nas_server_id=nas_server_id)[filesystem]
                 if not fs_details:
                     self.module.fail_json(
                         msg="No File System found with "
@@ -905,6 +1104,271 @@ class PowerStoreQuota(object):
                         " white spaces is not allowed. "
                         "Please enter a valid description")
 
+    def get_filesystem_quota_indexes(self, quota_type, filesystem_id):
+        """
+        Get the quotas of a filesystem indexed for the items of quotas.
+        :return: Tuple of the dict of the tree quotas by path, and of the
+                 dict of the user quotas by user and tree quota ID
+        """
+        trees = dict((quota['path'], quota) for quota in
+                     self.get_filesystem_quotas(
+                         self.provisioning.get_file_tree_quotas,
+                         BULK_TREE_QUOTA_SELECT, filesystem_id))
+        users = {}
+        if quota_type == 'user':
+            for quota in self.get_filesystem_quotas(
+                    self.provisioning.get_file_user_quotas,
+                    BULK_USER_QUOTA_SELECT, filesystem_id):
+                for field in USER_KEYS:
+                    if quota.get(field) not in (None, ''):
+                        users[get_user_key(field, quota[field],
+                                           quota.get('tree_quota_id'))] = quota
+        return trees, users
+
+    def get_filesystem_quotas(self, list_quotas, select, filesystem_id):
+        """Get all the quotas of a filesystem with one listing of the SDK
+           function list_quotas"""
+        try:
+            return list_quotas(
+                filter_dict={'select': select,
+                             'file_system_id': 'eq.{0}'.format(filesystem_id)},
+                all_pages=True) or []
+        except Exception as e:
+            error_msg = "Get quotas of filesystem {0} failed with error: " \
+                        "{1}".format(self.module.params['filesystem'], str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+
+    def read_quotas_file(self, quotas_file):
+        """Read the rows of a CSV file of quotas, whose header names the
+           fields of the items of quotas"""
+        try:
+            with open(quotas_file, 'r') as csv_file:
+                reader = csv.DictReader(csv_file, restkey=EXTRA_CELLS)
+                unknown = set(reader.fieldnames or []) - \
+                    set(BULK_QUOTA_FIELDS)
+                if unknown:
+                    self.module.fail_json(
+                        msg="Unknown columns in quotas_file: {0}".format(
+                            ', '.join(sorted(unknown))))
+                for row in reader:
+                    if EXTRA_CELLS in row:
+                        self.module.fail_json(
+                            msg="Line {0} of quotas_file has more cells than "
+                                "its header".format(reader.line_num))
+                    item = dict.fromkeys(BULK_QUOTA_FIELDS)
+                    for field, value in row.items():
+                        value = value.strip() if value else None
+                        if value and field in BULK_QUOTA_INT_FIELDS:
+                            try:
+                                value = int(value)
+                            except ValueError:
+                                self.module.fail_json(
+                                    msg="Invalid {0} {1} in line {2} of "
+                                        "quotas_file".format(
+                                            field, value, reader.line_num))
+                        item[field] = None if value == '' else value
+                    yield item
+        except (IOError, OSError, csv.Error) as e:
+            error_msg = "Reading quotas_file {0} failed with error: " \
+                        "{1}".format(quotas_file, str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg)
+
+    def get_bulk_quota_items(self, quota_params):
+        """Get the items of quotas or quotas_file, with the module options
+           as defaults and the limits in bytes"""
+        quota_type = quota_params['quota_type']
+        default_quota = quota_params['quota'] or {}
+        if quota_params['quotas'] is not None:
+            rows = (dict(quota) for quota in quota_params['quotas'])
+        else:
+            rows = self.read_quotas_file(quota_params['quotas_file'])
+        items = []
+        for item in rows:
+            for option in ('path', 'description'):
+                if item.get(option) is None:
+                    item[option] = quota_params[option]
+            for option in ('soft_limit', 'hard_limit'):
+                if item.get(option) is None:
+                    item[option] = default_quota.get(option)
+            item['cap_unit'] = item.get('cap_unit') or \
+                default_quota.get('cap_unit') or 'GB'
+            if item['cap_unit'] not in ('GB', 'TB'):
+                self.module.fail_json(msg="Invalid cap_unit {0} of quotas, "
+                                          "must be GB or TB".format(
+                                              item['cap_unit']))
+            limits = self.convert_quota_thresholds(dict(
+                soft_limit=item['soft_limit'], hard_limit=item['hard_limit'],
+                cap_unit=item['cap_unit']))
+            item.update(soft_limit=limits['soft_limit'],
+                        hard_limit=limits['hard_limit'])
+            users = [key for key in USER_KEYS if item.get(key) is not None]
+            if quota_type == 'user' and len(users) != 1:
+                self.module.fail_json(
+                    msg="One of uid/unix_name/windows_name/windows_sid is "
+                        "required for every user quota of quotas")
+            if quota_type == 'tree' and (users or not item['path']):
+                self.module.fail_json(
+                    msg="path is required and uid/unix_name/windows_sid/"
+                        "windows_name are not valid for every tree quota of "
+                        "quotas")
+            if quota_type == 'user' and item['description']:
+                self.module.fail_json(
+                    msg="Description parameter is not valid for User Quota.")
+            if item.get('windows_name'):
+                if '\\' not in item['windows_name']:
+                    self.module.fail_json(
+                        msg="Please enter domain name and user name in the "
+                            "windows_name of quotas.")
+                domain, user_name = item['windows_name'].split('\\', 1)
+                item['windows_name'] = domain.upper() + '\\' + user_name
+            items.append(item)
+        keys = [str(get_item_key(item, quota_type)) for item in items]
+        duplicates = sorted(set(key for key in keys if keys.count(key) > 1))
+        if duplicates:
+            self.module.fail_json(msg='; '.join(
+                'Quota {0} is given more than once'.format(key)
+                for key in duplicates))
+        return items
+
+    def plan_bulk_quota(self, item, quota_type, trees, users, state):
+        """
+        Plan the reconciliation of a quota with its item of quotas.
+        :param trees: Dict of the tree quotas of the filesystem, by path
+        :param users: Dict of the user quotas of the filesystem, by user and
+                      tree quota ID
+        :return: Dict of the action, if any, and of its parameters
+        :raises ValueError: If the quota cannot be reconciled
+        """
+        path = item['path']
+        key = get_item_key(item, quota_type)
+        quota = find_quota(key, trees, users)
+        if quota_type == 'tree':
+            if state == 'absent':
+                return dict(key=key, quota=quota, params={}, path=path,
+                            action='delete' if quota else None)
+            params = create_params_dict(description=item['description'],
+                                        hard_limit=item['hard_limit'],
+                                        soft_limit=item['soft_limit'])
+        else:
+            field = [user for user in USER_KEYS if user in key][0]
+            if 'path' in key and path not in trees:
+                raise ValueError("No Tree Quota with path = {0} in "
+                                 "filesystem = {1} exists, cannot create "
+                                 "user quota {2} on a tree quota.".format(
+                                     path, self.module.params['filesystem'],
+                                     item[field]))
+            params = create_params_dict(hard_limit=item['hard_limit'],
+                                        soft_limit=item['soft_limit'])
+            if not quota:
+                tree_quota_id = trees[path]['id'] if 'path' in key else None
+                params.update(create_params_dict(tree_quota_id=tree_quota_id,
+                                                 **{field: item[field]}))
+
+        if not quota:
+            return dict(key=key, quota=None, params=params, action='create',
+                        path=path)
+        if not to_modify(params.get('description'), params.get('hard_limit'),
+                         params.get('soft_limit'), quota):
+            return dict(key=key, quota=quota, params={}, action=None,
+                        path=path)
+        return dict(key=key, quota=quota, params=params, action='modify',
+                    path=path)
+
+    def apply_bulk_quota(self, plan, quota_type, filesystem_id):
+        """Apply the action planned for a quota of quotas, returning the ID
+           of the quota"""
+        LOG.info('Applying %s of %s quota %s', plan['action'], quota_type,
+                 plan['key'])
+        if plan['action'] == 'create' and quota_type == 'tree':
+            return self.provisioning.create_tree_quota(
+                filesystem_id, plan['path'],
+                tree_quota_params=plan['params'])['id']
+        if plan['action'] == 'create':
+            return self.provisioning.create_user_quota(
+                file_system_id=filesystem_id,
+                user_quota_params=plan['params'])['id']
+        if plan['action'] == 'modify' and quota_type == 'tree':
+            self.provisioning.update_tree_quota(
+                plan['quota']['id'], tree_quota_params=plan['params'])
+        elif plan['action'] == 'modify':
+            self.provisioning.update_user_quota(
+                user_quota_id=plan['quota']['id'],
+                user_quota_params=plan['params'])
+        else:
+            self.provisioning.delete_tree_quota(plan['quota']['id'])
+        return plan['quota']['id']
+
+    def prepare_bulk_quotas(self, pending, quota_type, filesystem_id, trees):
+        """Enable the quotas of the filesystem, and the user quotas of the
+           tree quotas on which user quotas are created, once before the
+           quotas are created or modified"""
+        if any(plan['action'] != 'delete' for plan in pending):
+            self.enable_quotas(filesystem_id)
+        if quota_type != 'user':
+            return
+        paths = set(plan['path'] for plan in pending
+                    if plan['action'] == 'create' and
+                    plan['params'].get('tree_quota_id'))
+        for path in sorted(paths):
+            if not trees[path].get('is_user_quotas_enforced'):
+                try:
+                    self.provisioning.update_tree_quota(
+                        trees[path]['id'], {'is_user_quotas_enforced': True})
+                except Exception as e:
+                    error_message = "Unable to enforce user quotas on tree " \
+                                    "quotas, failed with error: {0}".format(
+                                        str(e))
+                    LOG.error(error_message)
+                    self.module.fail_json(msg=error_message,
+                                          **utils.failure_codes(e))
+
+    def perform_bulk_operation(self):
+        """
+        Reconcile the quotas of quotas or quotas_file with the quotas of a
+        filesystem, which are fetched once and indexed
+        """
+        params = self.module.params
+        quota_type = params['quota_type']
+        state = params['state']
+        if params['max_workers'] < 1:
+            self.module.fail_json(msg="max_workers should be a positive "
+                                      "integer")
+        if not quota_type or not params['filesystem']:
+            self.module.fail_json(msg="quota_type and filesystem are required "
+                                      "with quotas or quotas_file")
+        if quota_type == 'user' and state == 'absent':
+            self.module.fail_json(msg="Deletion of User Quota is not "
+                                      "supported.")
+        self.validate_description(params['description'])
+        filesystem_id = self.get_filesystem_id(params['filesystem'],
+                                               params['nas_server'])
+        items = self.get_bulk_quota_items(params)
+        trees, users = self.get_filesystem_quota_indexes(quota_type,
+                                                         filesystem_id)
+
+        def get_details(plans, applied):
+            if state == 'absent':
+                return [{}] * len(plans)
+            indexes = (trees, users)
+            if applied:
+                indexes = self.get_filesystem_quota_indexes(quota_type,
+                                                            filesystem_id)
+            return [dict(quota_details=find_quota(plan['key'], *indexes))
+                    for plan in plans]
+
+        utils.reconcile_in_bulk(
+            self.module, items,
+            lambda item: self.plan_bulk_quota(item, quota_type, trees, users,
+                                              state),
+            lambda plan: self.apply_bulk_quota(plan, quota_type,
+                                               filesystem_id),
+            lambda plan: plan['key'], params['max_workers'], 'quotas',
+            get_details=get_details, get_diff=get_bulk_quota_diff,
+            prepare=lambda pending: self.prepare_bulk_quotas(
+                pending, quota_type, filesystem_id, trees))
+
     def perform_module_operation(self):
         """
         Perform different actions on  Quota module based on parameters
@@ -1025,6 +1489,72 @@ def to_modify(description, hard_limit, soft_limit, quota_details):
     return False
 
 
+def get_item_key(item, quota_type):
+    """
+    Get the fields identifying the quota of an item of quotas.
+    :return: Dict of the path of a tree quota, or of the field identifying
+             the user of a user quota and of the path of its tree quota, if
+             any
+    """
+    path = item['path']
+    if quota_type == 'tree':
+        return dict(path=path)
+    field = [user for user in USER_KEYS if item[user] is not None][0]
+    key = {field: item[field]}
+    if path and path != '/':
+        key['path'] = path
+    return key
+
+
+def get_bulk_quota_diff(plans):
+    """Get the diff of the quotas of the plans of quotas"""
+    before = {}
+    after = {}
+    for plan in plans:
+        name = ', '.join(str(value) for value in plan['key'].values())
+        quota = plan['quota'] or {}
+        before[name] = quota
+        if plan['action'] == 'delete':
+            after[name] = {}
+        else:
+            after[name] = dict(quota, **plan['params'])
+    return dict(before=before, after=after)
+
+
+def find_quota(key, trees, users):
+    """
+    Find the quota identified by the key of an item of quotas.
+    :param trees: Dict of the tree quotas of the filesystem, by path
+    :param users: Dict of the user quotas of the filesystem, by user and
+                  tree quota ID
+    :return: The quota, or None
+    """
+    fields = [field for field in USER_KEYS if field in key]
+    if not fields:
+        return trees.get(key['path'])
+    tree_quota_id = None
+    if 'path' in key:
+        if key['path'] not in trees:
+            return None
+        tree_quota_id = trees[key['path']]['id']
+    return users.get(get_user_key(fields[0], key[fields[0]], tree_quota_id))
+
+
+def get_user_key(field, value, tree_quota_id):
+    """
+    Get the key of a user quota in the index of the user quotas.
+    :param field: The field identifying the user
+    :param value: The value of the field, windows names being matched
+                  regardless of their case
+    :param tree_quota_id: ID of the tree quota of the user quota, if any
+    :return: Tuple of the field, the value and the tree quota ID
+    """
+    value = str(value)
+    if field == 'windows_name':
+        value = value.lower()
+    return field, value, tree_quota_id or None
+
+
 def create_params_dict(**kwargs):
     """
     Create a dictionary of the parameters
@@ -1072,7 +1602,15 @@ def get_powerstore_quota_parameters():
                 cap_unit=dict(choices=['GB', 'TB'], default='GB')
             ),
         ),
-        state=dict(required=True, choices=['present', 'absent'])
+        state=dict(required=True, choices=['present', 'absent']),
+        quotas=dict(
+            type='list', elements='dict', options=dict(
+                uid=dict(type='int'), unix_name=dict(), windows_name=dict(),
+                windows_sid=dict(), path=dict(), description=dict(),
+                soft_limit=dict(type='int'), hard_limit=dict(type='int'),
+                cap_unit=dict(choices=['GB', 'TB']))),
+        quotas_file=dict(type='path'),
+        max_workers=dict(type='int', default=4)
     )
 
 
@@ -1081,7 +1619,11 @@ def main():
     based on user input from playbook"""
 
     obj = PowerStoreQuota()
-    obj.perform_module_operation()
+    if isinstance(obj.module.params['quotas'], list) or \
+            isinstance(obj.module.params['quotas_file'], str):
+        obj.perform_bulk_operation()
+    else:
+        obj.perform_module_operation()
 
 
 if __name__ == '__main__':
@@ -218,6 +218,10 @@ replication_session_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import resolver
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import cache
 
 LOG = utils.get_logger('replicationsession')
 
@@ -306,7 +310,7 @@ class PowerstoreReplicationSession(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         LOG.info('Got Py4ps instance for provisioning on PowerStore %s',
                  self.provisioning)
@@ -456,11 +460,16 @@ class PowerstoreReplicationSession(object):
             if nas_id:
                 return nas_id
 
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.conn, self.module.params)
+
     def get_volume_id(self, vol):
         """Get volume ID."""
         try:
             if utils.name_or_id(vol) == "NAME":
-                vol_details = self.provisioning.get_volume_by_name(vol)
+                vol_details = self.name_resolver.find('volume', [vol])[vol]
                 msg = f"Volume details {vol_details} fetched by volume" \
                       f" name {vol}"
                 LOG.info(msg)
@@ -489,8 +498,8 @@ class PowerstoreReplicationSession(object):
         """Get Volume group ID"""
         try:
             if utils.name_or_id(vol_grp) == "NAME":
-                vol_grp_details = \
-                    self.provisioning.get_volume_group_by_name(vol_grp)
+                vol_grp_details = self.name_resolver.find(
+                    'volume_group', [vol_grp])[vol_grp]
                 msg = f"Volume group details {vol_grp_details} fetched by" \
                       f" volume group name {vol_grp}"
                 LOG.info(msg)
@@ -611,7 +620,9 @@ class PowerstoreReplicationSession(object):
     def get_clusters(self):
         """Get the clusters"""
         try:
-            clusters = self.provisioning.get_cluster_list()
+            clusters = cache.cached_call(
+                self.module.params, 'clusters',
+                self.provisioning.get_cluster_list)
             return clusters
 
         except Exception as e:
@@ -153,7 +153,7 @@ class PowerStoreRole(object):
         self.result = {"changed": False, "role_details": {}}
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         msg = 'Got Py4Ps instance for provisioning on' \
               ' PowerStore {0}'.format(self.conn)
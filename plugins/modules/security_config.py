@@ -144,7 +144,7 @@ class PowerStoreSecurityConfig(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
 
         self.configuration = self.conn.config_mgmt
         msg = 'Got Py4ps instance for configuration on' \
@@ -441,6 +441,8 @@ smb_share_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import resolver
 import logging
 
 LOG = utils.get_logger('smbshare', log_devel=logging.INFO)
@@ -496,13 +498,18 @@ class PowerStoreSMBShare(object):
         self.result = {"changed": False, "smb_share_details": {}}
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
 
         self.provisioning = self.conn.provisioning
         msg = 'Got Py4Ps instance for provisioning on' \
               ' PowerStore {0}'.format(self.conn)
         LOG.info(msg)
 
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.conn, self.module.params)
+
     def get_smb_share(self, share_id, share_name,
                       smb_parent, nas_server, path):
         """Get SMB share details"""
@@ -588,8 +595,8 @@ class PowerStoreSMBShare(object):
         nas_server_id = nas_server
         if nas_server and utils.name_or_id(nas_server) == "NAME":
             try:
-                nas_server_id = self.provisioning.get_nas_server_by_name(
-                    nas_server)[0]['id']
+                nas_server_id = self.name_resolver.find(
+                    'nas_server', [nas_server])[nas_server][0]['id']
             except Exception as e:
                 error_msg = "Failed to get details of NAS server {0} with" \
                             " error: {1}".format(nas_server, str(e))
@@ -610,8 +617,9 @@ class PowerStoreSMBShare(object):
         fs_details = None
         if smb_parent and utils.name_or_id(smb_parent) == "NAME":
             try:
-                fs_details = self.provisioning.get_filesystem_by_name(
-                    smb_parent, nas_server_id)
+                fs_details = self.name_resolver.find(
+                    'filesystem', [smb_parent],
+                    nas_server_id=nas_server_id)[smb_parent]
                 if not fs_details:
                     self.module.fail_json(
                         msg="No File System/Snapshot found with "
@@ -370,6 +370,8 @@ import logging
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import resolver
 from datetime import datetime, timedelta
 
 LOG = utils.get_logger('snapshot',
@@ -422,7 +424,7 @@ class PowerStoreSnapshot(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.py4ps_conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.protection = self.py4ps_conn.protection
         self.provisioning = self.py4ps_conn.provisioning
         LOG.info('Got Py4ps instance for PowerStore')
@@ -508,6 +510,11 @@ class PowerStoreSnapshot(object):
             LOG.info(msg)
             self.module.fail_json(msg=msg, **utils.failure_codes(e))
 
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.py4ps_conn, self.module.params)
+
     def get_vol_id_from_volume(self, volume):
         """Maps the volume to volume ID"""
 
@@ -521,8 +528,7 @@ class PowerStoreSnapshot(object):
                          "Error: %s", volume, str(e))
 
         try:
-            vol = \
-                self.provisioning.get_volume_by_name(volume)
+            vol = self.name_resolver.find('volume', [volume])[volume]
             if vol:
                 return vol[0]['id']
             else:
@@ -547,8 +553,8 @@ class PowerStoreSnapshot(object):
                          "name. Error %s", volume_group, str(e))
 
         try:
-            vg = \
-                self.provisioning.get_volume_group_by_name(volume_group)
+            vg = self.name_resolver.find(
+                'volume_group', [volume_group])[volume_group]
             if vg:
                 return vg[0]['id']
             else:
@@ -398,7 +398,7 @@ class PowerStoreStorageContainer(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.configuration = self.conn.config_mgmt
         self.protection = self.conn.protection
         msg = 'Got Py4ps instance for configuration {0} and protection {1}' \
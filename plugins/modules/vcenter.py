@@ -241,7 +241,7 @@ class PowerstoreVCenter(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.configuration = self.conn.config_mgmt
 
         LOG.info('Got Py4ps instance for configuration on PowerStore'
@@ -175,8 +175,63 @@ options:
     - Value C(unmapped) - indicates that the volume should not be mapped to the
       host or host group.
     - Only one of a host or host group can be supplied in one call.
+    - Also defines the state of the mappings in I(mappings).
     choices: [mapped, unmapped]
     type: str
+  mappings:
+    description:
+    - Matrix of the mappings of volumes to hosts and host groups to be
+      reconciled in one run, with I(mapping_state).
+    - Every volume of an item is mapped to or unmapped from every host and
+      host group of the item.
+    - The volumes, hosts and host groups of all the items are resolved at
+      once, and the current mappings of the hosts and host groups are
+      fetched with a few filtered listings, so that only the required attach
+      or detach calls are made.
+    - The mapping fails before any call is made if a given HLU is already
+      used on one of the hosts or host groups by another volume.
+    - The calls are made concurrently, by up to I(max_workers) parallel
+      requests.
+    - Mutually exclusive with I(vol_name), I(vol_id) and I(volumes).
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      volumes:
+        description:
+        - Names or IDs of the volumes.
+        type: list
+        elements: str
+        required: true
+      hosts:
+        description:
+        - Names or IDs of the hosts.
+        type: list
+        elements: str
+      hostgroups:
+        description:
+        - Names or IDs of the host groups.
+        type: list
+        elements: str
+      hlus:
+        description:
+        - Logical unit numbers of the volumes, in the order of I(volumes).
+        - The HLU of a volume is the same on all the hosts and host groups of
+          the item.
+        - If not given, the HLUs are assigned by the array.
+        - Modification of the HLU of a mapped volume is not supported.
+        type: list
+        elements: int
+  max_workers:
+    description:
+    - Maximum number of volumes in I(volumes) to be created, modified or
+      deleted concurrently, or of mappings in I(mappings) to be attached or
+      detached concurrently.
+    - If set to C(1), the changes are made one after another.
+    - Used only with I(volumes) or I(mappings).
+    type: int
+    default: 4
+    version_added: '3.10.0'
   new_name:
     description:
     - The new volume name for the volume, used in case of rename
@@ -273,6 +328,94 @@ options:
     - Required when creating a volume. All other functionalities on a volume
       are supported using volume name or ID.
     type: str
+  volumes:
+    description:
+    - List of volumes to be reconciled in one run, with I(state).
+    - The volume groups, protection policies, QoS policies and appliances
+      of all the volumes are resolved once, and the existing volumes are
+      fetched with a few filtered listings.
+    - The volumes are then created, modified or deleted concurrently, by up
+      to I(max_workers) parallel requests.
+    - The options of an item which are not given default to the module
+      options of the same name.
+    - Mapping, clone, refresh, restore and metro operations are not
+      supported with I(volumes).
+    - Mutually exclusive with I(vol_name) and I(vol_id).
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      vol_name:
+        description:
+        - Unique name of the volume.
+        type: str
+        required: true
+      size:
+        description:
+        - Size of the volume, required to create it.
+        type: float
+      cap_unit:
+        description:
+        - Unit of I(size). It defaults to C(GB).
+        choices: [MB, GB, TB]
+        type: str
+      description:
+        description:
+        - Description of the volume.
+        type: str
+      vg_name:
+        description:
+        - Name or ID of the volume group of the volume, assigned when it is
+          created.
+        type: str
+      performance_policy:
+        description:
+        - The performance policy of the volume.
+        choices: [high, medium, low]
+        type: str
+      protection_policy:
+        description:
+        - Name or ID of the protection policy of the volume.
+        - The policy is removed by passing an empty string.
+        type: str
+      qos_performance_policy:
+        description:
+        - Name or ID of the QoS performance policy of the volume.
+        - The policy is removed by passing an empty string.
+        type: str
+      app_type:
+        description:
+        - Application type to indicate the intended use of the volume.
+        choices: [Relational_Databases_Other, Relational_Databases_Oracle,
+          Relational_Databases_SQL_Server, Relational_Databases_PostgreSQL,
+          Relational_Databases_MySQL, Relational_Databases_IBM_DB2,
+          Big_Data_Analytics_Other, Big_Data_Analytics_MongoDB,
+          Big_Data_Analytics_Cassandra, Big_Data_Analytics_SAP_HANA,
+          Big_Data_Analytics_Spark, Big_Data_Analytics_Splunk,
+          Big_Data_Analytics_ElasticSearch, Business_Applications_Other,
+          Business_Applications_ERP_SAP, Business_Applications_CRM,
+          Business_Applications_Exchange, Business_Applications_Sharepoint,
+          Healthcare_Other, Healthcare_Epic, Healthcare_MEDITECH,
+          Healthcare_Allscripts, Healthcare_Cerner, Virtualization_Other,
+          Virtualization_Virtual_Servers_VSI,
+          Virtualization_Containers_Kubernetes,
+          Virtualization_Virtual_Desktops_VDI, Other]
+        type: str
+      app_type_other:
+        description:
+        - Application type for volume when I(app_type) is set to C(*Other)
+          types.
+        type: str
+      appliance_name:
+        description:
+        - Name of the appliance on which the volume is provisioned.
+        - I(appliance_id) and I(appliance_name) are mutually exclusive.
+        type: str
+      appliance_id:
+        description:
+        - ID of the appliance on which the volume is provisioned.
+        - I(appliance_id) and I(appliance_name) are mutually exclusive.
+        type: str
 attributes:
   check_mode:
     description: Runs task to validate without performing action on the target
@@ -432,6 +575,39 @@ EXAMPLES = r'''
     password: "{{password}}"
     vol_id: "{{result.volume_details.id}}"
     state: "absent"
+
+- name: Create or expand multiple volumes in one run
+  dellemc.powerstore.volume:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    size: 1
+    cap_unit: "GB"
+    vg_name: "{{vg_name}}"
+    protection_policy: "protection_policy_name"
+    volumes:
+      - vol_name: "volume_1"
+      - vol_name: "volume_2"
+        size: 2
+        description: "Expanded volume"
+    max_workers: 8
+    state: "present"
+
+- name: Map volumes to the hosts of a cluster in one run
+  dellemc.powerstore.volume:
+    array_ip: "{{array_ip}}"
+    validate_certs: "{{validate_certs}}"
+    user: "{{user}}"
+    password: "{{password}}"
+    mappings:
+      - volumes: ["datastore_1", "datastore_2"]
+        hosts: ["esxi_1", "esxi_2", "esxi_3"]
+        hlus: [11, 12]
+      - volumes: ["shared_volume"]
+        hostgroups: ["esxi_cluster"]
+    mapping_state: "mapped"
+    state: "present"
 '''
 
 RETURN = r'''
@@ -456,6 +632,80 @@ is_volume_restored:
     returned: always
     type: bool
     sample: "false"
+mappings:
+    description: Mapping changes which were or would be made for
+                 I(mappings).
+    returned: When I(mappings) is given
+    type: list
+    elements: dict
+    contains:
+        volume:
+            description: Name or ID of the volume, as given.
+            type: str
+        host:
+            description: Name or ID of the host, as given.
+            type: str
+        hostgroup:
+            description: Name or ID of the host group, as given.
+            type: str
+        action:
+            description: Whether the volume is mapped or unmapped.
+            type: str
+            choices: [map, unmap]
+        hlu:
+            description: The HLU given for the mapping, if any.
+            type: int
+        changed:
+            description: Whether the mapping has changed.
+            type: bool
+        error:
+            description: Error of the change, if it failed.
+            type: str
+    sample: [
+        {
+            "volume": "datastore_1",
+            "host": "esxi_1",
+            "action": "map",
+            "hlu": 11,
+            "changed": true
+        }
+    ]
+volumes:
+    description: Outcome of every volume of I(volumes), in the same order.
+    returned: When I(volumes) is given
+    type: list
+    elements: dict
+    contains:
+        vol_name:
+            description: Name of the volume.
+            type: str
+        action:
+            description: The action taken on the volume, if any.
+            type: str
+            choices: [create, modify, delete]
+        changed:
+            description: Whether the volume has changed.
+            type: bool
+        error:
+            description: Error of the action on the volume, if it failed.
+            type: str
+        volume_details:
+            description: Details of the volume, with its ID, name, size,
+                         description, policies, application type,
+                         appliance and volume groups.
+            type: dict
+    sample: [
+        {
+            "vol_name": "volume_1",
+            "action": "create",
+            "changed": true,
+            "volume_details": {
+                "id": "634e4b95-e7bd-49e7-957b-6dc932642464",
+                "name": "volume_1",
+                "size": 1073741824
+            }
+        }
+    ]
 volume_details:
     description: Details of the volume.
     returned: When volume exists
@@ -640,11 +890,18 @@ volume_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import resolver
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
 import logging
 import copy
 
 LOG = utils.get_logger('volume', log_devel=logging.INFO)
 
+sdk_helpers = lazy.LazyModule('PyPowerStore.utils.helpers')
+sdk_constants = lazy.LazyModule('PyPowerStore.utils.constants')
+
 py4ps_sdk = utils.has_pyu4ps_sdk()
 HAS_PY4PS = py4ps_sdk['HAS_Py4PS']
 IMPORT_ERROR = py4ps_sdk['Error_message']
@@ -653,6 +910,49 @@ py4ps_version = utils.py4ps_version_check()
 IS_SUPPORTED_PY4PS_VERSION = py4ps_version['supported_version']
 VERSION_ERROR = py4ps_version['unsupported_version_message']
 
+# Application types of the volumes
+APP_TYPES = ["Relational_Databases_Other",
+             "Relational_Databases_Oracle",
+             "Relational_Databases_SQL_Server",
+             "Relational_Databases_PostgreSQL",
+             "Relational_Databases_MySQL",
+             "Relational_Databases_IBM_DB2",
+             "Big_Data_Analytics_Other", "Big_Data_Analytics_MongoDB",
+             "Big_Data_Analytics_Cassandra",
+             "Big_Data_Analytics_SAP_HANA", "Big_Data_Analytics_Spark",
+             "Big_Data_Analytics_Splunk",
+             "Big_Data_Analytics_ElasticSearch",
+             "Business_Applications_Other",
+             "Business_Applications_ERP_SAP",
+             "Business_Applications_CRM",
+             "Business_Applications_Exchange",
+             "Business_Applications_Sharepoint", "Healthcare_Other",
+             "Healthcare_Epic", "Healthcare_MEDITECH",
+             "Healthcare_Allscripts", "Healthcare_Cerner",
+             "Virtualization_Other",
+             "Virtualization_Virtual_Servers_VSI",
+             "Virtualization_Containers_Kubernetes",
+             "Virtualization_Virtual_Desktops_VDI", "Other"]
+# Fields of the volumes listed to reconcile the items of volumes, on every
+# array version
+BULK_VOLUME_SELECT = 'id,name,description,size,appliance_id,' \
+    'protection_policy_id,performance_policy_id,volume_groups(id,name)'
+# Fields of the volumes on PowerStore 3.0.0.0 and above
+BULK_VOLUME_APP_TYPE_SELECT = ',app_type,app_type_other'
+# Fields of the volumes on PowerStore 4.0.0.0 and above
+BULK_VOLUME_QOS_SELECT = ',qos_performance_policy_id'
+# Options of the items of volumes which default to the module options
+BULK_VOLUME_OPTIONS = ('size', 'cap_unit', 'description', 'vg_name',
+                       'protection_policy', 'performance_policy',
+                       'qos_performance_policy', 'app_type', 'app_type_other',
+                       'appliance_id', 'appliance_name')
+# Resources referenced by the items of volumes, resolved once per type
+BULK_VOLUME_REFERENCES = (
+    ('volume_group', 'vg_name', 'volume group'),
+    ('protection_policy', 'protection_policy', 'protection policy'),
+    ('qos_policy', 'qos_performance_policy', 'QoS policy'),
+    ('appliance', 'appliance_name', 'Appliance'))
+
 
 class PowerStoreVolume(object):
     """Class with volume operations"""
@@ -663,7 +963,16 @@ class PowerStoreVolume(object):
         self.module_params.update(get_powerstore_volume_parameters())
 
         mutually_exclusive = [['vol_name', 'vol_id'], ['appliance_name', 'appliance_id']]
-        required_one_of = [['vol_name', 'vol_id']]
+        bulk_exclusive = ('vol_name', 'vol_id', 'new_name', 'host',
+                          'hostgroup', 'hlu', 'clone_volume', 'source_volume',
+                          'source_snap', 'remote_system',
+                          'remote_appliance_id', 'end_metro_config',
+                          'delete_remote_volume')
+        mutually_exclusive.extend(['volumes', option] for option in
+                                  bulk_exclusive + ('mapping_state',))
+        mutually_exclusive.extend(['mappings', option] for option in
+                                  bulk_exclusive + ('volumes', 'size'))
+        required_one_of = [['vol_name', 'vol_id', 'volumes', 'mappings']]
         required_by = {
             'app_type_other': 'app_type',
         }
@@ -694,7 +1003,7 @@ class PowerStoreVolume(object):
             "diff": {}
         }
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         self.protection = self.conn.protection
         self.configuration = self.conn.config_mgmt
@@ -706,6 +1015,11 @@ class PowerStoreVolume(object):
         LOG.info('Got Py4Ps instance for provisioning and protection on '
                  'PowerStore %s', self.conn)
 
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.conn, self.module.params)
+
     def get_volume(self, vol_id=None, vol_name=None):
         """Get volume details"""
         try:
@@ -777,6 +1091,7 @@ class PowerStoreVolume(object):
                 if qos_performance_policy_id not in (None, ''):
                     create_params['qos_performance_policy_id'] = qos_performance_policy_id
                 self.provisioning.create_volume(**create_params)
+                self.name_resolver.forget('volume', [vol_name])
             return True
         except Exception as e:
             msg = 'Create volume {0} failed with error {1}'.format(
@@ -1246,7 +1561,8 @@ class PowerStoreVolume(object):
 
     def get_volume_id_by_name(self, volume_name):
         try:
-            volume_info = self.provisioning.get_volume_by_name(volume_name)
+            volume_info = self.name_resolver.find(
+                'volume', [volume_name])[volume_name]
             if volume_info:
                 if len(volume_info) > 1:
                     error_msg = 'Multiple volumes by the same name found'
@@ -1267,8 +1583,8 @@ class PowerStoreVolume(object):
 
             if utils.name_or_id(volume_group_name) == "NAME":
                 # Get the volume group details using name
-                volume_group_info = self.provisioning. \
-                    get_volume_group_by_name(volume_group_name)
+                volume_group_info = self.name_resolver.find(
+                    'volume_group', [volume_group_name])[volume_group_name]
                 if volume_group_info:
                     if len(volume_group_info) > 1:
                         error_msg = 'Multiple volume groups by the same ' \
@@ -1296,7 +1612,8 @@ class PowerStoreVolume(object):
         try:
 
             # Get the appliance details using name
-            appliance_info = self.configuration.get_appliance_by_name(appliance_name)
+            appliance_info = self.name_resolver.find(
+                'appliance', [appliance_name])[appliance_name]
             if appliance_info:
                 return appliance_info[0]['id']
 
@@ -1317,8 +1634,9 @@ class PowerStoreVolume(object):
 
             if utils.name_or_id(protection_policy_name) == "NAME":
                 # Get the protection policy details using name
-                protection_policy_info = self.conn.protection. \
-                    get_protection_policy_by_name(protection_policy_name)
+                protection_policy_info = self.name_resolver.find(
+                    'protection_policy',
+                    [protection_policy_name])[protection_policy_name]
                 if protection_policy_info:
                     if len(protection_policy_info) > 1:
                         error_msg = 'Multiple protection policies by the ' \
@@ -1349,7 +1667,8 @@ class PowerStoreVolume(object):
                 return ''
 
             if utils.name_or_id(qos_policy_name) == "NAME":
-                qos_policy_info = self.conn.protection.get_policy_by_name(qos_policy_name)
+                qos_policy_info = self.name_resolver.find(
+                    'qos_policy', [qos_policy_name])[qos_policy_name]
                 if qos_policy_info:
                     if len(qos_policy_info) > 1:
                         error_msg = 'Multiple QoS policies by the same name found'
@@ -1375,7 +1694,8 @@ class PowerStoreVolume(object):
 
             if utils.name_or_id(host_name) == "NAME":
                 # Get the host details using name
-                host_info = self.provisioning.get_host_by_name(host_name)
+                host_info = self.name_resolver.find(
+                    'host', [host_name])[host_name]
                 if host_info:
                     if len(host_info) > 1:
                         error_msg = 'Multiple hosts by the same name found'
@@ -1432,8 +1752,8 @@ class PowerStoreVolume(object):
             if remote_system is None:
                 return None
             elif utils.name_or_id(remote_system) == "NAME":
-                remote_system_info = self.protection. \
-                    get_remote_system_by_name(name=remote_system)
+                remote_system_info = self.name_resolver.find(
+                    'remote_system', [remote_system])[remote_system]
 
                 if remote_system_info and len(remote_system_info) == 1:
                     return remote_system_info[0]['id']
@@ -1591,8 +1911,8 @@ class PowerStoreVolume(object):
             'protection_policy_id': volume_details['protection_policy_id'],
             'performance_policy_id': volume_details['performance_policy_id'],
             'size': volume_details['size'],
-            'app_type': volume_details['app_type'],
-            'app_type_other': volume_details['app_type_other'],
+            'app_type': volume_details.get('app_type'),
+            'app_type_other': volume_details.get('app_type_other'),
             'qos_performance_policy_id': volume_details.get('qos_performance_policy_id')
         }
 
@@ -1765,6 +2085,310 @@ class PowerStoreVolume(object):
 
         return diff_dict, before_dict
 
+    @staticmethod
+    def get_bulk_volume_select():
+        """Get the fields of the volumes listed to reconcile volumes, which
+           depend on the version of the array as in get_volume_details"""
+        select = BULK_VOLUME_SELECT
+        if sdk_helpers.is_foot_hill_prime_or_higher():
+            select += BULK_VOLUME_APP_TYPE_SELECT
+        if sdk_helpers.is_victory_or_higher():
+            select += BULK_VOLUME_QOS_SELECT
+        return select
+
+    def get_volumes_by_name(self, vol_names):
+        """Get the volumes with any of the names, listed with in.()
+           filters"""
+        try:
+            select = self.get_bulk_volume_select()
+            volumes = []
+            for index in range(0, len(vol_names), resolver.MAX_BATCH):
+                volumes.extend(self.provisioning.get_volumes(
+                    filter_dict={
+                        'select': select,
+                        'name': resolver.format_in(
+                            vol_names[index:index + resolver.MAX_BATCH])},
+                    all_pages=True) or [])
+            return volumes
+        except Exception as e:
+            error_msg = "Get volumes failed with error: {0}".format(str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+
+    def get_bulk_volume_items(self, volume_params):
+        """Get the items of volumes, with the module options as defaults"""
+        items = []
+        for volume in volume_params['volumes']:
+            item = dict(volume)
+            for option in BULK_VOLUME_OPTIONS:
+                if item.get(option) is None:
+                    item[option] = volume_params[option]
+            if len(item['vol_name'].strip()) == 0:
+                self.module.fail_json(msg="Please provide valid volume name.")
+            if item['cap_unit'] is not None and item['size'] is None:
+                self.module.fail_json(
+                    msg="cap_unit can be specified along with size. Please "
+                        "enter a valid size for volume {0}.".format(
+                            item['vol_name']))
+            if item['app_type_other'] is not None and \
+                    len(item['app_type_other']) > 32:
+                self.module.fail_json(msg="Max Length for option "
+                                          "'app_type_other' is 32. "
+                                          "Enter a valid string.")
+            items.append(item)
+        names = [item['vol_name'] for item in items]
+        duplicates = sorted(set(name for name in names
+                                if names.count(name) > 1))
+        if duplicates:
+            self.module.fail_json(msg="Volume names in volumes must be "
+                                      "unique: {0}".format(
+                                          ', '.join(duplicates)))
+        return items
+
+    def resolve_bulk_references(self, items):
+        """Resolve the resources referenced by the items of volumes at once,
+           per resource type"""
+        references = {}
+        for resource_type, option, label in BULK_VOLUME_REFERENCES:
+            values = [item[option] for item in items if item[option]]
+            try:
+                references[option] = self.name_resolver.resolve(
+                    resource_type, values)
+            except Exception as e:
+                error_msg = "Get {0}: {1} failed with error: {2}".format(
+                    label, ', '.join(dict.fromkeys(values)), str(e))
+                LOG.error(error_msg)
+                self.module.fail_json(msg=error_msg,
+                                      **utils.failure_codes(e))
+            missing = [value for value in dict.fromkeys(values)
+                       if value not in references[option]]
+            if missing:
+                error_msg = "{0} {1} not found".format(label,
+                                                       ', '.join(missing))
+                LOG.error(error_msg)
+                self.module.fail_json(msg=error_msg)
+        return references
+
+    def plan_bulk_volume(self, item, volume_details, references, state):
+        """
+        Plan the reconciliation of a volume with its item of volumes.
+        :return: Dict of the action, if any, and of its parameters
+        :raises ValueError: If the volume cannot be reconciled
+        """
+        name = item['vol_name']
+        if state == 'absent':
+            return dict(vol_name=name, volume=volume_details, params={},
+                        action='delete' if volume_details else None)
+
+        size = None
+        if item['size'] is not None:
+            size = int(utils.get_size_bytes(size=item['size'],
+                                            cap_units=item['cap_unit'] or 'GB'))
+
+        def get_reference(option):
+            value = item[option]
+            return references[option][value] if value else value
+
+        fetched_params = dict(
+            volume_group_id=get_reference('vg_name'),
+            protection_policy_id=get_reference('protection_policy'),
+            qos_performance_policy_id=get_reference('qos_performance_policy'),
+            performance_policy=self.get_performance_policy(
+                item['performance_policy']),
+            size=size)
+        appliance_id = item['appliance_id'] or get_reference('appliance_name')
+
+        if not volume_details:
+            if size is None:
+                raise ValueError('Size is a required parameter while '
+                                 'creating volume {0}'.format(name))
+            params = dict(
+                name=name, size=size, description=item['description'],
+                volume_group_id=fetched_params['volume_group_id'],
+                protection_policy_id=fetched_params['protection_policy_id'] or None,
+                performance_policy_id=fetched_params['performance_policy'],
+                app_type=item['app_type'],
+                app_type_other=item['app_type_other'],
+                appliance_id=appliance_id)
+            if fetched_params['qos_performance_policy_id']:
+                params['qos_performance_policy_id'] = \
+                    fetched_params['qos_performance_policy_id']
+            return dict(vol_name=name, volume=None, params=params,
+                        action='create')
+
+        group_ids = [group['id'] for group in
+                     volume_details.get('volume_groups') or []]
+        if fetched_params['volume_group_id'] and \
+                fetched_params['volume_group_id'] not in group_ids:
+            raise ValueError("Modification or assignment of Volume Group for "
+                             "an already present Volume {0} is not supported "
+                             "using Volume module. Use Volume Group module "
+                             "instead.".format(name))
+        if appliance_id and appliance_id != volume_details['appliance_id']:
+            raise ValueError("Modifying the appliance of volume {0} to {1} "
+                             "is not allowed.".format(name, appliance_id))
+        if size is not None and volume_details['size'] > size:
+            raise ValueError("Current size {0} B of volume {1} is greater "
+                             "than {2} B specified. Only expansion of volume "
+                             "size is allowed".format(volume_details['size'],
+                                                      name, size))
+        if size == volume_details['size']:
+            fetched_params['size'] = None
+        if fetched_params['qos_performance_policy_id'] == '' and \
+                not volume_details.get('qos_performance_policy_id'):
+            fetched_params['qos_performance_policy_id'] = None
+        volume_params = dict(description=item['description'],
+                             app_type=item['app_type'],
+                             app_type_other=item['app_type_other'],
+                             appliance_id=appliance_id)
+        update_dict, modify_flag = self.prepare_modify_dict(
+            volume_params, volume_details, fetched_params, name)
+        params = dict((key, value) for key, value in update_dict.items()
+                      if value is not None)
+        return dict(vol_name=name, volume=volume_details, params=params,
+                    action='modify' if modify_flag else None)
+
+    def apply_bulk_volume(self, plan):
+        """Apply the action planned for a volume of volumes"""
+        LOG.info('Applying %s of volume %s', plan['action'], plan['vol_name'])
+        if plan['action'] == 'create':
+            self.provisioning.create_volume(**plan['params'])
+        elif plan['action'] == 'modify':
+            self.provisioning.modify_volume(volume_id=plan['volume']['id'],
+                                            **plan['params'])
+        else:
+            self.provisioning.delete_volume(plan['volume']['id'])
+
+    def get_host_volume_mappings(self, host_ids, host_group_ids):
+        """Get the mappings of all the volumes to the hosts and host groups,
+           listed with in.() filters, so that the HLUs which other volumes
+           use on them are known as well"""
+        try:
+            url = sdk_constants.HOST_VOLUME_MAPPING_URL.format(
+                self.provisioning.server_ip)
+            mappings = []
+            for field, ids in (('host_id', host_ids),
+                               ('host_group_id', host_group_ids)):
+                for index in range(0, len(ids), resolver.MAX_BATCH):
+                    mappings.extend(self.provisioning.client.request(
+                        'GET', url, querystring={
+                            'select': 'id,volume_id,host_id,host_group_id,'
+                                      'logical_unit_number',
+                            field: resolver.format_in(
+                                ids[index:index + resolver.MAX_BATCH])},
+                        all_pages=True) or [])
+            return mappings
+        except Exception as e:
+            error_msg = "Get host volume mappings failed with error: " \
+                        "{0}".format(str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+
+    def resolve_all(self, resource_type, values, label):
+        """Resolve names or IDs of resources of a type at once, failing if
+           any of them is not found"""
+        try:
+            resolved = self.name_resolver.resolve(resource_type, values)
+        except Exception as e:
+            error_msg = "Get {0}: {1} failed with error: {2}".format(
+                label, ', '.join(dict.fromkeys(values)), str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg, **utils.failure_codes(e))
+        missing = [value for value in dict.fromkeys(values)
+                   if value not in resolved]
+        if missing:
+            error_msg = "{0} {1} not found".format(label, ', '.join(missing))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg)
+        return resolved
+
+    def plan_volume_mappings(self, mappings, mapping_state, targets,
+                             current_mappings):
+        """
+        Plan the attach or detach calls reconciling the matrix of mappings
+        with the current mappings of its hosts and host groups.
+        :param targets: Dict of the IDs of the volumes, hosts and host groups
+                        of mappings, per option
+        :return: Tuple of the planned calls and of the errors found
+        """
+        mapped = {}
+        used_hlus = {}
+        for mapping in current_mappings:
+            if mapping.get('host_group_id'):
+                target = ('hostgroups', mapping['host_group_id'])
+            elif mapping.get('host_id'):
+                target = ('hosts', mapping['host_id'])
+            else:
+                continue
+            hlu = mapping.get('logical_unit_number')
+            mapped[(mapping['volume_id'],) + target] = hlu
+            used_hlus.setdefault(target, {})[hlu] = mapping['volume_id']
+
+        desired = {}
+        errors = []
+        for mapping in mappings:
+            hlus = mapping['hlus'] or [None] * len(mapping['volumes'])
+            for volume, hlu in zip(mapping['volumes'], hlus):
+                for option in ('hosts', 'hostgroups'):
+                    for name in mapping[option] or []:
+                        key = (targets['volumes'][volume], option,
+                               targets[option][name])
+                        planned = desired.setdefault(key, dict(
+                            volume=volume, option=option, name=name,
+                            hlu=None))
+                        if hlu is not None and planned['hlu'] not in \
+                                (None, hlu):
+                            errors.append(
+                                'Conflicting HLUs {0} and {1} given for '
+                                'volume {2} on {3}'.format(
+                                    planned['hlu'], hlu, volume, name))
+                        planned['hlu'] = planned['hlu'] if hlu is None \
+                            else hlu
+
+        calls = []
+        for key, planned in desired.items():
+            volume_id, option, target_id = key
+            if mapping_state == 'unmapped':
+                if key in mapped:
+                    calls.append(dict(planned, key=key, action='unmap'))
+                continue
+            if key in mapped:
+                if planned['hlu'] is not None and \
+                        mapped[key] != planned['hlu']:
+                    errors.append(
+                        'Modification of HLU is not supported. Volume {0} '
+                        'is mapped to {1} with HLU {2}'.format(
+                            planned['volume'], planned['name'], mapped[key]))
+                continue
+            if planned['hlu'] is not None:
+                hlus = used_hlus.setdefault((option, target_id), {})
+                if hlus.get(planned['hlu'], volume_id) != volume_id:
+                    errors.append('HLU {0} is already used on {1}'.format(
+                        planned['hlu'], planned['name']))
+                hlus[planned['hlu']] = volume_id
+            calls.append(dict(planned, key=key, action='map'))
+        return calls, errors
+
+    def apply_volume_mapping(self, call):
+        """Attach or detach a volume to a host or host group"""
+        volume_id, option, target_id = call['key']
+        LOG.info('Applying %s of volume %s to %s', call['action'],
+                 call['volume'], call['name'])
+        if call['action'] == 'map' and option == 'hosts':
+            self.provisioning.map_volume_to_host(
+                volume_id=volume_id, host_id=target_id,
+                logical_unit_number=call['hlu'])
+        elif call['action'] == 'map':
+            self.provisioning.map_volume_to_host_group(
+                volume_id=volume_id, host_group_id=target_id,
+                logical_unit_number=call['hlu'])
+        elif option == 'hosts':
+            self.provisioning.unmap_volume_from_host(
+                volume_id=volume_id, host_id=target_id)
+        else:
+            self.provisioning.unmap_volume_from_host_group(
+                volume_id=volume_id, host_group_id=target_id)
+
 
 def prepare_host_list(vol, current_hosts, current_host_ids):
     if 'host' in vol:
@@ -1878,34 +2502,35 @@ def get_powerstore_volume_parameters():
         remote_appliance_id=dict(required=False, type='str'),
         end_metro_config=dict(required=False, type='bool', default=False),
         delete_remote_volume=dict(required=False, type='bool'),
-        app_type=dict(
-            type='str',
-            choices=["Relational_Databases_Other",
-                     "Relational_Databases_Oracle",
-                     "Relational_Databases_SQL_Server",
-                     "Relational_Databases_PostgreSQL",
-                     "Relational_Databases_MySQL",
-                     "Relational_Databases_IBM_DB2",
-                     "Big_Data_Analytics_Other", "Big_Data_Analytics_MongoDB",
-                     "Big_Data_Analytics_Cassandra",
-                     "Big_Data_Analytics_SAP_HANA", "Big_Data_Analytics_Spark",
-                     "Big_Data_Analytics_Splunk",
-                     "Big_Data_Analytics_ElasticSearch",
-                     "Business_Applications_Other",
-                     "Business_Applications_ERP_SAP",
-                     "Business_Applications_CRM",
-                     "Business_Applications_Exchange",
-                     "Business_Applications_Sharepoint", "Healthcare_Other",
-                     "Healthcare_Epic", "Healthcare_MEDITECH",
-                     "Healthcare_Allscripts", "Healthcare_Cerner",
-                     "Virtualization_Other",
-                     "Virtualization_Virtual_Servers_VSI",
-                     "Virtualization_Containers_Kubernetes",
-                     "Virtualization_Virtual_Desktops_VDI", "Other"]),
+        app_type=dict(type='str', choices=APP_TYPES),
         app_type_other=dict(type='str'),
         appliance_name=dict(type='str'),
         appliance_id=dict(type='str'),
-        qos_performance_policy=dict(type='str')
+        qos_performance_policy=dict(type='str'),
+        volumes=dict(
+            type='list', elements='dict', options=dict(
+                vol_name=dict(type='str', required=True),
+                size=dict(type='float'),
+                cap_unit=dict(choices=['MB', 'GB', 'TB'], type='str'),
+                description=dict(type='str'),
+                vg_name=dict(type='str'),
+                performance_policy=dict(choices=['high', 'medium', 'low'],
+                                        type='str'),
+                protection_policy=dict(type='str'),
+                qos_performance_policy=dict(type='str'),
+                app_type=dict(type='str', choices=APP_TYPES),
+                app_type_other=dict(type='str'),
+                appliance_name=dict(type='str'),
+                appliance_id=dict(type='str')),
+            mutually_exclusive=[['appliance_name', 'appliance_id']]),
+        mappings=dict(
+            type='list', elements='dict', options=dict(
+                volumes=dict(type='list', elements='str', required=True),
+                hosts=dict(type='list', elements='str'),
+                hostgroups=dict(type='list', elements='str'),
+                hlus=dict(type='list', elements='int')),
+            required_one_of=[['hosts', 'hostgroups']]),
+        max_workers=dict(type='int', default=4)
     )
 
 
@@ -2227,11 +2852,132 @@ class VolumeHandler:
         VolumeCreateHandler().handle(volume_obj, volume_params, volume_details, fetched_params, volume_id, changed)
 
 
+class VolumeBulkHandler:
+    def handle(self, volume_obj, volume_params):
+        if volume_params['max_workers'] < 1:
+            volume_obj.module.fail_json(msg="max_workers should be a "
+                                            "positive integer")
+        state = volume_params['state']
+        items = volume_obj.get_bulk_volume_items(volume_params)
+        vol_names = [item['vol_name'] for item in items]
+        references = {}
+        if state == 'present':
+            references = volume_obj.resolve_bulk_references(items)
+        existing = dict((volume['name'], volume) for volume in
+                        volume_obj.get_volumes_by_name(vol_names))
+
+        def get_details(plans, applied):
+            if applied:
+                volume_obj.name_resolver.forget(
+                    'volume', [plan['vol_name'] for plan in plans
+                               if plan['action']])
+                if state == 'present':
+                    existing.update((volume['name'], volume) for volume in
+                                    volume_obj.get_volumes_by_name(vol_names))
+            if state != 'present':
+                return [{}] * len(plans)
+            return [dict(volume_details=existing.get(plan['vol_name']))
+                    for plan in plans]
+
+        utils.reconcile_in_bulk(
+            volume_obj.module, items,
+            lambda item: volume_obj.plan_bulk_volume(
+                item, existing.get(item['vol_name']), references, state),
+            volume_obj.apply_bulk_volume,
+            lambda plan: dict(vol_name=plan['vol_name']),
+            volume_params['max_workers'], 'volumes',
+            get_details=get_details, get_diff=self.get_diff)
+
+    @staticmethod
+    def get_diff(plans):
+        before = {}
+        after = {}
+        for plan in plans:
+            volume = plan['volume'] or {}
+            before[plan['vol_name']] = volume
+            if plan['action'] == 'delete':
+                after[plan['vol_name']] = {}
+            else:
+                after[plan['vol_name']] = dict(volume, **plan['params'])
+        return dict(before=before, after=after)
+
+
+class VolumeMappingHandler:
+    def handle(self, volume_obj, volume_params):
+        mappings = volume_params['mappings']
+        mapping_state = volume_params['mapping_state']
+        if volume_params['max_workers'] < 1:
+            volume_obj.module.fail_json(msg="max_workers should be a "
+                                            "positive integer")
+        if mapping_state is None or volume_params['state'] != 'present':
+            volume_obj.module.fail_json(msg="mappings can only be used with "
+                                            "mapping_state and state present")
+        for mapping in mappings:
+            if mapping['hlus'] is not None and (
+                    mapping_state == 'unmapped' or
+                    len(mapping['hlus']) != len(mapping['volumes'])):
+                volume_obj.module.fail_json(
+                    msg="hlus of mappings must give the HLU of every volume, "
+                        "and can only be used with mapping_state mapped")
+
+        targets = {}
+        for option, resource_type, label in (
+                ('volumes', 'volume', 'Volume'), ('hosts', 'host', 'Host'),
+                ('hostgroups', 'host_group', 'Host group')):
+            values = [value for mapping in mappings
+                      for value in mapping[option] or []]
+            targets[option] = volume_obj.resolve_all(resource_type, values,
+                                                     label) if values else {}
+        current_mappings = volume_obj.get_host_volume_mappings(
+            sorted(set(targets['hosts'].values())),
+            sorted(set(targets['hostgroups'].values())))
+        calls, errors = volume_obj.plan_volume_mappings(
+            mappings, mapping_state, targets, current_mappings)
+        if errors:
+            error_msg = '; '.join(errors)
+            LOG.error(error_msg)
+            volume_obj.module.fail_json(msg=error_msg)
+
+        outcomes = [(None, None)] * len(calls)
+        if calls and not volume_obj.module.check_mode:
+            outcomes = utils.run_concurrently(
+                volume_obj.apply_volume_mapping, calls,
+                max_workers=volume_params['max_workers'])
+        results = []
+        for call, (result, error) in zip(calls, outcomes):
+            result = dict(volume=call['volume'], action=call['action'],
+                          hlu=call['hlu'], changed=error is None)
+            result['host' if call['option'] == 'hosts' else 'hostgroup'] = \
+                call['name']
+            if error is not None:
+                result['error'] = str(error)
+            results.append(result)
+        changed = any(result['changed'] for result in results)
+
+        failures = [result for result in results if 'error' in result]
+        if failures:
+            error_msg = "Failed {0} of {1} mapping changes: {2}".format(
+                len(failures), len(results), '; '.join(
+                    '{0} {1} {2}: {3}'.format(
+                        result['action'], result['volume'],
+                        result.get('host') or result.get('hostgroup'),
+                        result['error']) for result in failures))
+            LOG.error(error_msg)
+            volume_obj.module.fail_json(msg=error_msg, changed=changed,
+                                        mappings=results)
+        volume_obj.module.exit_json(changed=changed, mappings=results)
+
+
 def main():
     """ Create PowerStore volume object and perform action on it
         based on user input from playbook"""
     obj = PowerStoreVolume()
-    VolumeHandler().handle(obj, obj.module.params)
+    if obj.module.params['volumes'] is not None:
+        VolumeBulkHandler().handle(obj, obj.module.params)
+    elif obj.module.params['mappings'] is not None:
+        VolumeMappingHandler().handle(obj, obj.module.params)
+    else:
+        VolumeHandler().handle(obj, obj.module.params)
 
 
 if __name__ == '__main__':
@@ -395,6 +395,8 @@ volume_group_details:
 """
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
+    import resolver
 from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell\
     import utils
 import logging
@@ -442,7 +444,7 @@ class PowerStoreVolumeGroup(object):
             self.module.fail_json(msg=VERSION_ERROR)
 
         self.conn = utils.get_powerstore_connection(
-            self.module.params)
+            self.module.params, module=self.module)
         self.provisioning = self.conn.provisioning
         LOG.info('Got Py4ps instance for provisioning on PowerStore %s',
                  self.conn)
@@ -601,88 +603,51 @@ class PowerStoreVolumeGroup(object):
             LOG.error(errormsg)
             self.module.fail_json(msg=errormsg, **utils.failure_codes(e))
 
-    def get_volume_id_by_name(self, vol_name):
-        """Get the details of a volume by name"""
+    @property
+    def name_resolver(self):
+        """Name resolver shared by the lookups of this connection"""
+        return resolver.get_resolver(self.conn, self.module.params)
 
+    def get_volume_ids(self, vol_list):
+        """Resolve the names and IDs of volumes to IDs with batched in.()
+           listings, failing if any of them is not found"""
+        values = [vol for vol in dict.fromkeys(vol_list) if vol]
+        resolved = {}
         try:
-            resp = self.provisioning.get_volume_by_name(vol_name)
-            if len(resp) > 0:
-                return resp[0]['id']
-            else:
-                return None
-
+            resolved = self.name_resolver.resolve('volume', values)
         except Exception as e:
-            msg = "Failed to get the volume with name {0} with " \
-                  "error {1}".format(vol_name, str(e))
+            msg = "Failed to get the volumes {0} with error {1}".format(
+                ', '.join(values), str(e))
             LOG.error(msg)
+            self.module.fail_json(msg=msg, **utils.failure_codes(e))
 
-    def get_volume_details_by_id(self, volume_id):
-        """Get the details of a volume by name"""
-
-        try:
-            LOG.info("getting volume with id %s", volume_id)
-            resp = self.provisioning.get_volume_details(volume_id)
-            if len(resp) > 0:
-                LOG.info("got volume with id %s is %s", volume_id, resp)
-                return resp['id']
+        for vol in values:
+            if vol in resolved:
+                continue
+            if utils.name_or_id(vol) == "NAME":
+                msg = "Volume with name {0} not found. Please enter a " \
+                      "correct volume name.".format(vol)
             else:
-                return None
-
-        except Exception as e:
-            msg = "Failed to get the volume with id {0} with " \
-                  "error {1}".format(volume_id, str(e))
+                msg = "Volume with id {0} not found. Please enter a " \
+                      "correct volume id".format(vol)
             LOG.error(msg)
+            self.module.fail_json(msg=msg)
+        return list(dict.fromkeys(resolved[vol] for vol in values
+                                  if vol in resolved))
 
-    def remove_volumes_from_volume_group(self, vg_id, vol_list):
-        """Remove volumes from volume group"""
-
+    def get_existing_volume_ids(self, vg_id):
+        """Get the IDs of the volumes of a volume group"""
         vol_group_details = self.get_volume_group_details(vg_id=vg_id)
         existing_volumes_in_vg = vol_group_details['volumes']
         LOG.debug("Existing Volumes: %s", existing_volumes_in_vg)
+        return set(vol['id'] for vol in existing_volumes_in_vg if vol)
 
-        existing_vol_ids = []
-        for vol in existing_volumes_in_vg:
-            if vol:
-                existing_vol_ids.append(vol['id'])
-
-        LOG.debug("Existing Volume IDs %s", existing_vol_ids)
-
-        ids_to_remove = []
-
-        vol_name_list = []
-        vol_id_list = []
-
-        for each_vol in vol_list:
-            if each_vol:
-                identifier_type = utils.name_or_id(each_vol)
-                if identifier_type == "ID" and not (each_vol in vol_id_list):
-                    vol_id_list.append(each_vol)
-                elif identifier_type == "NAME" and not (each_vol in
-                                                        vol_name_list):
-                    vol_name_list.append(each_vol)
-
-        """remove by name"""
-        for vol in vol_name_list:
-            vol_id = self.get_volume_id_by_name(vol)
-            if not vol_id:
-                msg = "Volume with name {0} not found. Please enter a " \
-                      "correct volume name.".format(vol)
-                self.module.fail_json(msg=msg)
-            if (vol_id in existing_vol_ids) and (vol_id not in ids_to_remove):
-                ids_to_remove.append(vol_id)
-
-        """remove by id"""
-        for vol in vol_id_list:
-            # checking if the vol id passed is a valid one or not.
-            # if not valid then get_volume_details_by_id will throw error.
-            vol_id = self.get_volume_details_by_id(vol)
-            if not vol_id:
-                msg = "Volume with id {0} not found. Please enter a correct " \
-                      "volume id".format(vol)
-                self.module.fail_json(msg=msg)
-            if (vol in existing_vol_ids) and (vol not in ids_to_remove):
-                ids_to_remove.append(vol)
+    def remove_volumes_from_volume_group(self, vg_id, vol_list):
+        """Remove volumes from volume group"""
 
+        existing_vol_ids = self.get_existing_volume_ids(vg_id)
+        ids_to_remove = [vol_id for vol_id in self.get_volume_ids(vol_list)
+                         if vol_id in existing_vol_ids]
         LOG.debug("Volume IDs to Remove %s", ids_to_remove)
 
         if len(ids_to_remove) == 0:
@@ -709,51 +674,9 @@ class PowerStoreVolumeGroup(object):
     def add_volumes_to_volume_group(self, vg_id, vol_list):
         """adds volumes to volume group"""
 
-        vol_group_details = self.get_volume_group_details(vg_id=vg_id)
-        existing_volumes_in_vg = vol_group_details['volumes']
-        LOG.debug("Existing Volumes: %s", existing_volumes_in_vg)
-        existing_vol_ids = []
-        for vol in existing_volumes_in_vg:
-            if vol:
-                existing_vol_ids.append(vol['id'])
-
-        LOG.debug("Existing Volume IDs %s", existing_vol_ids)
-
-        ids_to_add = []
-        vol_name_list = []
-        vol_id_list = []
-
-        for each_vol in vol_list:
-            if each_vol:
-                identifier_type = utils.name_or_id(each_vol)
-                if identifier_type == "ID" and not (each_vol in vol_id_list):
-                    vol_id_list.append(each_vol)
-                elif identifier_type == "NAME" and not (each_vol in
-                                                        vol_name_list):
-                    vol_name_list.append(each_vol)
-
-        """add volume by name"""
-        for vol in vol_name_list:
-            vol_id = self.get_volume_id_by_name(vol)
-            if not vol_id:
-                msg = "Volume with name {0} not found. Please enter a " \
-                      "correct volume name.".format(vol)
-                self.module.fail_json(msg=msg)
-            if (vol_id not in existing_vol_ids) and (vol_id not in ids_to_add):
-                ids_to_add.append(vol_id)
-
-        """add volume by id"""
-        for vol in vol_id_list:
-            """verifying if volume id exists in array"""
-            vol_by_id = self.get_volume_details_by_id(volume_id=vol)
-            if not vol_by_id:
-                msg = "Volume with id {0} not found. Please enter a correct " \
-                      "volume id".format(vol)
-                self.module.fail_json(msg=msg)
-            if (vol_by_id not in existing_vol_ids) and\
-                    (vol_by_id not in ids_to_add):
-                ids_to_add.append(vol_by_id)
-
+        existing_vol_ids = self.get_existing_volume_ids(vg_id)
+        ids_to_add = [vol_id for vol_id in self.get_volume_ids(vol_list)
+                      if vol_id not in existing_vol_ids]
         LOG.info("Volume IDs to add %s", ids_to_add)
 
         if len(ids_to_add) == 0:
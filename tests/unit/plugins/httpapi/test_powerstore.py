@@ -0,0 +1,83 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the HttpApi plugin for PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+from email.message import Message
+from io import BytesIO
+
+import pytest
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from ansible_collections.dellemc.powerstore.plugins.httpapi.powerstore \
+    import HttpApi
+
+
+class TestPowerStoreHttpApi():
+
+    @pytest.fixture
+    def httpapi(self):
+        connection = MagicMock()
+        connection._auth = None
+        return HttpApi(connection)
+
+    @staticmethod
+    def get_response(status_code, headers, body=b''):
+        message = Message()
+        for name, value in headers:
+            message[name] = value
+        response = MagicMock(reason='OK')
+        response.getcode.return_value = status_code
+        response.info.return_value = message
+        return response, BytesIO(body)
+
+    def test_login(self, httpapi):
+        httpapi.connection.send.return_value = self.get_response(
+            200, [('DELL-EMC-TOKEN', 'token'),
+                  ('Set-Cookie', 'other=1; Path=/'),
+                  ('Set-Cookie', 'auth_cookie=cookie; Secure; HttpOnly')])
+        httpapi.login('admin', 'password')
+        headers = httpapi.connection.send.call_args[1]['headers']
+        assert headers['Authorization'] == 'Basic ' + base64.b64encode(
+            b'admin:password').decode('ascii')
+        assert httpapi.connection._auth == {
+            'DELL-EMC-TOKEN': 'token', 'Cookie': 'auth_cookie=cookie'}
+
+    def test_login_failure(self, httpapi):
+        httpapi.connection.send.return_value = self.get_response(200, [])
+        with pytest.raises(ValueError):
+            httpapi.login('admin', 'password')
+
+    def test_send_request(self, httpapi):
+        httpapi.connection.send.return_value = self.get_response(
+            206, [('Content-Range', '0-99/150')], b'[{"id": "1"}]')
+        reply = httpapi.send_request(
+            None, '/api/rest/volume', query={'select': 'id,name',
+                                             'name': ['ilike.a*', 'neq.b']},
+            headers={'Range': '100-2100'})
+        path = httpapi.connection.send.call_args[0][0]
+        assert path == '/api/rest/volume?select=id%2Cname&' \
+            'name=ilike.a%2A&name=neq.b'
+        assert httpapi.connection.send.call_args[1]['headers']['Range'] == \
+            '100-2100'
+        assert reply['status_code'] == 206
+        assert reply['headers']['Content-Range'] == '0-99/150'
+        assert base64.b64decode(reply['content']) == b'[{"id": "1"}]'
+
+    def test_handle_httperror(self, httpapi):
+        error = MagicMock(code=404)
+        assert httpapi.handle_httperror(error) is error
+        httpapi.connection._auth = {'DELL-EMC-TOKEN': 'expired'}
+        httpapi.login = MagicMock()
+        assert httpapi.handle_httperror(MagicMock(code=401)) is True
+        httpapi.login.assert_called_once()
@@ -25,7 +25,9 @@ class MockHostApi:
         'new_name': None,
         'os_type': None,
         'host_connectivity': None,
-        'description': None
+        'description': None,
+        'hosts': None,
+        'max_workers': 4
     }
     HOST_NAME_1 = "Sample_host_1"
     HOST_DETAILS = {
@@ -15,8 +15,32 @@ class MockInfoApi:
 
     INFO_COMMON_ARGS = {
         'array_ip': '**.***.**.***',
+        'user': 'admin',
         'filters': None,
         'all_pages': None,
+        'max_workers': 1,
+        'page_workers': 1,
+        'arrays': None,
+        'array_workers': 4,
+        'include_acl': True,
+        'acl_workers': 4,
+        'acl_timeout': None,
+        'fields': None,
+        'output_path': None,
+        'compress_output': False,
+        'aggregate': None,
+        'expand': None,
+        'cache_dir': None,
+        'cache_ttl': 0,
+        'cache_session': False,
+        'max_retries': 3,
+        'retry_budget': 10,
+        'retry_backoff': 1.0,
+        'rate_limit': 0,
+        'max_in_flight': 0,
+        'perf_stats': False,
+        'perf_trace_file': None,
+        'http_cache_size': 0,
         'gather_subset': None
     }
 
@@ -63,7 +63,10 @@ class MockQuotaApi:
         "windows_sid": None,
         "uid": None,
         "quota": None,
-        "state": None
+        "state": None,
+        "quotas": None,
+        "quotas_file": None,
+        "max_workers": 4
     }
 
     QUOTA_DETAILS = [{
@@ -41,7 +41,11 @@ class MockVolumeApi:
         'app_type': None,
         'app_type_other': None,
         'appliance_name': None,
-        'appliance_id': None
+        'appliance_id': None,
+        'qos_performance_policy': None,
+        'volumes': None,
+        'mappings': None,
+        'max_workers': 4
     }
 
     DESCRIPTION1 = 'Volume created'
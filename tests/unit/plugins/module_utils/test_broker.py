@@ -0,0 +1,178 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the connection broker of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import socket
+import threading
+
+import pytest
+import requests
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import broker
+
+
+class FakeClient(object):
+
+    instances = []
+    responses = []
+
+    def __init__(self, username, password, verify, application_type,
+                 timeout=None):
+        self.username = username
+        self.auth_manager = MagicMock()
+        self.auth_manager.dell_emc_token = 'token'
+        FakeClient.instances.append(self)
+
+    def fetch_response(self, http_method, url, payload=None,
+                       querystring=None, myrange=None):
+        self.auth_manager.get_token_and_cookie()
+        response = FakeClient.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestBroker():
+
+    details = dict(username='admin', password='password', verify=False,
+                   timeout=120, application_type='Ansible/3.4.0')
+    url = 'https://1.2.3.4:443/api/rest/volume'
+
+    @pytest.fixture
+    def socket_path(self, tmp_path):
+        FakeClient.instances = []
+        FakeClient.responses = []
+        socket_path = str(tmp_path / 'broker.sock')
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(socket_path)
+        listener.listen(4)
+        server = broker.Broker(idle_timeout=0.2, client_class=FakeClient)
+        thread = threading.Thread(target=server.serve, args=(listener,))
+        thread.daemon = True
+        thread.start()
+        yield socket_path
+        thread.join(5)
+        assert not thread.is_alive()
+        listener.close()
+
+    @staticmethod
+    def get_response(status_code, body, headers=None):
+        response = MagicMock(status_code=status_code, reason='OK',
+                             content=body.encode('utf-8'))
+        response.headers = headers or {}
+        return response
+
+    def test_fetch_response_through_broker(self, socket_path):
+        FakeClient.responses = [
+            self.get_response(206, '[{"id": "1"}]',
+                              {'Content-Range': '0-0/2'}),
+            self.get_response(200, '[{"id": "2"}]')]
+        first = broker.BrokerConnection(socket_path, self.details)
+        second = broker.BrokerConnection(socket_path, self.details)
+        response = first.fetch_response('GET', self.url,
+                                        querystring={'select': 'id'})
+        assert response.status_code == 206
+        assert response.headers['content-range'] == '0-0/2'
+        assert response.json() == [{"id": "1"}]
+        response = second.fetch_response('GET', self.url, myrange='1-2')
+        assert response.json() == [{"id": "2"}]
+        # Both connections share the session of the array and user
+        assert len(FakeClient.instances) == 1
+        first.close()
+        second.close()
+
+    def test_fetch_response_error(self, socket_path):
+        FakeClient.responses = [requests.exceptions.Timeout('timed out'),
+                                ValueError('invalid')]
+        connection = broker.BrokerConnection(socket_path, self.details)
+        with pytest.raises(requests.exceptions.Timeout, match='timed out'):
+            connection.fetch_response('GET', self.url)
+        with pytest.raises(requests.exceptions.RequestException,
+                           match='invalid'):
+            connection.fetch_response('GET', self.url)
+        connection.close()
+
+    def test_fetch_response_logs_in_again(self, socket_path):
+        FakeClient.responses = [self.get_response(401, '{}'),
+                                self.get_response(200, '[]')]
+        connection = broker.BrokerConnection(socket_path, self.details)
+        assert connection.fetch_response('GET', self.url).status_code == 200
+        assert FakeClient.instances[0].auth_manager.dell_emc_token is None
+        connection.close()
+
+    def test_sessions_per_array_and_user(self, socket_path):
+        other_user = dict(self.details, username='other')
+        other_url = 'https://5.6.7.8:443/api/rest/volume'
+        for details, url in [(self.details, self.url),
+                             (other_user, self.url),
+                             (self.details, other_url),
+                             (self.details, self.url)]:
+            FakeClient.responses.append(self.get_response(200, '[]'))
+            connection = broker.BrokerConnection(socket_path, details)
+            connection.fetch_response('GET', url)
+            connection.close()
+        assert [client.username for client in FakeClient.instances] == \
+            ['admin', 'other', 'admin']
+
+    def test_attach_without_broker(self, tmp_path, mocker):
+        mocker.patch.object(broker, 'start_broker', side_effect=OSError)
+        client = MagicMock()
+        fetch_response = client.fetch_response
+        assert broker.attach(client, str(tmp_path / 'broker.sock')) is False
+        assert client.fetch_response is fetch_response
+
+    def test_stale_socket_removed(self, tmp_path):
+        socket_path = str(tmp_path / 'broker.sock')
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(socket_path)
+        listener.close()
+        broker.remove_stale_socket(socket_path)
+        assert not os.path.exists(socket_path)
+        # A missing path is left as is
+        broker.remove_stale_socket(socket_path)
+
+    def test_other_file_not_removed(self, tmp_path, mocker):
+        path = tmp_path / 'broker.sock'
+        path.write_text('data')
+        with pytest.raises(OSError, match='not a socket owned'):
+            broker.start_broker(str(path))
+        assert path.read_text() == 'data'
+        fork = mocker.patch.object(broker.os, 'fork')
+        client = MagicMock(username='admin', password='password',
+                           verify=False, timeout=120,
+                           application_type='Ansible/3.4.0')
+        assert broker.attach(client, str(path)) is False
+        fork.assert_not_called()
+
+    def test_socket_of_other_user_not_removed(self, tmp_path, mocker):
+        socket_path = str(tmp_path / 'broker.sock')
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(socket_path)
+        listener.close()
+        mocker.patch.object(broker.os, 'getuid',
+                            return_value=os.getuid() + 1)
+        with pytest.raises(OSError, match='not a socket owned'):
+            broker.remove_stale_socket(socket_path)
+        assert os.path.exists(socket_path)
+
+    def test_attach(self, socket_path):
+        client = MagicMock(username='admin', password='password',
+                           verify=False, timeout=120,
+                           application_type='Ansible/3.4.0')
+        assert broker.attach(client, socket_path) is True
+        FakeClient.responses = [self.get_response(200, '[]')]
+        assert client.fetch_response('GET', self.url).json() == []
+        client.fetch_response.__self__.close()
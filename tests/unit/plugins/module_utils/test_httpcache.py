@@ -0,0 +1,156 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the conditional GET cache of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from PyPowerStore import client as sdk_client
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import httpcache
+
+
+def get_response(status_code, content=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'OK'
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+class TestHttpCache():
+
+    url = 'https://1.2.3.4:443/api/rest/policy'
+    headers = {'Accept': 'application/json', 'DELL-EMC-TOKEN': 'token'}
+
+    @pytest.fixture
+    def response_cache(self, tmp_path):
+        return httpcache.ResponseCache(str(tmp_path / 'http'), 1024 * 1024)
+
+    def test_not_modified(self, response_cache):
+        sent = []
+        responses = [
+            get_response(200, b'[{"id": "p1"}]',
+                              {'ETag': '"v1"', 'Set-Cookie': 'auth'}),
+            get_response(304)]
+
+        def request(method, url, **kwargs):
+            sent.append(kwargs['headers'])
+            return responses.pop(0)
+
+        conditional = httpcache.ConditionalRequests(
+            response_cache, MagicMock(request=request))
+        with httpcache.as_user('admin'):
+            conditional.request('GET', self.url, headers=self.headers,
+                                params={'select': 'id'})
+            response = conditional.request('GET', self.url,
+                                           headers=self.headers,
+                                           params={'select': 'id'})
+        assert 'If-None-Match' not in sent[0]
+        assert sent[1]['If-None-Match'] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == [{"id": "p1"}]
+        assert 'Set-Cookie' not in response.headers
+        assert conditional.hits == 1
+
+    def test_modified(self, response_cache):
+        responses = [
+            get_response(200, b'[]', {'Last-Modified': 'Mon'}),
+            get_response(200, b'[{"id": "p2"}]',
+                              {'Last-Modified': 'Tue'})]
+        requests_module = MagicMock()
+        requests_module.request.side_effect = \
+            lambda method, url, **kwargs: responses.pop(0)
+        conditional = httpcache.ConditionalRequests(response_cache,
+                                                    requests_module)
+        with httpcache.as_user('admin'):
+            conditional.request('GET', self.url, headers=self.headers)
+            response = conditional.request('GET', self.url,
+                                           headers=self.headers)
+        assert requests_module.request.call_args[1]['headers'][
+            'If-Modified-Since'] == 'Mon'
+        assert response.json() == [{"id": "p2"}]
+        assert conditional.hits == 0
+
+    @pytest.mark.parametrize('method, headers, response', [
+        ('POST', headers, get_response(200, b'{}', {'ETag': 'e'})),
+        ('GET', dict(headers, authorization='Basic'),
+         get_response(200, b'{}', {'ETag': 'e'})),
+        ('GET', headers, get_response(200, b'{}')),
+        ('GET', headers, get_response(404, b'{}', {'ETag': 'e'}))])
+    def test_not_cached(self, response_cache, method, headers, response):
+        requests_module = MagicMock()
+        requests_module.request.return_value = response
+        conditional = httpcache.ConditionalRequests(response_cache,
+                                                    requests_module)
+        with httpcache.as_user('admin'):
+            conditional.request(method, self.url, headers=headers)
+        assert not os.path.isdir(response_cache.cache_dir)
+
+    def test_cached_per_user(self, response_cache):
+        requests_module = MagicMock()
+        requests_module.request.return_value = get_response(
+            200, b'[]', {'ETag': '"v1"'})
+        conditional = httpcache.ConditionalRequests(response_cache,
+                                                    requests_module)
+        # The requests of the clients which are not attached are not cached
+        conditional.request('GET', self.url, headers=self.headers)
+        assert not os.path.isdir(response_cache.cache_dir)
+        with httpcache.as_user('admin'):
+            conditional.request('GET', self.url, headers=self.headers)
+        with httpcache.as_user('operator'):
+            conditional.request('GET', self.url, headers=self.headers)
+        assert 'If-None-Match' not in \
+            requests_module.request.call_args[1]['headers']
+        with httpcache.as_user('admin'):
+            conditional.request('GET', self.url, headers=self.headers)
+        assert requests_module.request.call_args[1]['headers'][
+            'If-None-Match'] == '"v1"'
+
+    def test_lru_eviction(self, tmp_path):
+        response_cache = httpcache.ResponseCache(str(tmp_path / 'http'), 400)
+        for index in range(3):
+            response_cache.write(str(index), dict(content='x' * 100))
+            path = response_cache.path(str(index))
+            os.utime(path, (index, index))
+        # Reading an entry marks it as recently used
+        assert response_cache.read('0') is not None
+        response_cache.write('3', dict(content='x' * 100))
+        assert response_cache.read('1') is None
+        assert response_cache.read('0') is not None
+        assert response_cache.read('3') is not None
+
+    def test_attach(self, tmp_path):
+        params = dict(cache_dir=str(tmp_path), http_cache_size=0)
+        client = MagicMock(username='admin')
+        client.fetch_response.side_effect = \
+            lambda *args: httpcache.CLIENT_USER.get()
+        assert httpcache.attach(client, params) is False
+        assert httpcache.attach(client, dict(params, http_cache_size=1)) \
+            is True
+        conditional = sdk_client.requests
+        assert isinstance(conditional, httpcache.ConditionalRequests)
+        assert conditional.cache.cache_dir == str(tmp_path / 'http')
+        # The requests of the client are sent as its user
+        assert client.fetch_response('GET', self.url) == 'admin'
+        assert httpcache.CLIENT_USER.get() is None
+        # The cache is installed once per process
+        assert httpcache.attach(MagicMock(), dict(params, http_cache_size=1)) \
+            is True
+        assert sdk_client.requests is conditional
+        sdk_client.requests = conditional.requests
@@ -0,0 +1,93 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the deferred imports and the cold start of the PowerStore
+   modules.
+
+   The cold start of every module is measured in a new interpreter. Set
+   POWERSTORE_COLD_START_REPORT to a file path to append the measured times
+   to it as JSON lines, or run this file directly to print them."""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import lazy
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import utils
+
+COLLECTION_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', '..'))
+MODULES = sorted(name[:-3] for name in os.listdir(
+    os.path.join(COLLECTION_DIR, 'plugins', 'modules'))
+    if name.endswith('.py') and name != '__init__.py')
+# Modules which are only imported once a module connects to an array
+DEFERRED_IMPORTS = ('requests', 'urllib3', 'PyPowerStore.client',
+                    'PyPowerStore.powerstore_conn')
+COLD_START = '''
+import json, sys, time
+start = time.perf_counter()
+import ansible_collections.dellemc.powerstore.plugins.modules.{0}
+print(json.dumps(dict(
+    time=time.perf_counter() - start,
+    loaded=[name for name in {1!r} if name in sys.modules])))
+'''
+
+
+def measure_cold_start(module_name):
+    """Import a module in a new interpreter, returning the time of the
+       import and the deferred imports which it loaded"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output(
+        [sys.executable, '-c', COLD_START.format(module_name,
+                                                 DEFERRED_IMPORTS)],
+        env=env, cwd=COLLECTION_DIR)
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+class TestLazy():
+
+    def test_lazy_module(self):
+        name = 'ansible_collections.dellemc.powerstore.tests.unit.plugins.' \
+               'module_utils.libraries.fail_json'
+        sys.modules.pop(name, None)
+        module = lazy.LazyModule(name)
+        assert name not in sys.modules
+        assert module.FailJsonException.__name__ == 'FailJsonException'
+        assert name in sys.modules
+        module.value = 1
+        assert sys.modules[name].value == 1
+
+    def test_is_available(self):
+        assert lazy.is_available('json', 'PyPowerStore') is True
+        assert lazy.is_available('json', 'not_a_module') is False
+
+    def test_version_check_memoized(self):
+        assert utils.py4ps_version_check() is utils.py4ps_version_check()
+        assert utils.has_pyu4ps_sdk() is utils.has_pyu4ps_sdk()
+
+    @pytest.mark.parametrize('module_name', MODULES)
+    def test_cold_start(self, module_name):
+        result = measure_cold_start(module_name)
+        assert result['loaded'] == []
+        report = os.environ.get('POWERSTORE_COLD_START_REPORT')
+        if report:
+            with open(report, 'a') as report_file:
+                report_file.write(json.dumps(dict(
+                    module=module_name, time=result['time'])) + '\n')
+
+
+if __name__ == '__main__':
+    for module_name in MODULES:
+        result = measure_cold_start(module_name)
+        print('{0:<28} {1:8.1f} ms {2}'.format(
+            module_name, result['time'] * 1000, ' '.join(result['loaded'])))
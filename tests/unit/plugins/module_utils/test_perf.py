@@ -0,0 +1,127 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the timing of the REST requests of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from PyPowerStore import powerstore_conn
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import perf
+
+
+class TestPerf():
+
+    @pytest.fixture
+    def conn(self):
+        conn = powerstore_conn.PowerStoreConn(
+            username='admin', password='password', server_ip='1.2.3.4',
+            verify=False, application_type='Ansible/3.4.0', timeout=120)
+
+        auth_manager = conn.provisioning.client.auth_manager
+
+        def fetch_response(http_method, url, payload=None, querystring=None,
+                           myrange=None):
+            if not auth_manager.dell_emc_token:
+                auth_manager.login()
+            response = MagicMock(status_code=200, content=b'[]',
+                                 headers={'Content-Encoding': 'gzip',
+                                          'Content-Length': '10'})
+            if 'software_installed' in url:
+                response.json.return_value = [
+                    {'release_version': '3.6.0.0'}]
+            else:
+                response.json.return_value = {'id': 'v1', 'name': 'vol'}
+            return response
+
+        conn.provisioning.client.fetch_response = fetch_response
+        auth_manager.login = MagicMock(side_effect=lambda: setattr(
+            auth_manager, 'dell_emc_token', 'token'))
+        return conn
+
+    @pytest.mark.parametrize('url, endpoint', [
+        ('https://1.2.3.4:443/api/rest/volume?select=id',
+         '/api/rest/volume'),
+        ('https://1.2.3.4:443/api/rest/volume/v1', '/api/rest/volume/{id}'),
+        ('https://1.2.3.4/api/rest/volume/v1/snapshot',
+         '/api/rest/volume/{id}/snapshot')])
+    def test_get_endpoint(self, url, endpoint):
+        assert perf.get_endpoint(url) == endpoint
+
+    @pytest.mark.parametrize('attrs, headers, sizes', [
+        (dict(raw=MagicMock(**{'tell.return_value': 30})),
+         {'Content-Encoding': 'gzip'}, (100, 30)),
+        (dict(wire_size=40, raw=None),
+         {'Content-Encoding': 'gzip', 'Content-Length': '40'}, (100, 40)),
+        (dict(raw=None), {'Content-Encoding': 'gzip', 'Content-Length': '50'},
+         (100, 50)),
+        (dict(raw=None), {'Content-Length': '100'}, (100, 100))])
+    def test_get_sizes(self, attrs, headers, sizes):
+        response = MagicMock(content=b'x' * 100, headers=headers,
+                             spec=['content', 'headers'] + list(attrs))
+        for name, value in attrs.items():
+            setattr(response, name, value)
+        assert perf.get_sizes(response) == sizes
+
+    def test_stats(self, conn):
+        recorder = perf.attach(conn, dict(perf_stats=True))
+        conn.provisioning.get_volume_details('v1')
+        conn.provisioning.get_volume_details('v1')
+        stats = recorder.get_stats()
+        assert stats['request_count'] == 8
+        assert stats['login_count'] == 1
+        assert stats['bytes'] == 16
+        assert stats['wire_bytes'] == 80
+        assert stats['calls']['provisioning.get_volume_details'][
+            'wire_bytes'] == 80
+        # The requests of the SDK calls made by other SDK calls, such as
+        # the version checks, are attributed to the call of the module
+        assert list(stats['calls']) == ['provisioning.get_volume_details']
+        assert stats['calls']['provisioning.get_volume_details'][
+            'count'] == 2
+        endpoint = stats['endpoints']['GET /api/rest/volume/{id}']
+        assert endpoint['count'] == 2
+        assert endpoint['statuses'] == {'200': 2}
+
+    def test_trace_file(self, conn, tmp_path):
+        trace_file = str(tmp_path / 'trace.jsonl')
+        recorder = perf.attach(conn, dict(perf_trace_file=trace_file))
+        module = MagicMock()
+        exit_json = module.exit_json
+        perf.report(module, recorder, dict(perf_trace_file=trace_file))
+        conn.protection.get_snapshot_rule_details('s1')
+        module.exit_json(changed=False)
+        exit_json.assert_called_once_with(changed=False)
+        with open(trace_file) as trace:
+            records = [json.loads(line) for line in trace]
+        assert [(record['method'], record['endpoint'], record['call'])
+                for record in records][-1] == \
+            ('GET', '/api/rest/snapshot_rule/{id}',
+             'protection.get_snapshot_rule_details')
+
+    def test_report(self, conn):
+        params = dict(perf_stats=True)
+        recorder = perf.attach(conn, params)
+        module = MagicMock()
+        fail_json = module.fail_json
+        perf.report(module, recorder, params)
+        conn.provisioning.get_volume_details('v1')
+        module.fail_json(msg='failed')
+        perf_stats = fail_json.call_args[1]['_perf']
+        assert perf_stats['request_count'] == 4
+        assert perf_stats['total_time'] >= perf_stats['request_time']
+
+    def test_disabled(self, conn):
+        assert perf.attach(conn, dict(perf_stats=False)) is None
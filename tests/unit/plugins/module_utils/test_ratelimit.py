@@ -0,0 +1,82 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the rate limiter of the REST requests of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+
+import pytest
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import ratelimit
+
+
+class TestRateLimit():
+
+    url = 'https://1.2.3.4:443/api/rest/volume'
+
+    @pytest.fixture
+    def lock_dir(self, tmp_path):
+        return str(tmp_path / 'cache')
+
+    def test_rate_shared(self, lock_dir, mocker):
+        clock = mocker.patch.object(ratelimit.time, 'time',
+                                    return_value=1000.0)
+        # Each limiter stands in for a module process
+        first = ratelimit.RateLimiter(lock_dir, '1.2.3.4', rate=2)
+        second = ratelimit.RateLimiter(lock_dir, '1.2.3.4', rate=2)
+        assert [first.reserve(), second.reserve(), first.reserve(),
+                second.reserve()] == [0, 0, 0.5, 1.0]
+        other_array = ratelimit.RateLimiter(lock_dir, '5.6.7.8', rate=2)
+        assert other_array.reserve() == 0
+        clock.return_value = 1002.0
+        assert first.reserve() == 0
+
+    def test_in_flight(self, lock_dir):
+        first = ratelimit.RateLimiter(lock_dir, '1.2.3.4', max_in_flight=1)
+        second = ratelimit.RateLimiter(lock_dir, '1.2.3.4', max_in_flight=1)
+        sent = threading.Event()
+
+        def send():
+            with second.limit():
+                sent.set()
+
+        with first.limit():
+            thread = threading.Thread(target=send)
+            thread.start()
+            assert not sent.wait(0.2)
+        assert sent.wait(5)
+        thread.join(5)
+
+    def test_attach(self, lock_dir, mocker):
+        sleep = mocker.patch.object(ratelimit.time, 'sleep')
+        mocker.patch.object(ratelimit.time, 'time', return_value=1000.0)
+        client = MagicMock()
+        fetch_response = client.fetch_response
+        params = dict(array_ip='1.2.3.4', cache_dir=lock_dir, rate_limit=1,
+                      max_in_flight=2)
+        assert ratelimit.attach(client, params) is True
+        client.fetch_response('GET', self.url)
+        client.fetch_response('GET', self.url, myrange='100-2100')
+        fetch_response.assert_called_with(
+            'GET', self.url, payload=None, querystring=None,
+            myrange='100-2100')
+        assert [call[0][0] for call in sleep.call_args_list] == [0, 1.0]
+
+    def test_attach_disabled(self, lock_dir):
+        client = MagicMock()
+        fetch_response = client.fetch_response
+        params = dict(array_ip='1.2.3.4', cache_dir=lock_dir, rate_limit=0,
+                      max_in_flight=0)
+        assert ratelimit.attach(client, params) is False
+        assert client.fetch_response is fetch_response
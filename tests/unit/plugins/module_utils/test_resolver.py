@@ -0,0 +1,121 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the name resolver of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import resolver
+
+VG_ID = '634e4b95-e7bd-49e7-957b-6dc932642464'
+
+
+def get_conn(entities):
+    """Get a connection whose listings return the entities matching the
+       in.() filter"""
+    conn = MagicMock()
+    conn.provisioning.server_ip = '1.2.3.4:443'
+
+    def request(http_method, url, querystring=None, all_pages=None):
+        for field in ('name', 'id'):
+            if field in querystring:
+                values = querystring[field][4:-1].split(',')
+                return [entity for entity in entities
+                        if entity[field] in values]
+    conn.provisioning.client.request = MagicMock(side_effect=request)
+    return conn
+
+
+class TestResolver():
+
+    entities = [dict(id=VG_ID, name='vg1'), dict(id='vg2_id', name='vg2'),
+                dict(id='vg3_id', name='dup'), dict(id='vg4_id', name='dup')]
+
+    def test_batched_and_memoized(self):
+        conn = get_conn(self.entities)
+        name_resolver = resolver.NameResolver(conn)
+        found = name_resolver.find('volume_group', ['vg1', 'vg2', 'vg5'])
+        assert [entity['id'] for entity in found['vg1']] == [VG_ID]
+        assert found['vg5'] == []
+        request = conn.provisioning.client.request
+        assert request.call_count == 1
+        assert request.call_args[0][1] == \
+            'https://1.2.3.4:443/api/rest/volume_group'
+        assert request.call_args[1]['querystring']['name'] == 'in.(vg1,vg2,vg5)'
+        assert name_resolver.find('volume_group', ['vg2', 'vg5', 'vg1'])[
+            'vg2'][0]['id'] == 'vg2_id'
+        assert request.call_count == 1
+        name_resolver.forget('volume_group', ['vg5'])
+        name_resolver.find('volume_group', ['vg1', 'vg5'])
+        conn.provisioning.get_volume_group_by_name.assert_called_once_with(
+            'vg5')
+
+    def test_single_name_through_sdk(self):
+        conn = get_conn(self.entities)
+        conn.protection.get_policy_by_name.return_value = [
+            dict(id='qos_id', name='qos', type='QoS')]
+        name_resolver = resolver.NameResolver(conn)
+        assert name_resolver.get_id('qos_policy', 'qos') == 'qos_id'
+        assert name_resolver.get_id('qos_policy', 'qos') == 'qos_id'
+        conn.protection.get_policy_by_name.assert_called_once_with(
+            'qos', policy_type='QoS')
+        conn.provisioning.client.request.assert_not_called()
+
+    def test_resolve(self):
+        conn = get_conn(self.entities)
+        name_resolver = resolver.NameResolver(conn)
+        missing_id = '0e1b3b2c-8a43-4a3c-9bdb-4b6c3a4a2b1d'
+        assert name_resolver.resolve(
+            'volume_group', ['vg2', VG_ID, missing_id, 'vg5']) == \
+            {'vg2': 'vg2_id', VG_ID: VG_ID}
+        with pytest.raises(ValueError, match='named dup'):
+            name_resolver.resolve('volume_group', ['vg1', 'dup'])
+
+    def test_large_batch(self):
+        names = ['vol{0}'.format(index) for index in range(120)]
+        conn = get_conn([dict(id=name + '_id', name=name) for name in names])
+        resolved = resolver.NameResolver(conn).resolve('volume', names,
+                                                       appliance_id='A1')
+        assert len(resolved) == 120
+        request = conn.provisioning.client.request
+        assert request.call_count == 3
+        assert request.call_args[1]['querystring']['appliance_id'] == 'eq.A1'
+
+    def test_format_in(self):
+        assert resolver.format_in(['a', 'b c', 'd,e', 'f"g']) == \
+            'in.(a,"b c","d,e","f\\"g")'
+
+    def test_cached_across_tasks(self, tmp_path):
+        params = dict(array_ip='1.2.3.4', port=None, user='admin',
+                      cache_ttl=60, cache_dir=str(tmp_path))
+        entities = [dict(id='rs1_id', name='rs1'), dict(id='rs2_id',
+                                                        name='rs2')]
+        resolver.NameResolver(get_conn(entities), params).find(
+            'remote_system', ['rs1', 'rs2'])
+        conn = get_conn(entities)
+        assert resolver.NameResolver(conn, params).resolve(
+            'remote_system', ['rs1', 'rs2']) == {'rs1': 'rs1_id',
+                                                 'rs2': 'rs2_id'}
+        conn.provisioning.client.request.assert_not_called()
+        # The entries of another user are not shared
+        conn = get_conn(entities)
+        resolver.NameResolver(conn, dict(params, user='operator')).find(
+            'remote_system', ['rs1', 'rs2'])
+        assert conn.provisioning.client.request.call_count == 1
+
+    def test_get_resolver(self):
+        conn = MagicMock()
+        assert resolver.get_resolver(conn) is resolver.get_resolver(conn)
+        assert resolver.get_resolver(conn) is not \
+            resolver.get_resolver(MagicMock())
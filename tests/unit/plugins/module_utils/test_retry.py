@@ -0,0 +1,136 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the retries of the REST requests of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import retry
+
+
+class FakeClient(object):
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def fetch_response(self, http_method, url, payload=None,
+                       querystring=None, myrange=None):
+        self.requests.append(http_method)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        if isinstance(response, int):
+            response = MagicMock(status_code=response, headers={})
+        return response
+
+
+class TestRetry():
+
+    url = 'https://1.2.3.4:443/api/rest/volume'
+    params = dict(max_retries=3, retry_budget=10, retry_backoff=1.0)
+
+    @pytest.fixture(autouse=True)
+    def sleep(self, mocker):
+        return mocker.patch.object(retry.time, 'sleep')
+
+    @staticmethod
+    def get_connect_error():
+        return requests.exceptions.ConnectionError(MaxRetryError(
+            None, '/api/rest/volume', NewConnectionError(None, 'refused')))
+
+    def get_client(self, responses, **params):
+        client = FakeClient(responses)
+        policy = retry.attach(client, dict(self.params, **params))
+        return client, policy
+
+    def test_get_retried(self, sleep):
+        client, policy = self.get_client([
+            503, requests.exceptions.ReadTimeout('timed out'), 502, 200])
+        assert client.fetch_response('GET', self.url).status_code == 200
+        assert len(client.requests) == 4
+        assert policy.get_stats() == dict(
+            count=3, reasons={'503': 1, 'ReadTimeout': 1, '502': 1},
+            budget_exhausted=False)
+        delays = [call[0][0] for call in sleep.call_args_list]
+        assert [delay <= 2 ** attempt for attempt, delay in
+                enumerate(delays)] == [True, True, True]
+
+    def test_write_retried_when_safe(self):
+        client, policy = self.get_client([429, self.get_connect_error(), 201])
+        assert client.fetch_response('POST', self.url).status_code == 201
+        assert policy.get_stats()['reasons'] == {'429': 1,
+                                                 'ConnectionError': 1}
+
+    @pytest.mark.parametrize('failure', [
+        502, requests.exceptions.ReadTimeout('timed out'),
+        requests.exceptions.ConnectionError('Connection reset by peer')])
+    def test_write_not_retried(self, failure):
+        client, policy = self.get_client([failure, 201])
+        if isinstance(failure, int):
+            assert client.fetch_response(
+                'DELETE', self.url).status_code == failure
+        else:
+            with pytest.raises(type(failure)):
+                client.fetch_response('DELETE', self.url)
+        assert len(client.requests) == 1
+        assert policy.count == 0
+
+    def test_not_retried(self):
+        client, policy = self.get_client([
+            404, requests.exceptions.SSLError('certificate verify failed')])
+        assert client.fetch_response('GET', self.url).status_code == 404
+        with pytest.raises(requests.exceptions.SSLError):
+            client.fetch_response('GET', self.url)
+        assert policy.count == 0
+
+    def test_max_retries(self):
+        client, policy = self.get_client([503, 503, 503, 200], max_retries=2)
+        assert client.fetch_response('GET', self.url).status_code == 503
+        assert policy.count == 2
+
+    def test_retry_budget(self):
+        client, policy = self.get_client([503, 503, 200, 503, 200],
+                                         retry_budget=2)
+        assert client.fetch_response('GET', self.url).status_code == 200
+        assert client.fetch_response('GET', self.url).status_code == 503
+        assert policy.get_stats()['budget_exhausted'] is True
+
+    def test_retry_after(self, sleep):
+        response = MagicMock(status_code=429, headers={'Retry-After': '7'})
+        client, policy = self.get_client([response, 200])
+        client.fetch_response('PATCH', self.url)
+        sleep.assert_called_once_with(7.0)
+
+    def test_retries_disabled(self):
+        client = FakeClient([])
+        fetch_response = client.fetch_response
+        assert retry.attach(client, dict(self.params, max_retries=0)) is None
+        assert client.fetch_response == fetch_response
+
+    def test_report(self):
+        module = MagicMock()
+        exit_json = module.exit_json
+        fail_json = module.fail_json
+        client, policy = self.get_client([200, 503, 200])
+        retry.report(module, policy)
+        client.fetch_response('GET', self.url)
+        module.exit_json(changed=False)
+        exit_json.assert_called_once_with(changed=False)
+        client.fetch_response('GET', self.url)
+        module.fail_json(msg='failed')
+        fail_json.assert_called_once_with(msg='failed', retries=dict(
+            count=1, reasons={'503': 1}, budget_exhausted=False))
@@ -0,0 +1,153 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the session cache of PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import os
+
+import pytest
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from PyPowerStore.client import AuthenticationManager
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import session
+
+
+class FakeAuthManager(AuthenticationManager):
+
+    logins = []
+
+    def login(self):
+        FakeAuthManager.logins.append(self.username)
+        self.dell_emc_token = 'token{0}'.format(len(FakeAuthManager.logins))
+        self.cookie = 'cookie'
+        self.idle_timeout = 3600
+        self.creation_time = 1000.0 + len(FakeAuthManager.logins)
+
+
+class FakeClient(object):
+
+    def __init__(self, responses, username='admin'):
+        self.auth_manager = FakeAuthManager(username, 'password', False,
+                                            'Ansible/3.4.0', 120)
+        self.responses = responses
+        self.tokens = []
+
+    def fetch_response(self, http_method, url, payload=None,
+                       querystring=None, myrange=None):
+        headers = self.auth_manager.get_token_and_cookie()
+        self.tokens.append(headers['DELL-EMC-TOKEN'])
+        status_code, body = self.responses.pop(0), {}
+        if isinstance(status_code, tuple):
+            status_code, body = status_code
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = body
+        return response
+
+
+class TestSession():
+
+    url = 'https://1.2.3.4:443/api/rest/volume'
+    expired_token = (403, {'messages': [{
+        'code': '0xE04040030001', 'severity': 'Error',
+        'message_l10n': 'The DELL-EMC-TOKEN is invalid or expired.'}]})
+    forbidden = (403, {'messages': [{
+        'code': '0xE09040020001', 'severity': 'Error',
+        'message_l10n': 'The user is not authorized to perform the '
+                        'operation.'}]})
+
+    @pytest.fixture
+    def params(self, tmp_path, mocker):
+        FakeAuthManager.logins = []
+        mocker.patch.object(session.time, 'time', return_value=1100.0)
+        return dict(array_ip='1.2.3.4', port=None, user='admin',
+                    password='password', cache_dir=str(tmp_path / 'cache'))
+
+    def get_client(self, params, responses):
+        client = FakeClient(responses, params['user'])
+        assert session.attach(client, params) is True
+        return client
+
+    def test_session_reused(self, params):
+        first = self.get_client(params, [200, 200])
+        second = self.get_client(params, [200])
+        first.fetch_response('GET', self.url)
+        first.fetch_response('GET', self.url)
+        second.fetch_response('GET', self.url)
+        assert FakeAuthManager.logins == ['admin']
+        assert second.tokens == ['token1']
+        cache_files = [name for name in os.listdir(params['cache_dir'])
+                       if name.endswith('.json')]
+        assert len(cache_files) == 1
+        # The file name is not an unsalted hash of the credentials
+        assert cache_files[0] != hashlib.sha256(
+            b'1.2.3.4:443:admin:session:admin:password').hexdigest() + \
+            '.json'
+        secret_path = os.path.join(params['cache_dir'],
+                                   session.SECRET_FILE)
+        assert os.stat(secret_path).st_mode & 0o777 == 0o600
+        assert len(session.get_secret(params['cache_dir'])) == 64
+        mode = os.stat(os.path.join(params['cache_dir'],
+                                    cache_files[0])).st_mode
+        assert mode & 0o777 == 0o600
+
+    def test_session_per_user(self, params):
+        self.get_client(params, [200]).fetch_response('GET', self.url)
+        other = dict(params, user='other')
+        self.get_client(other, [200]).fetch_response('GET', self.url)
+        other_password = dict(params, password='other')
+        self.get_client(other_password, [200]).fetch_response('GET', self.url)
+        assert FakeAuthManager.logins == ['admin', 'other', 'admin']
+
+    def test_rejected_session_refreshed(self, params):
+        first = self.get_client(params, [200, 401, 200])
+        first.fetch_response('GET', self.url)
+        response = first.fetch_response('GET', self.url)
+        assert response.status_code == 200
+        assert first.tokens == ['token1', 'token1', 'token2']
+        # The refreshed session replaces the rejected one in the cache
+        second = self.get_client(params, [200])
+        second.fetch_response('GET', self.url)
+        assert second.tokens == ['token2']
+        assert len(FakeAuthManager.logins) == 2
+
+    def test_refreshed_session_reused(self, params):
+        first = self.get_client(params, [200, 401, 200])
+        second = self.get_client(params, [200, self.expired_token, 200])
+        first.fetch_response('GET', self.url)
+        second.fetch_response('GET', self.url)
+        first.fetch_response('GET', self.url)
+        # The session refreshed by the first client is not the one rejected
+        second.fetch_response('GET', self.url)
+        assert second.tokens == ['token1', 'token1', 'token2']
+        assert len(FakeAuthManager.logins) == 2
+
+    def test_session_expired(self, params, mocker):
+        self.get_client(params, [200]).fetch_response('GET', self.url)
+        mocker.patch.object(session.time, 'time', return_value=1100.0 + 3600)
+        client = self.get_client(params, [200])
+        client.fetch_response('GET', self.url)
+        assert client.tokens == ['token2']
+
+    def test_forbidden_not_refreshed(self, params):
+        client = self.get_client(params, [200, self.forbidden])
+        client.fetch_response('GET', self.url)
+        response = client.fetch_response('GET', self.url)
+        assert response.status_code == 403
+        assert client.tokens == ['token1', 'token1']
+        assert FakeAuthManager.logins == ['admin']
+
+    def test_secret_per_cache_dir(self, tmp_path):
+        first = session.get_secret(str(tmp_path / 'first'))
+        assert session.get_secret(str(tmp_path / 'first')) == first
+        assert session.get_secret(str(tmp_path / 'second')) != first
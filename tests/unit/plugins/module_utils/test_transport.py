@@ -0,0 +1,96 @@
+# Copyright: (c) 2024, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the transport over the persistent connection of
+   PowerStore"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+
+import pytest
+import requests
+
+try:
+    from mock.mock import MagicMock
+except ImportError:
+    from unittest.mock import MagicMock
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import transport
+
+
+class TestHttpApiTransport():
+
+    @pytest.fixture
+    def client(self, mocker):
+        self.get_connection(mocker)
+        client = MagicMock(application_type='Ansible/3.4.0')
+        assert transport.attach(client, '/tmp/socket', '1.2.3.4', 443) is True
+        return client
+
+    @staticmethod
+    def get_connection(mocker, host='1.2.3.4', port=443):
+        connection = MagicMock()
+        connection.get_option.side_effect = \
+            lambda option: {'host': host, 'port': port}[option]
+        mocker.patch.object(transport, 'Connection', return_value=connection)
+        return connection
+
+    def test_attach_other_array(self, mocker):
+        self.get_connection(mocker, host='5.6.7.8')
+        client = MagicMock(application_type='Ansible/3.4.0')
+        with pytest.raises(ValueError, match='5.6.7.8'):
+            transport.attach(client, '/tmp/socket', '1.2.3.4', 443)
+
+    def test_attach_other_port(self, mocker):
+        self.get_connection(mocker, port=8443)
+        client = MagicMock(application_type='Ansible/3.4.0')
+        with pytest.raises(ValueError, match='8443'):
+            transport.attach(client, '/tmp/socket', '1.2.3.4', 443)
+
+    def test_attach_default_port(self, mocker):
+        self.get_connection(mocker, host='Array.example.com', port=None)
+        client = MagicMock(application_type='Ansible/3.4.0')
+        assert transport.attach(client, '/tmp/socket', 'array.example.com',
+                                443) is True
+
+    def test_fetch_response(self, client):
+        connection = client.fetch_response.__self__.connection
+        connection.send_request.return_value = dict(
+            status_code=206, reason='Partial Content',
+            headers={'Content-Range': '0-99/150'},
+            content=base64.b64encode(b'[{"id": "1"}]').decode('ascii'))
+        response = client.fetch_response(
+            'GET', 'https://1.2.3.4:443/api/rest/node',
+            querystring={'select': 'id'}, myrange='100-2100')
+        connection.send_request.assert_called_once_with(
+            None, path='/api/rest/node', method='GET',
+            query={'select': 'id'},
+            headers={'Application-Type': 'Ansible/3.4.0',
+                     'Accept-Encoding': 'gzip',
+                     'DELL-VISIBILITY': 'internal', 'Range': '100-2100'})
+        assert response.status_code == 206
+        assert response.headers['content-range'] == '0-99/150'
+        assert response.json() == [{"id": "1"}]
+
+    def test_fetch_response_with_payload(self, client):
+        connection = client.fetch_response.__self__.connection
+        connection.send_request.return_value = dict(
+            status_code=204, reason='No Content', headers={}, content='')
+        response = client.fetch_response(
+            'PATCH', 'https://1.2.3.4:443/api/rest/volume/1',
+            payload={'size': 1})
+        assert connection.send_request.call_args[0][0] == '{"size": 1}'
+        assert response.content == b''
+
+    def test_fetch_response_error(self, client):
+        connection = client.fetch_response.__self__.connection
+        connection.send_request.side_effect = ConnectionError('closed')
+        with pytest.raises(requests.exceptions.ConnectionError,
+                           match='closed'):
+            client.fetch_response('GET', 'https://1.2.3.4:443/api/rest/volume')
@@ -15,7 +15,10 @@ from mock.mock import MagicMock
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock_host_api import MockHostApi
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
-from ansible_collections.dellemc.powerstore.plugins.modules.host import PowerStoreHost, HostHandler
+from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.libraries.fail_json \
+    import FailJsonException, fail_json
+from ansible_collections.dellemc.powerstore.plugins.modules.host import PowerStoreHost, HostHandler, \
+    HostBulkHandler
 
 
 class TestPowerstoreHost():
@@ -643,3 +646,78 @@ class TestPowerstoreHost():
             return_value=MockHostApi.HOST_DETAILS)
         HostHandler().handle(host_module_mock, host_module_mock.module.params)
         host_module_mock.conn.provisioning.delete_host.assert_called()
+
+    BULK_HOSTS = [
+        {'id': 'host1_id', 'name': 'node_1', 'description': None, 'os_type': 'ESXi',
+         'host_group_id': None, 'host_initiators': [
+             {'port_name': '21:00:00:24:ff:31:e9:01', 'port_type': 'FC'}]},
+        {'id': 'host9_id', 'name': 'other_host', 'description': None, 'os_type': 'Linux',
+         'host_group_id': None, 'host_initiators': [
+             {'port_name': '21:00:00:24:ff:31:e9:09', 'port_type': 'FC'}]}]
+
+    def get_bulk_args(self, hosts, **kwargs):
+        self.get_module_args = dict(self.get_module_args)
+        self.get_module_args.update(dict(
+            hosts=[dict(dict.fromkeys(('os_type', 'host_connectivity', 'description',
+                                       'initiators', 'detailed_initiators')), **host)
+                   for host in hosts],
+            host_name=None, host_id=None, initiators=None, detailed_initiators=None,
+            new_name=None, host_connectivity=None, description=None, os_type='ESXi',
+            state='present', initiator_state='present-in-host', max_workers=4), **kwargs)
+        return self.get_module_args
+
+    @staticmethod
+    def reset_bulk_mocks(host_module_mock):
+        provisioning = host_module_mock.conn.provisioning
+        provisioning.get_hosts = MagicMock(return_value=TestPowerstoreHost.BULK_HOSTS)
+        provisioning.get_host_by_name = MagicMock()
+        provisioning.create_host = MagicMock()
+        provisioning.modify_host = MagicMock()
+        provisioning.delete_host = MagicMock()
+
+    def test_bulk_create_and_modify_hosts(self, host_module_mock):
+        host_module_mock.module.params = self.get_bulk_args([
+            {'host_name': 'node_1', 'initiators': ['21:00:00:24:ff:31:e9:01', '21:00:00:24:ff:31:e9:02']},
+            {'host_name': 'node_2', 'initiators': ['21:00:00:24:ff:31:e9:03']}])
+        self.reset_bulk_mocks(host_module_mock)
+        HostBulkHandler().handle(host_module_mock, host_module_mock.module.params)
+        get_hosts = host_module_mock.conn.provisioning.get_hosts
+        assert 'name' not in get_hosts.call_args_list[0][1]['filter_dict']
+        assert get_hosts.call_args_list[1][1]['filter_dict']['name'] == 'in.(node_1,node_2)'
+        host_module_mock.conn.provisioning.get_host_by_name.assert_not_called()
+        host_module_mock.conn.provisioning.create_host.assert_called_once_with(
+            name='node_2', os_type='ESXi', host_connectivity=None, description=None,
+            initiators=[{'port_name': '21:00:00:24:ff:31:e9:03', 'port_type': 'FC'}])
+        modify_args = host_module_mock.conn.provisioning.modify_host.call_args[1]
+        assert modify_args['host_id'] == 'host1_id'
+        assert modify_args['add_initiators'] == [{'port_name': '21:00:00:24:ff:31:e9:02', 'port_type': 'FC'}]
+        results = host_module_mock.module.exit_json.call_args[1]['hosts']
+        assert [result['action'] for result in results] == ['modify', 'create']
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    def test_bulk_hosts_conflicts_fail_before_writes(self, host_module_mock):
+        host_module_mock.module.fail_json = fail_json
+        host_module_mock.module.params = self.get_bulk_args([
+            {'host_name': 'node_2', 'initiators': ['21:00:00:24:FF:31:E9:09']},
+            {'host_name': 'node_3', 'initiators': ['21:00:00:24:ff:31:e9:04']},
+            {'host_name': 'node_4', 'initiators': ['21:00:00:24:ff:31:e9:04']}])
+        self.reset_bulk_mocks(host_module_mock)
+        with pytest.raises(FailJsonException) as error:
+            HostBulkHandler().handle(host_module_mock, host_module_mock.module.params)
+        assert 'already registered to host other_host' in error.value.message
+        assert 'given for both hosts node_3 and node_4' in error.value.message
+        host_module_mock.conn.provisioning.create_host.assert_not_called()
+
+    def test_bulk_hosts_check_mode_and_absent(self, host_module_mock):
+        host_module_mock.module.check_mode = True
+        host_module_mock.module.params = self.get_bulk_args([
+            {'host_name': 'node_1'}, {'host_name': 'node_2'}],
+            state='absent', initiator_state=None)
+        self.reset_bulk_mocks(host_module_mock)
+        host_module_mock.conn.provisioning.get_hosts = MagicMock(return_value=self.BULK_HOSTS[:1])
+        HostBulkHandler().handle(host_module_mock, host_module_mock.module.params)
+        assert host_module_mock.conn.provisioning.get_hosts.call_count == 1
+        host_module_mock.conn.provisioning.delete_host.assert_not_called()
+        results = host_module_mock.module.exit_json.call_args[1]['hosts']
+        assert [result['action'] for result in results] == ['delete', None]
+        assert host_module_mock.module.exit_json.call_args[1]['changed'] is True
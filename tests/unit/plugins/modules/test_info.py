@@ -10,6 +10,10 @@ __metaclass__ = type
 
 import pytest
 import copy
+import gzip
+import json
+import threading
+import time
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.libraries import initial_mock
 
@@ -22,6 +26,9 @@ from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock
     import MockApiException
 
 from ansible_collections.dellemc.powerstore.plugins.modules.info import PowerstoreInfo
+from PyPowerStore.utils import helpers
+from ansible_collections.dellemc.powerstore.plugins.module_utils.storage.dell \
+    import utils
 
 
 class TestPowerstoreInfo():
@@ -49,6 +56,10 @@ class TestPowerstoreInfo():
         MockApiException.status_code = "500"
         MockApiException.body = "PyPowerStore Error message"
         self.get_module_args = copy.deepcopy(MockInfoApi.INFO_COMMON_ARGS)
+        # A module of its own, so that the params and the failures of the
+        # other tests are not seen
+        mocker.patch(MockInfoApi.MODULE_PATH.rsplit('.', 1)[0] + '.AnsibleModule',
+                     return_value=MagicMock(params=self.get_module_args))
         info_module_mock = PowerstoreInfo()
         # Reset get_array_version to default value for test isolation
         info_module_mock.provisioning.get_array_version = MagicMock(return_value='4.0.0.0')
@@ -679,3 +690,569 @@ class TestPowerstoreInfo():
             info_module_mock._get_recycle_bin_items
         info_module_mock.perform_module_operation()
         info_module_mock._get_recycle_bin_items.assert_called()
+
+    # U-138 - Concurrent subset gathering
+    def test_get_subsets_concurrently(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol', 'host', 'file_system'],
+            'max_workers': 3
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_volumes.return_value = [{"id": "1"}]
+        info_module_mock.provisioning.get_hosts.return_value = [{"id": "2"}]
+        info_module_mock.provisioning.get_file_systems.return_value = [
+            {"id": "3"}]
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Volumes'] == [{"id": "1"}]
+        assert result['Hosts'] == [{"id": "2"}]
+        assert result['FileSystems'] == [{"id": "3"}]
+        assert [key for key in result if key in (
+            'Volumes', 'Hosts', 'FileSystems')] == \
+            ['Volumes', 'Hosts', 'FileSystems']
+
+    # U-139 - Concurrent subset gathering failure
+    def test_get_subsets_concurrently_exception(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol', 'host'],
+            'max_workers': 2
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_hosts.side_effect = \
+            MockApiException
+        info_module_mock.perform_module_operation()
+        assert 'Get Hosts for powerstore array name' in \
+            info_module_mock.module.fail_json.call_args[1]['msg']
+        assert 'Hosts' not in info_module_mock.module.exit_json.call_args[1]
+
+    # U-140 - SMB share ACL enrichment
+    def test_get_smb_shares_with_acl(self, info_module_mock, mocker):
+        self.get_module_args.update({
+            'gather_subset': ['smb_share']
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_smb_shares.return_value = [
+            {"id": "share_1"}, {"id": "share_2"}]
+        info_module_mock.provisioning.get_acl.side_effect = \
+            lambda share_id: {"aces": [{"trustee_name": share_id}]}
+        run_concurrently = mocker.patch(
+            MockInfoApi.MODULE_UTILS_PATH + '.run_concurrently',
+            wraps=utils.run_concurrently)
+        info_module_mock.perform_module_operation()
+        # The ACLs are fetched with their own pool, not max_workers
+        assert run_concurrently.call_args[1]['max_workers'] == 4
+        shares = info_module_mock.module.exit_json.call_args[1]['SMBShares']
+        assert shares[0]['aces'] == [{"trustee_name": "share_1"}]
+        assert shares[1]['aces'] == [{"trustee_name": "share_2"}]
+
+    # U-141 - SMB share without ACL enrichment
+    def test_get_smb_shares_without_acl(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['smb_share'],
+            'include_acl': False
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_smb_shares.return_value = [
+            {"id": "share_1"}]
+        info_module_mock.perform_module_operation()
+        info_module_mock.provisioning.get_acl.assert_not_called()
+        shares = info_module_mock.module.exit_json.call_args[1]['SMBShares']
+        assert 'aces' not in shares[0]
+
+    # U-142 - SMB share ACL enrichment timeout
+    def test_get_smb_shares_acl_timeout(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['smb_share'],
+            'acl_timeout': 0
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_smb_shares.return_value = [
+            {"id": "share_1"}]
+        info_module_mock.provisioning.get_acl.side_effect = \
+            lambda share_id: time.sleep(1)
+        info_module_mock.perform_module_operation()
+        assert 'could not be fetched within 0 seconds' in \
+            info_module_mock.module.fail_json.call_args[1]['msg']
+
+    # U-143 - Recycle bin filters are applied by the array
+    def test_get_recycle_bin_with_filter(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['recycle_bin'],
+            'filters': [{'filter_key': 'resource_type',
+                         'filter_operator': 'equal',
+                         'filter_value': 'Volume'},
+                        {'filter_key': 'name',
+                         'filter_operator': 'like',
+                         'filter_value': 'vol*'}],
+            'all_pages': True
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.server_ip = '1.2.3.4:443'
+        info_module_mock.provisioning.client.request.return_value = [
+            {"id": "1", "resource_type": "Volume", "name": "vol1"}]
+        info_module_mock.perform_module_operation()
+        info_module_mock.provisioning.client.request.assert_called_once_with(
+            'GET', 'https://1.2.3.4:443/api/rest/recycle_bin',
+            querystring={'select': '*', 'resource_type': 'eq.Volume',
+                         'name': 'ilike.vol*'},
+            all_pages=True)
+        assert info_module_mock.module.exit_json.call_args[1]['RecycleBin'] \
+            == [{"id": "1", "resource_type": "Volume", "name": "vol1"}]
+
+    # U-144 - Field selection is pushed down as the select query
+    def test_get_volumes_with_fields(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol'],
+            'fields': {'vol': ['name', 'size', 'volume_groups(name)']}
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        info_module_mock.provisioning.get_volumes.assert_called_once_with(
+            filter_dict={'select': 'id,name,size,volume_groups(name)'},
+            all_pages=None)
+
+    # U-145 - Field selection with invalid fields
+    def test_get_volumes_with_invalid_fields(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol', 'role'],
+            'fields': {'vol': ['name;'], 'role': ['name'], 'host': ['name']}
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        messages = [call[1]['msg'] for call in
+                    info_module_mock.module.fail_json.call_args_list]
+        assert "Invalid fields 'name;' are given for 'vol'" in messages
+        assert "Field selection is not supported for 'role'" in messages
+        assert "Fields are given for 'host', which is not in " \
+            "gather_subset" in messages
+
+    @staticmethod
+    def mock_paged_client(client, pages):
+        responses = []
+        for index, page in enumerate(pages):
+            response = MagicMock(status_code=206)
+            response.json.return_value = page
+            response.headers = {'content-range': '{0}/{1}'.format(
+                index, sum(len(each) for each in pages))}
+            responses.append(response)
+        client.fetch_response.side_effect = responses
+        client.is_valid_response.return_value = True
+        client.get_total_size_from_content_range.side_effect = \
+            lambda content_range: int(content_range.split('/')[-1])
+
+    @staticmethod
+    def list_via_client(client):
+        return lambda filter_dict=None, all_pages=False: client.request(
+            'GET', 'https://1.2.3.4/api/rest/volume', querystring=filter_dict,
+            all_pages=all_pages)
+
+    # U-146 - Stream subsets to JSON Lines files
+    def test_stream_volumes_to_output_path(self, info_module_mock, tmp_path):
+        self.get_module_args.update({
+            'gather_subset': ['vol'],
+            'all_pages': True,
+            'output_path': str(tmp_path)
+        })
+        info_module_mock.module.params = self.get_module_args
+        client = info_module_mock.provisioning.client
+        pages = [[{"id": str(i)} for i in range(100)],
+                 [{"id": str(i)} for i in range(100, 150)]]
+        self.mock_paged_client(client, pages)
+        info_module_mock.provisioning.get_volumes.side_effect = \
+            self.list_via_client(client)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        path = str(tmp_path / 'Volumes.jsonl')
+        assert 'Volumes' not in result
+        assert result['OutputFiles'] == {'Volumes': {'path': path,
+                                                     'count': 150}}
+        with open(path) as output:
+            lines = [json.loads(line) for line in output]
+        assert lines == pages[0] + pages[1]
+        assert client.fetch_response.call_args_list[1][1]['myrange'] == \
+            '100-2100'
+
+    # U-147 - Stream subsets to compressed JSON Lines files
+    def test_stream_smb_shares_compressed(self, info_module_mock, tmp_path):
+        self.get_module_args.update({
+            'gather_subset': ['smb_share', 'role'],
+            'output_path': str(tmp_path),
+            'compress_output': True
+        })
+        info_module_mock.module.params = self.get_module_args
+        client = info_module_mock.provisioning.client
+        self.mock_paged_client(client, [[{"id": "share_1"}]])
+        info_module_mock.provisioning.get_smb_shares.side_effect = \
+            self.list_via_client(client)
+        info_module_mock.provisioning.get_acl.return_value = {"aces": []}
+        info_module_mock.configuration.get_roles.return_value = [
+            {"id": "1", "name": "Administrator"}]
+        info_module_mock.perform_module_operation()
+        output_files = \
+            info_module_mock.module.exit_json.call_args[1]['OutputFiles']
+        assert output_files['SMBShares']['count'] == 1
+        assert output_files['Roles']['count'] == 1
+        with gzip.open(output_files['SMBShares']['path'], 'rt') as output:
+            assert json.loads(output.readline()) == {"id": "share_1",
+                                                     "aces": []}
+
+    # U-148 - Aggregate subsets page by page
+    def test_aggregate_volumes(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol', 'host'],
+            'all_pages': True,
+            'aggregate': [
+                {'subset': 'vol', 'function': 'count', 'field': None,
+                 'group_by': ['type']},
+                {'subset': 'vol', 'function': 'sum', 'field': 'size',
+                 'group_by': ['appliance_id']},
+                {'subset': 'vol', 'function': 'max', 'field': 'size',
+                 'group_by': None}]
+        })
+        info_module_mock.module.params = self.get_module_args
+        client = info_module_mock.provisioning.client
+        pages = [[{"id": "1", "type": "Primary", "size": 10,
+                   "appliance_id": "A1"},
+                  {"id": "2", "type": "Clone", "size": 30,
+                   "appliance_id": "A2"},
+                  {"id": "3", "type": "Primary", "size": 20,
+                   "appliance_id": "A1"}]]
+        self.mock_paged_client(client, pages)
+        info_module_mock.provisioning.get_volumes.side_effect = \
+            self.list_via_client(client)
+        info_module_mock.provisioning.get_hosts.return_value = [{"id": "h"}]
+        info_module_mock.perform_module_operation()
+        info_module_mock.provisioning.get_volumes.assert_called_once_with(
+            filter_dict={'select': 'id,type,size,appliance_id'},
+            all_pages=True)
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert 'Volumes' not in result
+        assert result['Hosts'] == [{"id": "h"}]
+        count, total, maximum = result['Aggregates']['Volumes']
+        assert count['value'] == 3
+        assert count['groups'] == [{'type': 'Primary', 'value': 2},
+                                   {'type': 'Clone', 'value': 1}]
+        assert total['value'] == 60
+        assert total['groups'] == [{'appliance_id': 'A1', 'value': 30},
+                                   {'appliance_id': 'A2', 'value': 30}]
+        assert maximum['value'] == 30
+        assert 'groups' not in maximum
+
+    # U-149 - Aggregate with invalid specification
+    def test_aggregate_invalid(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol'],
+            'aggregate': [
+                {'subset': 'vol', 'function': 'sum', 'field': None,
+                 'group_by': None},
+                {'subset': 'host', 'function': 'count', 'field': None,
+                 'group_by': None}]
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        messages = [call[1]['msg'] for call in
+                    info_module_mock.module.fail_json.call_args_list]
+        assert "field is required for the 'sum' aggregation of 'vol'" in \
+            messages
+        assert "Aggregation is given for 'host', which is not in " \
+            "gather_subset" in messages
+
+    # U-150 - Cache the clusters across module runs
+    def test_get_clusters_cached(self, info_module_mock, tmp_path):
+        self.get_module_args.update({
+            'cache_dir': str(tmp_path),
+            'cache_ttl': 300
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_cluster_list = MagicMock(
+            return_value=MockInfoApi.CLUSTER_DETAILS_TWO)
+        assert info_module_mock.get_clusters() == \
+            MockInfoApi.CLUSTER_DETAILS_TWO
+        assert info_module_mock.get_clusters() == \
+            MockInfoApi.CLUSTER_DETAILS_TWO
+        info_module_mock.provisioning.get_cluster_list.assert_called_once()
+        self.get_module_args['array_ip'] = 'other_array'
+        info_module_mock.get_clusters()
+        assert info_module_mock.provisioning.get_cluster_list.call_count == 2
+        self.get_module_args['user'] = 'operator'
+        info_module_mock.get_clusters()
+        assert info_module_mock.provisioning.get_cluster_list.call_count == 3
+
+    # U-151 - Clusters are not cached by default
+    def test_get_clusters_not_cached(self, info_module_mock, tmp_path):
+        self.get_module_args.update({'cache_dir': str(tmp_path)})
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.provisioning.get_cluster_list = MagicMock(
+            return_value=MockInfoApi.CLUSTER_DETAILS_TWO)
+        info_module_mock.get_clusters()
+        info_module_mock.get_clusters()
+        assert info_module_mock.provisioning.get_cluster_list.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    # U-152 - Fetch the pages of a subset concurrently
+    def test_get_volumes_with_page_workers(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol'],
+            'all_pages': True,
+            'page_workers': 3
+        })
+        info_module_mock.module.params = self.get_module_args
+        client = info_module_mock.provisioning.client
+        total = 100 + 4 * 2000 + 10
+
+        def fetch_response(http_method, url, payload=None, querystring=None,
+                           myrange=None):
+            start, end = (0, 100) if myrange is None else \
+                [int(each) for each in myrange.split('-')]
+            # Later pages arrive first
+            time.sleep((total - start) / 100000.0)
+            response = MagicMock(status_code=206)
+            response.json.return_value = [
+                {"id": str(i)} for i in range(start, min(end, total))]
+            response.headers = {'content-range': '{0}-{1}/{2}'.format(
+                start, end, total)}
+            return response
+
+        client.fetch_response.side_effect = fetch_response
+        client.is_valid_response.return_value = True
+        client.get_total_size_from_content_range.side_effect = \
+            lambda content_range: int(content_range.split('/')[-1])
+        info_module_mock.provisioning.get_volumes.side_effect = \
+            self.list_via_client(client)
+        info_module_mock.perform_module_operation()
+        ranges = sorted(call[1]['myrange'] for call in
+                        client.fetch_response.call_args_list
+                        if call[1]['myrange'])
+        assert ranges == ['100-2100', '2100-4100', '4100-6100',
+                          '6100-8100', '8100-10100']
+        volumes = info_module_mock.module.exit_json.call_args[1]['Volumes']
+        ids = [volume['id'] for volume in volumes]
+        assert ids == [str(i) for i in range(total)]
+
+    # U-153 - Invalid page_workers
+    def test_get_volumes_with_invalid_page_workers(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol'],
+            'all_pages': True,
+            'page_workers': 0
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        assert info_module_mock.module.fail_json.call_args[1][
+            'msg'] == "page_workers should be a positive integer"
+
+    # U-160 - Invalid acl_workers
+    def test_get_smb_shares_with_invalid_acl_workers(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['smb_share'],
+            'acl_workers': 0
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        assert info_module_mock.module.fail_json.call_args[1][
+            'msg'] == "acl_workers should be a positive integer"
+
+    @staticmethod
+    def get_array(array_ip, user=None, password=None):
+        return {'array_ip': array_ip, 'user': user, 'password': password,
+                'port': None, 'validate_certs': None, 'timeout': None}
+
+    # U-154 - Gather the subsets of several arrays
+    def test_get_subsets_of_arrays(self, info_module_mock, mocker):
+        self.get_module_args.update({
+            'array_ip': None,
+            'user': 'admin',
+            'password': 'password',
+            'gather_subset': ['vol'],
+            'arrays': [self.get_array('10.0.0.1'),
+                       self.get_array('10.0.0.2', 'other', 'secret')],
+            'array_workers': 2
+        })
+        info_module_mock.module.params = self.get_module_args
+        connection_params = {}
+
+        def get_connection(params, module=None):
+            assert module._socket_path is None
+            conn = MagicMock()
+            conn.provisioning.get_cluster_list.return_value = \
+                MockInfoApi.CLUSTER_DETAILS_TWO
+            conn.provisioning.get_array_version.return_value = '4.0.0.0'
+            if params['array_ip'] == '10.0.0.2':
+                conn.provisioning.get_volumes.side_effect = MockApiException
+            else:
+                conn.provisioning.get_volumes.return_value = [{"id": "v1"}]
+            connection_params[params['array_ip']] = params
+            return conn
+
+        mocker.patch(MockInfoApi.MODULE_UTILS_PATH +
+                     '.get_powerstore_connection', side_effect=get_connection)
+        info_module_mock.perform_module_operation()
+        info_module_mock.module.fail_json.assert_not_called()
+        arrays = info_module_mock.module.exit_json.call_args[1]['Arrays']
+        assert arrays['10.0.0.1']['Volumes'] == [{"id": "v1"}]
+        assert arrays['10.0.0.1']['Cluster'] == \
+            MockInfoApi.CLUSTER_DETAILS_TWO
+        assert arrays['10.0.0.2']['failed'] is True
+        assert arrays['10.0.0.2']['status_code'] == "500"
+        assert 'Get Volumes for powerstore array name' in \
+            arrays['10.0.0.2']['msg']
+        assert connection_params['10.0.0.1']['user'] == 'admin'
+        assert connection_params['10.0.0.2']['user'] == 'other'
+        assert connection_params['10.0.0.2']['password'] == 'secret'
+        assert connection_params['10.0.0.2']['arrays'] is None
+
+    # U-155 - Invalid arrays
+    def test_get_subsets_of_invalid_arrays(self, info_module_mock):
+        self.get_module_args.update({
+            'array_ip': None,
+            'user': None,
+            'password': None,
+            'gather_subset': ['vol'],
+            'arrays': [self.get_array('10.0.0.1', 'admin', 'password'),
+                       self.get_array('10.0.0.1', 'admin', 'password'),
+                       self.get_array('10.0.0.2', 'admin')]
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        messages = [call[1]['msg'] for call in
+                    info_module_mock.module.fail_json.call_args_list]
+        assert messages[:2] == [
+            "arrays should not have duplicate array_ip: 10.0.0.1",
+            "password is required for the array 10.0.0.2"]
+
+    # U-156 - Expand the relationships of subsets
+    def test_get_volumes_and_hosts_expanded(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol', 'host'],
+            'fields': {'vol': ['size']},
+            'expand': ['vol', 'host']
+        })
+        info_module_mock.module.params = self.get_module_args
+        provisioning = info_module_mock.provisioning
+
+        def get_volumes(filter_dict=None, all_pages=False):
+            if filter_dict == {'select': 'id,name'}:
+                return [{"id": "v1", "name": "vol1"}]
+            return [{"id": "v1", "size": 1,
+                     "mapped_volumes": [
+                         {"host_id": "h1", "host_group_id": None},
+                         {"host_id": None, "host_group_id": "g1"}],
+                     "volume_groups": [{"id": "vg1"}]}]
+
+        def get_hosts(filter_dict=None, all_pages=False):
+            if filter_dict == {'select': 'id,name'}:
+                return [{"id": "h1", "name": "host1"},
+                        {"id": "h2", "name": "host2"}]
+            return [{"id": "h1", "name": "host1", "host_group_id": "g1"},
+                    {"id": "h2", "name": "host2", "host_group_id": None}]
+
+        provisioning.get_volumes.side_effect = get_volumes
+        provisioning.get_hosts.side_effect = get_hosts
+        provisioning.get_host_group_list.return_value = [
+            {"id": "g1", "name": "group1"}]
+        provisioning.get_volume_group_list.return_value = [
+            {"id": "vg1", "name": "vgroup1"}]
+        info_module_mock.perform_module_operation()
+        info_module_mock.module.fail_json.assert_not_called()
+        provisioning.get_volumes.assert_called_with(
+            filter_dict={'select': 'id,size,mapped_volumes(host_id,'
+                                   'host_group_id),volume_groups(id)'},
+            all_pages=None)
+        provisioning.get_hosts.assert_called_with(
+            filter_dict={'select': 'id,name,host_group_id'}, all_pages=None)
+        provisioning.get_host_group_list.assert_called_once_with(
+            filter_dict={'select': 'id,name'}, all_pages=True)
+        assert provisioning.get_volumes.call_count == 1
+        result = info_module_mock.module.exit_json.call_args[1]
+        volume = result['Volumes'][0]
+        assert volume['mapped_volumes'] == [
+            {"host_id": "h1", "host_name": "host1", "host_group_id": None},
+            {"host_id": None, "host_group_id": "g1",
+             "host_group_name": "group1"}]
+        assert volume['volume_groups'] == [{"id": "vg1", "name": "vgroup1"}]
+        assert result['Hosts'] == [
+            {"id": "h1", "name": "host1", "host_group_id": "g1",
+             "host_group_name": "group1"},
+            {"id": "h2", "name": "host2", "host_group_id": None}]
+
+    # U-157 - Expand a subset which is not gathered
+    def test_expand_invalid(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['vol'],
+            'expand': ['file_system']
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.perform_module_operation()
+        assert info_module_mock.module.fail_json.call_args[1][
+            'msg'] == "Expand is given for 'file_system', which is not in " \
+            "gather_subset"
+
+    # U-158 - Gather the subsets of several arrays of different versions
+    def test_get_subsets_of_arrays_of_different_versions(self, info_module_mock,
+                                                         mocker):
+        self.get_module_args.update({
+            'array_ip': None,
+            'user': 'admin',
+            'password': 'password',
+            'gather_subset': ['vol'],
+            'arrays': [self.get_array('10.0.0.1'), self.get_array('10.0.0.2')],
+            'array_workers': 2
+        })
+        info_module_mock.module.params = self.get_module_args
+        # Both arrays list their volumes once both are connected
+        listing = threading.Barrier(2, timeout=10)
+        versions = {'10.0.0.1': '1.0.4.0', '10.0.0.2': '2.1.0.0'}
+
+        def get_connection(params, module=None):
+            conn = MagicMock()
+            conn.provisioning.get_cluster_list.return_value = \
+                MockInfoApi.CLUSTER_DETAILS_TWO
+            conn.provisioning.get_array_version.return_value = \
+                versions[params['array_ip']]
+
+            def get_volumes(*args, **kwargs):
+                listing.wait()
+                return [{"id": "v1",
+                         "foot_hill": helpers.is_foot_hill_or_higher()}]
+            conn.provisioning.get_volumes.side_effect = get_volumes
+            # The SDK connections replace the provisioning object of the
+            # version checks
+            helpers.set_provisioning_obj(conn.provisioning)
+            return conn
+
+        mocker.patch(MockInfoApi.MODULE_UTILS_PATH +
+                     '.get_powerstore_connection', side_effect=get_connection)
+        info_module_mock.perform_module_operation()
+        arrays = info_module_mock.module.exit_json.call_args[1]['Arrays']
+        assert arrays['10.0.0.1']['Volumes'][0]['foot_hill'] is False
+        assert arrays['10.0.0.2']['Volumes'][0]['foot_hill'] is True
+        # The provisioning object of the last connection is restored
+        assert helpers.PROVISIONING_OBJ.get_array_version.return_value == \
+            '2.1.0.0'
+
+    # U-159 - Expand a subset whose SDK function selects more than id,name
+    def test_get_smb_shares_expanded(self, info_module_mock):
+        self.get_module_args.update({
+            'gather_subset': ['smb_share'],
+            'include_acl': False,
+            'expand': ['smb_share']
+        })
+        info_module_mock.module.params = self.get_module_args
+        provisioning = info_module_mock.provisioning
+        provisioning.get_smb_shares.return_value = [
+            {"id": "s1", "name": "share1", "path": "/fs1",
+             "description": "share", "is_ABE_enabled": False,
+             "file_system_id": "fs1"}]
+        provisioning.get_file_systems.return_value = [
+            {"id": "fs1", "name": "filesystem1"}]
+        info_module_mock.perform_module_operation()
+        info_module_mock.module.fail_json.assert_not_called()
+        select = provisioning.get_smb_shares.call_args[1]['filter_dict'][
+            'select']
+        assert select.startswith(
+            'id,name,path,description,umask,'
+            'is_continuous_availability_enabled,')
+        assert select.endswith(',file_system_id')
+        share = info_module_mock.module.exit_json.call_args[1]['SMBShares'][0]
+        assert share['path'] == '/fs1'
+        assert share['file_system_name'] == 'filesystem1'
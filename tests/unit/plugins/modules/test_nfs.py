@@ -28,6 +28,8 @@ class TestPowerstoreNfs():
         mocker.patch(MockNfsApi.MODULE_UTILS_PATH + '.PowerStoreException', new=MockApiException)
         nfs_module_mock = PowerStoreNfsExport()
         nfs_module_mock.module = MagicMock()
+        nfs_module_mock.py4ps_conn = MagicMock()
+        nfs_module_mock.provisioning = nfs_module_mock.py4ps_conn.provisioning
         return nfs_module_mock
 
     def test_get_nfs_response(self, nfs_module_mock):
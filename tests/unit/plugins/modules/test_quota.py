@@ -15,9 +15,12 @@ from mock.mock import MagicMock
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock_quota_api import MockQuotaApi
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
-from ansible_collections.dellemc.powerstore.plugins.modules.quota import PowerStoreQuota, main
+from ansible_collections.dellemc.powerstore.plugins.modules.quota import PowerStoreQuota, main, \
+    AnsibleModule
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.libraries.powerstore_unit_base \
     import PowerStoreUnitBase
+from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.libraries.fail_json \
+    import FailJsonException
 
 
 class TestPowerStoreQuota(PowerStoreUnitBase):
@@ -658,6 +661,7 @@ class TestPowerStoreQuota(PowerStoreUnitBase):
         }
     ])
     def test_get_nas_server_id(self, powerstore_module_mock, assert_data):
+        powerstore_module_mock.module.params = self.get_module_args
         nas_server = assert_data.get('nas_server')
         nas_id = assert_data.get('nas_id')
         powerstore_module_mock.provisioning.get_nas_server_by_name = MagicMock(
@@ -693,9 +697,10 @@ class TestPowerStoreQuota(PowerStoreUnitBase):
                                       nas_server)
 
     def test_get_filesystem_id(self, powerstore_module_mock):
+        powerstore_module_mock.module.params = self.get_module_args
         filesystem, nas_server = "filesystem", "nas-server"
-        powerstore_module_mock.provisioning.get_nas_server_id = MagicMock(
-            return_value=[{'id': self.filesystem_1}]
+        powerstore_module_mock.provisioning.get_nas_server_by_name = MagicMock(
+            return_value=[{'id': 'nas_id'}]
         )
         powerstore_module_mock.provisioning.get_filesystem_by_name = MagicMock(
             return_value=[{'id': self.filesystem_1}]
@@ -715,9 +720,10 @@ class TestPowerStoreQuota(PowerStoreUnitBase):
         }
     ])
     def test_get_filesystem_id_error(self, powerstore_module_mock, assert_data):
+        powerstore_module_mock.module.params = self.get_module_args
         filesystem, nas_server = "filesystem", assert_data.get('nas_server')
-        powerstore_module_mock.provisioning.get_nas_server_id = MagicMock(
-            return_value=[{'id': self.filesystem_1}]
+        powerstore_module_mock.provisioning.get_nas_server_by_name = MagicMock(
+            return_value=[{'id': 'nas_id'}]
         )
         powerstore_module_mock.provisioning.get_filesystem_by_name = MagicMock(
             return_value=None
@@ -831,3 +837,121 @@ class TestPowerStoreQuota(PowerStoreUnitBase):
 
     def test_main(self):
         main()
+
+    def test_main_bulk(self, mocker):
+        mocker.patch.object(AnsibleModule.return_value, 'params',
+                            new=dict(self.get_module_args, quotas=[{'path': '/home'}]))
+        bulk_operation = mocker.patch.object(PowerStoreQuota, 'perform_bulk_operation')
+        main()
+        bulk_operation.assert_called_once_with()
+
+    GB = 1024 * 1024 * 1024
+    BULK_TREE_QUOTAS = [
+        {'id': 'tree_1', 'path': '/home', 'description': None, 'hard_limit': 0, 'soft_limit': 0,
+         'is_user_quotas_enforced': False},
+        {'id': 'tree_2', 'path': '/data', 'description': 'data', 'hard_limit': 10 * GB,
+         'soft_limit': 0, 'is_user_quotas_enforced': True}]
+    BULK_USER_QUOTAS = [
+        {'id': 'user_1', 'tree_quota_id': None, 'uid': 1001, 'unix_name': 'user_1', 'windows_name': None,
+         'windows_sid': None, 'hard_limit': 10 * GB, 'soft_limit': 5 * GB},
+        {'id': 'user_2', 'tree_quota_id': 'tree_1', 'uid': 1002, 'unix_name': None, 'windows_name': None,
+         'windows_sid': None, 'hard_limit': 10 * GB, 'soft_limit': 5 * GB}]
+
+    def set_bulk_quotas(self, powerstore_module_mock, quota_type, **kwargs):
+        self.get_module_args.update(dict(
+            quota_id=None, path=None, nas_server=None, filesystem=self.filesystem_1, quota_type=quota_type,
+            description=None, windows_name=None, unix_name=None, windows_sid=None, uid=None,
+            quota=None, state='present', quotas=None, quotas_file=None, max_workers=4), **kwargs)
+        powerstore_module_mock.module.params = self.get_module_args
+        powerstore_module_mock.provisioning.get_filesystem_details = MagicMock(
+            return_value={'id': self.filesystem_1, 'is_quota_enabled': True})
+
+        def list_quotas(quotas):
+            def get_quotas(filter_dict=None, all_pages=False):
+                assert filter_dict['file_system_id'] == 'eq.' + self.filesystem_1
+                assert all_pages is True
+                return quotas
+            return MagicMock(side_effect=get_quotas)
+        powerstore_module_mock.provisioning.get_file_tree_quotas = list_quotas(self.BULK_TREE_QUOTAS)
+        powerstore_module_mock.provisioning.get_file_user_quotas = list_quotas(self.BULK_USER_QUOTAS)
+
+    def test_bulk_user_quotas(self, powerstore_module_mock):
+        self.set_bulk_quotas(
+            powerstore_module_mock, 'user', quota={'soft_limit': 5, 'hard_limit': 10, 'cap_unit': 'GB'},
+            quotas=[dict(dict.fromkeys(('uid', 'unix_name', 'windows_name', 'windows_sid', 'path',
+                                        'description', 'soft_limit', 'hard_limit', 'cap_unit')), **quota)
+                    for quota in [{'unix_name': 'user_1'}, {'uid': 1002, 'path': '/home', 'hard_limit': 20},
+                                  {'uid': 1003}, {'windows_name': 'domain\\user_4', 'path': '/home'}]])
+        powerstore_module_mock.provisioning.create_user_quota = MagicMock(return_value={'id': 'new_id'})
+        powerstore_module_mock.perform_bulk_operation()
+        powerstore_module_mock.provisioning.get_user_quota.assert_not_called()
+        powerstore_module_mock.provisioning.update_user_quota.assert_called_once_with(
+            user_quota_id='user_2', user_quota_params={'hard_limit': 20 * self.GB, 'soft_limit': 5 * self.GB})
+        create_args = [call[1]['user_quota_params'] for call in
+                       powerstore_module_mock.provisioning.create_user_quota.call_args_list]
+        assert len(create_args) == 2
+        assert {'uid': 1003, 'hard_limit': 10 * self.GB, 'soft_limit': 5 * self.GB} in create_args
+        assert {'windows_name': 'DOMAIN\\user_4', 'tree_quota_id': 'tree_1', 'hard_limit': 10 * self.GB,
+                'soft_limit': 5 * self.GB} in create_args
+        powerstore_module_mock.provisioning.update_tree_quota.assert_called_once_with(
+            'tree_1', {'is_user_quotas_enforced': True})
+        exit_args = powerstore_module_mock.module.exit_json.call_args[1]
+        assert [quota['action'] for quota in exit_args['quotas']] == [None, 'modify', 'create', 'create']
+        assert exit_args['quotas'][0] == {'unix_name': 'user_1', 'action': None, 'changed': False,
+                                          'quota_details': self.BULK_USER_QUOTAS[0]}
+        # The quotas are listed again after the changes for their details
+        assert powerstore_module_mock.provisioning.get_file_user_quotas.call_count == 2
+
+    def test_bulk_tree_quotas_from_file(self, powerstore_module_mock, tmp_path):
+        quotas_file = tmp_path / 'quotas.csv'
+        quotas_file.write_text('path,description,hard_limit,soft_limit\n'
+                               '/data,data,10,\n/projects,,0,2\n')
+        self.set_bulk_quotas(powerstore_module_mock, 'tree', quotas_file=str(quotas_file))
+        created = {'id': 'tree_3', 'path': '/projects', 'description': None, 'hard_limit': 0,
+                   'soft_limit': 2 * self.GB, 'is_user_quotas_enforced': False}
+        listings = [self.BULK_TREE_QUOTAS, self.BULK_TREE_QUOTAS + [created]]
+        powerstore_module_mock.provisioning.get_file_tree_quotas = MagicMock(
+            side_effect=lambda filter_dict=None, all_pages=False: listings.pop(0))
+        powerstore_module_mock.provisioning.create_tree_quota = MagicMock(return_value={'id': 'tree_3'})
+        powerstore_module_mock.perform_bulk_operation()
+        powerstore_module_mock.provisioning.get_file_user_quotas.assert_not_called()
+        powerstore_module_mock.provisioning.update_tree_quota.assert_not_called()
+        powerstore_module_mock.provisioning.create_tree_quota.assert_called_once_with(
+            self.filesystem_1, '/projects', tree_quota_params={'hard_limit': 0, 'soft_limit': 2 * self.GB})
+        assert powerstore_module_mock.module.exit_json.call_args[1]['quotas'] == [
+            {'path': '/data', 'action': None, 'changed': False, 'quota_details': self.BULK_TREE_QUOTAS[1]},
+            {'path': '/projects', 'action': 'create', 'changed': True, 'quota_details': created}]
+
+    def test_bulk_quotas_file_with_extra_cells(self, powerstore_module_mock, tmp_path):
+        quotas_file = tmp_path / 'quotas.csv'
+        quotas_file.write_text('path,hard_limit\n/data,10\n/projects,0,2\n')
+        self.set_bulk_quotas(powerstore_module_mock, 'tree', quotas_file=str(quotas_file))
+        with pytest.raises(FailJsonException) as error:
+            powerstore_module_mock.perform_bulk_operation()
+        assert error.value.message == 'Line 3 of quotas_file has more cells than its header'
+        powerstore_module_mock.provisioning.create_tree_quota.assert_not_called()
+
+    def test_bulk_quotas_fail_before_writes(self, powerstore_module_mock):
+        self.set_bulk_quotas(
+            powerstore_module_mock, 'user',
+            quotas=[dict(dict.fromkeys(('uid', 'unix_name', 'windows_name', 'windows_sid', 'path',
+                                        'description', 'soft_limit', 'hard_limit', 'cap_unit')), **quota)
+                    for quota in [{'uid': 1003, 'hard_limit': 1}, {'uid': 1004, 'path': '/missing', 'hard_limit': 1},
+                                  {'uid': 1005, 'path': '/missing_too', 'hard_limit': 1}]])
+        with pytest.raises(FailJsonException) as error:
+            powerstore_module_mock.perform_bulk_operation()
+        assert 'No Tree Quota with path = /missing ' in error.value.message
+        assert 'No Tree Quota with path = /missing_too ' in error.value.message
+        powerstore_module_mock.provisioning.create_user_quota.assert_not_called()
+
+    def test_bulk_quotas_given_twice(self, powerstore_module_mock):
+        self.set_bulk_quotas(
+            powerstore_module_mock, 'user',
+            quotas=[dict(dict.fromkeys(('uid', 'unix_name', 'windows_name', 'windows_sid', 'path',
+                                        'description', 'soft_limit', 'hard_limit', 'cap_unit')), **quota)
+                    for quota in [{'uid': 1003, 'hard_limit': 1}, {'uid': 1003, 'hard_limit': 2},
+                                  {'uid': 1003, 'path': '/home', 'hard_limit': 1}]])
+        with pytest.raises(FailJsonException) as error:
+            powerstore_module_mock.perform_bulk_operation()
+        assert error.value.message == "Quota {'uid': 1003} is given more than once"
+        powerstore_module_mock.provisioning.get_file_user_quotas.assert_not_called()
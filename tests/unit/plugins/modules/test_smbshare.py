@@ -28,6 +28,8 @@ class TestPowerStoreSMBShare():
         mocker.patch(MockSMBShareApi.MODULE_UTILS_PATH + '.PowerStoreException', new=MockApiException)
         smb_share_module_mock = PowerStoreSMBShare()
         smb_share_module_mock.module = MagicMock()
+        smb_share_module_mock.conn = MagicMock()
+        smb_share_module_mock.provisioning = smb_share_module_mock.conn.provisioning
         return smb_share_module_mock
 
     def test_get_smb_share_response(self, smb_share_module_mock):
@@ -82,8 +84,15 @@ class TestPowerStoreSMBShare():
         smb_share_module_mock.module.params = self.get_module_args
         smb_share_module_mock.provisioning.get_smb_share_by_name = MagicMock(
             return_value={})
+        smb_share_module_mock.provisioning.get_nas_server_by_name = MagicMock(
+            return_value=[{'id': 'nas_id'}])
+        smb_share_module_mock.provisioning.get_filesystem_by_name = MagicMock(
+            return_value=[{'id': 'fs_id', 'filesystem_type': 'Primary'}])
         smb_share_module_mock.perform_module_operation()
         assert smb_share_module_mock.module.exit_json.call_args[1]['changed'] is True
+        smb_share_module_mock.provisioning.get_filesystem_by_name.assert_called_once_with(
+            filesystem_name='sample_file_system', nas_server_id='nas_id')
+        assert smb_share_module_mock.provisioning.create_smb_share.call_args[1]['file_system_id'] == 'fs_id'
 
     def test_create_smb_share_with_exception(self, smb_share_module_mock):
         MockApiException.HTTP_ERR = "1"
@@ -99,6 +108,10 @@ class TestPowerStoreSMBShare():
         smb_share_module_mock.module.params = self.get_module_args
         smb_share_module_mock.provisioning.get_smb_share_by_name = MagicMock(
             return_value={})
+        smb_share_module_mock.provisioning.get_nas_server_by_name = MagicMock(
+            return_value=[{'id': 'nas_id'}])
+        smb_share_module_mock.provisioning.get_filesystem_by_name = MagicMock(
+            return_value=[{'id': 'fs_id', 'filesystem_type': 'Primary'}])
         smb_share_module_mock.provisioning.create_smb_share = MagicMock(
             side_effect=MockApiException)
         smb_share_module_mock.perform_module_operation()
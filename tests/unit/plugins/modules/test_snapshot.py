@@ -31,6 +31,9 @@ class TestPowerStoreSnapshot():
         snapshot_module_mock = PowerStoreSnapshot()
         snapshot_module_mock.module = MagicMock()
         snapshot_module_mock.module.check_mode = False
+        snapshot_module_mock.py4ps_conn = MagicMock()
+        snapshot_module_mock.provisioning = snapshot_module_mock.py4ps_conn.provisioning
+        snapshot_module_mock.protection = snapshot_module_mock.py4ps_conn.protection
         return snapshot_module_mock
 
     def test_get_vol_snap_response(self, snapshot_module_mock):
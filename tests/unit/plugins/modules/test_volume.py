@@ -15,7 +15,10 @@ from mock.mock import MagicMock
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock_volume_api import MockVolumeApi
 from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
-from ansible_collections.dellemc.powerstore.plugins.modules.volume import PowerStoreVolume, VolumeHandler
+from ansible_collections.dellemc.powerstore.tests.unit.plugins.module_utils.libraries.fail_json \
+    import FailJsonException, fail_json
+from ansible_collections.dellemc.powerstore.plugins.modules.volume import PowerStoreVolume, VolumeHandler, \
+    VolumeBulkHandler, VolumeMappingHandler
 
 
 class TestPowerstoreVolume():
@@ -41,6 +44,11 @@ class TestPowerstoreVolume():
         volume_module_mock.conn.provisioning = volume_module_mock.provisioning
         volume_module_mock.conn.protection = volume_module_mock.protection
         volume_module_mock.conn.config_mgmt = volume_module_mock.configuration
+        # The version checks of the SDK read the provisioning of the array
+        volume_module_mock.provisioning.get_array_version = MagicMock(
+            return_value='4.0.0.0')
+        mocker.patch('PyPowerStore.utils.helpers.PROVISIONING_OBJ',
+                     new=volume_module_mock.provisioning)
         return volume_module_mock
 
     def test_get_volume_by_id(self, volume_module_mock):
@@ -1164,3 +1172,196 @@ class TestPowerstoreVolume():
             return_value=[])
         VolumeHandler().handle(volume_module_mock, volume_module_mock.module.params)
         volume_module_mock.module.fail_json.assert_called()
+
+    BULK_VOLUMES = [
+        {'id': 'vol1_id', 'name': 'bulk_vol_1', 'size': 1073741824,
+         'description': None, 'appliance_id': 'A1',
+         'protection_policy_id': 'pp_id', 'performance_policy_id': 'default_medium',
+         'qos_performance_policy_id': None, 'app_type': None,
+         'app_type_other': None, 'volume_groups': []},
+        {'id': 'vol2_id', 'name': 'bulk_vol_2', 'size': 1073741824,
+         'description': None, 'appliance_id': 'A1',
+         'protection_policy_id': 'pp_id', 'performance_policy_id': 'default_medium',
+         'qos_performance_policy_id': None, 'app_type': None,
+         'app_type_other': None, 'volume_groups': []}]
+
+    def get_bulk_args(self, volumes, **kwargs):
+        self.get_module_args.update(dict(
+            volumes=[dict(dict.fromkeys(('size', 'cap_unit', 'description', 'vg_name',
+                                         'performance_policy', 'protection_policy',
+                                         'qos_performance_policy', 'app_type',
+                                         'app_type_other', 'appliance_name',
+                                         'appliance_id')), **volume)
+                     for volume in volumes],
+            state='present', size=1, cap_unit='GB', protection_policy='pp'), **kwargs)
+        return self.get_module_args
+
+    # U-092
+    def test_bulk_create_and_modify_volumes(self, volume_module_mock):
+        volume_module_mock.module.params = self.get_bulk_args([
+            {'vol_name': 'bulk_vol_1'}, {'vol_name': 'bulk_vol_2', 'size': 2},
+            {'vol_name': 'bulk_vol_3'}])
+        volume_module_mock.conn.protection.get_protection_policy_by_name = MagicMock(
+            return_value=[{'id': 'pp_id', 'name': 'pp'}])
+        volume_module_mock.provisioning.get_volumes = MagicMock(
+            return_value=self.BULK_VOLUMES)
+        VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        assert volume_module_mock.provisioning.get_volumes.call_args[1]['filter_dict'][
+            'name'] == 'in.(bulk_vol_1,bulk_vol_2,bulk_vol_3)'
+        volume_module_mock.conn.protection.get_protection_policy_by_name.assert_called_once_with('pp')
+        volume_module_mock.provisioning.create_volume.assert_called_once()
+        create_args = volume_module_mock.provisioning.create_volume.call_args[1]
+        assert create_args['name'] == 'bulk_vol_3'
+        assert create_args['size'] == 1073741824
+        assert create_args['protection_policy_id'] == 'pp_id'
+        volume_module_mock.provisioning.modify_volume.assert_called_once_with(
+            volume_id='vol2_id', size=2147483648)
+        results = volume_module_mock.module.exit_json.call_args[1]['volumes']
+        assert [result['action'] for result in results] == [None, 'modify', 'create']
+        assert volume_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    # U-093
+    def test_bulk_volumes_check_mode(self, volume_module_mock):
+        volume_module_mock.module.check_mode = True
+        volume_module_mock.module.params = self.get_bulk_args(
+            [{'vol_name': 'bulk_vol_1'}, {'vol_name': 'bulk_vol_3'}], protection_policy=None)
+        volume_module_mock.provisioning.get_volumes = MagicMock(
+            return_value=self.BULK_VOLUMES[:1])
+        VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        volume_module_mock.provisioning.create_volume.assert_not_called()
+        assert volume_module_mock.provisioning.get_volumes.call_count == 1
+        assert volume_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    # U-094
+    def test_bulk_volumes_shrink_fails_before_writes(self, volume_module_mock):
+        volume_module_mock.module.fail_json = fail_json
+        volume_module_mock.module.params = self.get_bulk_args(
+            [{'vol_name': 'bulk_vol_1', 'size': 512, 'cap_unit': 'MB'},
+             {'vol_name': 'bulk_vol_3'}], protection_policy=None)
+        volume_module_mock.provisioning.get_volumes = MagicMock(
+            return_value=self.BULK_VOLUMES)
+        with pytest.raises(FailJsonException, match='Only expansion'):
+            VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        volume_module_mock.provisioning.create_volume.assert_not_called()
+
+    # U-095
+    def test_bulk_volumes_partial_failure(self, volume_module_mock):
+        volume_module_mock.module.params = self.get_bulk_args(
+            [{'vol_name': 'bulk_vol_3'}, {'vol_name': 'bulk_vol_4'}],
+            protection_policy=None, max_workers=2)
+        volume_module_mock.provisioning.get_volumes = MagicMock(return_value=[])
+
+        def create_volume(name, **kwargs):
+            if name == 'bulk_vol_4':
+                raise MockApiException
+        volume_module_mock.provisioning.create_volume = MagicMock(side_effect=create_volume)
+        VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        fail_args = volume_module_mock.module.fail_json.call_args[1]
+        assert fail_args['msg'].startswith('Failed to reconcile 1 of 2 volumes: bulk_vol_4')
+        assert fail_args['changed'] is True
+        assert [result['changed'] for result in fail_args['volumes']] == [True, False]
+
+    # U-096
+    def test_bulk_volumes_absent(self, volume_module_mock):
+        volume_module_mock.module.params = self.get_bulk_args(
+            [{'vol_name': 'bulk_vol_1'}, {'vol_name': 'bulk_vol_3'}], state='absent')
+        volume_module_mock.provisioning.get_volumes = MagicMock(
+            return_value=self.BULK_VOLUMES[:1])
+        VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        volume_module_mock.provisioning.delete_volume.assert_called_once_with('vol1_id')
+        volume_module_mock.conn.protection.get_protection_policy_by_name.assert_not_called()
+
+    MAPPING_ENTITIES = {
+        'volume': [{'id': 'vol1_id', 'name': 'bulk_vol_1'}, {'id': 'vol2_id', 'name': 'bulk_vol_2'}],
+        'host': [{'id': 'host1_id', 'name': 'host_1'}, {'id': 'host2_id', 'name': 'host_2'}],
+        'host_group': [{'id': 'hg1_id', 'name': 'hostgroup_1'}]}
+
+    def get_mapping_mock(self, volume_module_mock, current_mappings):
+        volume_module_mock.provisioning.server_ip = '1.2.3.4:443'
+
+        def request(http_method, url, querystring=None, all_pages=None):
+            resource = url.rsplit('/', 1)[1]
+            if resource == 'host_volume_mapping':
+                field = 'host_id' if 'host_id' in querystring else 'host_group_id'
+                ids = querystring[field][4:-1].split(',')
+                return [mapping for mapping in current_mappings if mapping[field] in ids]
+            names = querystring['name'][4:-1].split(',')
+            return [entity for entity in self.MAPPING_ENTITIES[resource]
+                    if entity['name'] in names]
+        volume_module_mock.provisioning.client.request = MagicMock(side_effect=request)
+        volume_module_mock.provisioning.get_host_group_by_name = MagicMock(
+            return_value=self.MAPPING_ENTITIES['host_group'])
+        return volume_module_mock
+
+    # U-097
+    def test_volume_mappings_map(self, volume_module_mock):
+        self.get_module_args.update({
+            'mappings': [{'volumes': ['bulk_vol_1', 'bulk_vol_2'], 'hosts': ['host_1', 'host_2'],
+                          'hostgroups': None, 'hlus': [1, 2]}],
+            'mapping_state': 'mapped', 'state': 'present'})
+        volume_module_mock.module.params = self.get_module_args
+        self.get_mapping_mock(volume_module_mock, [
+            {'volume_id': 'vol1_id', 'host_id': 'host1_id', 'host_group_id': None, 'logical_unit_number': 1}])
+        VolumeMappingHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        mapping_query = volume_module_mock.provisioning.client.request.call_args_list[-1][1]['querystring']
+        assert mapping_query['host_id'] == 'in.(host1_id,host2_id)'
+        assert volume_module_mock.provisioning.map_volume_to_host.call_count == 3
+        results = volume_module_mock.module.exit_json.call_args[1]['mappings']
+        assert sorted((result['volume'], result['host'], result['hlu']) for result in results) == [
+            ('bulk_vol_1', 'host_2', 1), ('bulk_vol_2', 'host_1', 2), ('bulk_vol_2', 'host_2', 2)]
+        assert volume_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    # U-098
+    def test_volume_mappings_unmap(self, volume_module_mock):
+        self.get_module_args.update({
+            'mappings': [{'volumes': ['bulk_vol_1', 'bulk_vol_2'], 'hosts': None,
+                          'hostgroups': ['hostgroup_1'], 'hlus': None}],
+            'mapping_state': 'unmapped', 'state': 'present'})
+        volume_module_mock.module.params = self.get_module_args
+        self.get_mapping_mock(volume_module_mock, [
+            {'volume_id': 'vol2_id', 'host_id': None, 'host_group_id': 'hg1_id', 'logical_unit_number': 3}])
+        VolumeMappingHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        volume_module_mock.provisioning.unmap_volume_from_host_group.assert_called_once_with(
+            volume_id='vol2_id', host_group_id='hg1_id')
+        assert volume_module_mock.module.exit_json.call_args[1]['mappings'][0]['hostgroup'] == 'hostgroup_1'
+
+    # U-099
+    def test_volume_mappings_hlu_conflict(self, volume_module_mock):
+        volume_module_mock.module.fail_json = fail_json
+        self.get_module_args.update({
+            'mappings': [{'volumes': ['bulk_vol_2'], 'hosts': ['host_1'], 'hostgroups': None, 'hlus': [1]}],
+            'mapping_state': 'mapped', 'state': 'present'})
+        volume_module_mock.module.params = self.get_module_args
+        self.get_mapping_mock(volume_module_mock, [
+            {'volume_id': 'vol1_id', 'host_id': 'host1_id', 'host_group_id': None, 'logical_unit_number': 1}])
+        volume_module_mock.provisioning.get_volume_by_name = MagicMock(
+            return_value=self.MAPPING_ENTITIES['volume'][1:])
+        volume_module_mock.provisioning.get_host_by_name = MagicMock(
+            return_value=self.MAPPING_ENTITIES['host'][:1])
+        with pytest.raises(FailJsonException, match='HLU 1 is already used on host_1'):
+            VolumeMappingHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        volume_module_mock.provisioning.map_volume_to_host.assert_not_called()
+        # The HLU is used by a volume which is not in mappings
+        mapping_query = volume_module_mock.provisioning.client.request.call_args[1]['querystring']
+        assert mapping_query['host_id'] == 'in.(host1_id)'
+        assert 'volume_id' not in mapping_query
+
+    # U-100
+    def test_bulk_volumes_select_on_older_array(self, volume_module_mock):
+        volume_module_mock.module.params = self.get_bulk_args(
+            [{'vol_name': 'bulk_vol_1'}], protection_policy=None)
+        volume_module_mock.provisioning.get_volumes = MagicMock(
+            return_value=[dict((key, value) for key, value in self.BULK_VOLUMES[0].items()
+                               if key not in ('app_type', 'app_type_other',
+                                              'qos_performance_policy_id'))])
+        volume_module_mock.provisioning.get_array_version.return_value = '2.1.0.0'
+        VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        select = volume_module_mock.provisioning.get_volumes.call_args[1]['filter_dict']['select']
+        assert 'app_type' not in select
+        assert 'qos_performance_policy_id' not in select
+        volume_module_mock.provisioning.modify_volume.assert_not_called()
+        assert volume_module_mock.module.exit_json.call_args[1]['changed'] is False
+        volume_module_mock.provisioning.get_array_version.return_value = '4.0.0.0'
+        VolumeBulkHandler().handle(volume_module_mock, volume_module_mock.module.params)
+        select = volume_module_mock.provisioning.get_volumes.call_args[1]['filter_dict']['select']
+        assert select.endswith(',app_type,app_type_other,qos_performance_policy_id')
@@ -42,6 +42,16 @@ class TestPowerstoreVolumeGroup():
         volume_group_module_mock.conn.config_mgmt = volume_group_module_mock.configuration
         return volume_group_module_mock
 
+    @staticmethod
+    def mock_volume_listing(volume_group_module_mock, volumes):
+        def request(http_method, url, querystring=None, all_pages=None):
+            for field in ('name', 'id'):
+                if field in querystring:
+                    values = querystring[field][4:-1].split(',')
+                    return [volume for volume in volumes if volume[field] in values]
+        volume_group_module_mock.provisioning.server_ip = '1.2.3.4:443'
+        volume_group_module_mock.provisioning.client.request = MagicMock(side_effect=request)
+
     def test_get_volume_group_by_id(self, volume_group_module_mock):
         self.get_module_args.update({
             'vg_id': "634e4b95-e7bd-49e7-957b-6dc932642464",
@@ -186,15 +196,41 @@ class TestPowerstoreVolumeGroup():
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.VG_DETAILS[0])
         volume_group_module_mock.provisioning.get_volume_by_name = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS1[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS2[0])
+            return_value=MockVolumeGroupApi.VOL_DETAILS1)
+        self.mock_volume_listing(volume_group_module_mock, MockVolumeGroupApi.VOL_DETAILS2)
         volume_group_module_mock.provisioning.add_members_to_volume_group = MagicMock(
             return_value=MockVolumeGroupApi.MODIFY_VG[0])
         volume_group_module_mock.perform_module_operation()
         assert volume_group_module_mock.module.exit_json.call_args[1]['changed'] is True
         volume_group_module_mock.provisioning.add_members_to_volume_group.assert_called()
 
+    def test_add_volumes_to_volume_group_batched(self, volume_group_module_mock):
+        vol1_id = MockVolumeGroupApi.VOL_DETAILS1[0]['id']
+        vol2_id = MockVolumeGroupApi.VOL_DETAILS2[0]['id']
+        self.get_module_args.update({
+            'vg_name': "sample_volume_group",
+            'volumes': ['sample_volume_1', 'sample_volume_2', vol1_id],
+            'vol_state': 'present-in-group',
+            'state': "present"
+        })
+        volume_group_module_mock.module.params = self.get_module_args
+        volume_group_module_mock.provisioning.get_volume_group_by_name = MagicMock(
+            return_value=MockVolumeGroupApi.VG_DETAILS)
+        volume_group_module_mock.get_volume_group_details = MagicMock(
+            return_value=dict(MockVolumeGroupApi.VG_DETAILS[0], volumes=[{'id': vol1_id}]))
+        self.mock_volume_listing(volume_group_module_mock,
+                                 MockVolumeGroupApi.VOL_DETAILS1 + MockVolumeGroupApi.VOL_DETAILS2)
+        volume_group_module_mock.perform_module_operation()
+        request = volume_group_module_mock.provisioning.client.request
+        assert request.call_count == 2
+        assert request.call_args_list[0][1]['querystring']['name'] == \
+            'in.(sample_volume_1,sample_volume_2)'
+        assert request.call_args_list[1][1]['querystring']['id'] == 'in.({0})'.format(vol1_id)
+        volume_group_module_mock.provisioning.get_volume_by_name.assert_not_called()
+        volume_group_module_mock.provisioning.add_members_to_volume_group.assert_called_once_with(
+            MockVolumeGroupApi.VG_DETAILS[0]['id'], [vol2_id])
+        assert volume_group_module_mock.module.exit_json.call_args[1]['changed'] is True
+
     def test_remove_volume_from_volume_group(self, volume_group_module_mock):
         self.get_module_args.update({
             'vg_name': "sample_volume_group",
@@ -208,9 +244,8 @@ class TestPowerstoreVolumeGroup():
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.MODIFY_VG[0])
         volume_group_module_mock.provisioning.get_volume_by_name = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS1[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS2[0])
+            return_value=MockVolumeGroupApi.VOL_DETAILS1)
+        self.mock_volume_listing(volume_group_module_mock, MockVolumeGroupApi.VOL_DETAILS2)
         volume_group_module_mock.provisioning.remove_members_from_volume_group = MagicMock(
             return_value=MockVolumeGroupApi.VG_DETAILS[0])
         volume_group_module_mock.perform_module_operation()
@@ -233,9 +268,8 @@ class TestPowerstoreVolumeGroup():
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.MODIFY_VG[0])
         volume_group_module_mock.provisioning.get_volume_by_name = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS1[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS2[0])
+            return_value=MockVolumeGroupApi.VOL_DETAILS1)
+        self.mock_volume_listing(volume_group_module_mock, MockVolumeGroupApi.VOL_DETAILS2)
         volume_group_module_mock.provisioning.remove_members_from_volume_group = MagicMock(
             side_effect=MockApiException)
         volume_group_module_mock.perform_module_operation()
@@ -258,9 +292,8 @@ class TestPowerstoreVolumeGroup():
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.VG_DETAILS[0])
         volume_group_module_mock.provisioning.get_volume_by_name = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS1[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
-            return_value=MockVolumeGroupApi.VOL_DETAILS2[0])
+            return_value=MockVolumeGroupApi.VOL_DETAILS1)
+        self.mock_volume_listing(volume_group_module_mock, MockVolumeGroupApi.VOL_DETAILS2)
         volume_group_module_mock.provisioning.add_members_to_volume_group = MagicMock(
             side_effect=MockApiException)
         volume_group_module_mock.perform_module_operation()
@@ -295,10 +328,12 @@ class TestPowerstoreVolumeGroup():
             return_value=MockVolumeGroupApi.MODIFY_VG)
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.MODIFY_VG[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
+        volume_group_module_mock.provisioning.client.request = MagicMock(
             side_effect=MockApiException)
         volume_group_module_mock.perform_module_operation()
-        volume_group_module_mock.provisioning.get_volume_details.assert_called()
+        volume_group_module_mock.provisioning.client.request.assert_called()
+        assert 'Failed to get the volumes' in \
+            volume_group_module_mock.module.fail_json.call_args_list[0][1]['msg']
 
     def test_get_non_existing_volume_to_remove_volume_group_with_exception(self, volume_group_module_mock):
         self.get_module_args.update({
@@ -312,8 +347,7 @@ class TestPowerstoreVolumeGroup():
             return_value=MockVolumeGroupApi.MODIFY_VG)
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.MODIFY_VG[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
-            side_effect=MockApiException)
+        self.mock_volume_listing(volume_group_module_mock, [])
         volume_group_module_mock.perform_module_operation()
         assert MockVolumeGroupApi.get_non_existing_volume_failed_msg() in \
             volume_group_module_mock.module.fail_json.call_args[1]['msg']
@@ -331,8 +365,7 @@ class TestPowerstoreVolumeGroup():
             return_value=MockVolumeGroupApi.VG_DETAILS)
         volume_group_module_mock.get_volume_group_details = MagicMock(
             return_value=MockVolumeGroupApi.VG_DETAILS[0])
-        volume_group_module_mock.provisioning.get_volume_details = MagicMock(
-            side_effect=MockApiException)
+        self.mock_volume_listing(volume_group_module_mock, [])
         volume_group_module_mock.perform_module_operation()
         assert MockVolumeGroupApi.get_non_existing_volume_failed_msg() in \
             volume_group_module_mock.module.fail_json.call_args[1]['msg']